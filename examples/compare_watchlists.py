@@ -17,7 +17,7 @@ __title__ = "Watchlist Comparison"
 __description__ = (
     "Identify films from your watchlist that are also wanted by users you follow."
 )
-__version__ = "0.1.1"
+__version__ = "0.1.2"
 __author__ = "fastfingertips"
 __author_url__ = "https://github.com/fastfingertips"
 __created_at__ = "2025-12-24"
@@ -26,7 +26,6 @@ import argparse
 import os
 import sys
 import time
-from collections import Counter
 from datetime import datetime
 
 from fastfingertips.terminal_utils import get_input
@@ -50,6 +49,7 @@ from letterboxdpy.pages.user_watchlist import UserWatchlist
 from letterboxdpy.user import User
 from letterboxdpy.utils.utils_directory import Directory
 from letterboxdpy.utils.utils_file import JsonFile, build_path
+from letterboxdpy.watchlist_index import WatchlistIndex
 
 
 class WatchlistHtmlRenderer:
@@ -201,7 +201,8 @@ class WatchlistComparator:
         self.my_films = {}
         self.my_film_ids = set()
         self.following = []
-        self.film_popularity = Counter()
+        self.index = WatchlistIndex()
+        self.film_popularity = {}  # film id -> count, most wanted first
         self.film_users = {}
         self.user_total_counts = {}
         self.console = Console()
@@ -239,6 +240,7 @@ class WatchlistComparator:
             )
             self.my_films = data.get("data", {})
             self.my_film_ids = set(self.my_films.keys())
+            self.index.set_watchlist(self.username, self.my_film_ids)
 
         status_text = f"[bold green][OK][/bold green] Watchlist fetched: [white]{len(self.my_film_ids)}[/white] films"
         if cache_info:
@@ -291,6 +293,10 @@ class WatchlistComparator:
                 task, description="[bold green]All users processed[/bold green]"
             )
 
+        for film_id, count, users in self.index.top_shared(self.username):
+            self.film_popularity[film_id] = count
+            self.film_users[film_id] = users
+
     def _process_single_user(self, progress, task, user, index, total, idx_width):
         """Analyzes a single user's watchlist and prints the result with perfect alignment."""
         progress.update(
@@ -300,7 +306,6 @@ class WatchlistComparator:
         start_time = time.time()
 
         their_ids, cache_info = self._get_film_ids(user)
-        common = self.my_film_ids & their_ids
         duration = time.time() - start_time
 
         # 1. Prefix Column: [ 1/28] username (Fixed width: 2 + 1 + idx_width + 1 + idx_width + 2 + 20 + 1 = ~35 chars)
@@ -309,7 +314,8 @@ class WatchlistComparator:
 
         # 2. Stats Column: common/total (perc%) or private (Fixed width: 26 chars)
         if their_ids:
-            shared_count = len(common)
+            self.index.set_watchlist(user, their_ids)
+            shared_count = self.index.overlap(self.username, user)
             total_count = len(their_ids)
             self.user_total_counts[user] = total_count
             percentage = (shared_count / total_count) * 100 if total_count > 0 else 0
@@ -318,11 +324,7 @@ class WatchlistComparator:
             stats_str = (
                 f"{shared_count:>4}/{total_count:<5} common ({percentage:>5.1f}%)"
             )
-            stats_color = self.STYLE_SUCCESS if common else "dim"
-
-            for film_id in common:
-                self.film_popularity[film_id] += 1
-                self.film_users.setdefault(film_id, []).append(user)
+            stats_color = self.STYLE_SUCCESS if shared_count else "dim"
         else:
             # Align "private" exactly to the end of the 26-char column
             stats_str = "private".rjust(26)
@@ -363,7 +365,8 @@ class WatchlistComparator:
         table.add_column("Film Title", style=self.STYLE_SUCCESS)
         table.add_column("Wanted by")
 
-        for i, (film_id, count) in enumerate(self.film_popularity.most_common(20), 1):
+        top_films = list(self.film_popularity.items())[:20]
+        for i, (film_id, count) in enumerate(top_films, 1):
             users_list = self.film_users[film_id]
             users_display = ", ".join(users_list[:3])
             if len(users_list) > 3:
@@ -390,7 +393,7 @@ class WatchlistComparator:
             return
 
         # Prepare data
-        sorted_films = self.film_popularity.most_common()
+        sorted_films = list(self.film_popularity.items())
 
         result = {
             "generated_at": datetime.now().isoformat(),
@@ -16,7 +16,6 @@ from fastfingertips.terminal_utils import get_input
 from letterboxdpy import user
 from letterboxdpy.utils.utils_directory import check_and_create_dirs
 from letterboxdpy.utils.utils_file import JsonFile, build_click_url, build_path
-from letterboxdpy.utils.utils_string import strip_prefix
 
 # -- MAIN --
 
@@ -39,57 +38,39 @@ start_time = time.time()
 user_data_path = build_path(USER_FOLDER, "user")
 JsonFile.save(user_data_path, user_instance.jsonify())
 
-# Export data for each method
-# If you want to add a new method, add it here
-# With arg: [user.User.user_watchlist, {'filters': {'genre': ['action', '-drama']}}],
-methods = [
-    user.User.get_activity,
-    user.User.get_activity_following,
-    user.User.get_diary,
-    user.User.get_wrapped,
-    user.User.get_films,
-    [user.User.get_films_by_rating, {"rating": 5}],
-    user.User.get_films_not_rated,
-    user.User.get_genre_info,
-    user.User.get_liked_films,
-    user.User.get_liked_reviews,
-    user.User.get_lists,
-    user.User.get_following,
-    user.User.get_followers,
-    user.User.get_reviews,
-    user.User.get_user_tags,
-    user.User.get_watchlist_movies,
-    user.User.get_watchlist,
-]
-methods_str_length = len(str(len(methods)))
+# Export data for each collection
+# Collections are fetched concurrently and each file is written as soon as it
+# is ready; derived ones (wrapped, films by rating) reuse the crawled data.
+# If you want to add a new collection, add it to User.PREFETCH_COLLECTIONS
+collections = list(user.User.PREFETCH_COLLECTIONS)
+total_str_length = len(str(len(collections) + 1))
 
-print("\nExporting data...")
-for no, method in enumerate(methods, 1):
-    method_start_time = time.time()
-
-    args = {}
-    if isinstance(method, list):
-        method, args = method
-
-    method_name = method.__name__
-    method_name_without_prefix = strip_prefix(method_name)
 
+def save_collection(no: int, name: str, data: dict) -> None:
+    file_path = build_path(USER_FOLDER, name)
+    JsonFile.save(file_path, data)
     os.system(
-        f"title [{len(methods)}/{no:0>{methods_str_length}}] Exporting {method_name}..."
+        f"title [{len(collections) + 1}/{no:0>{total_str_length}}] Exported {name}"
     )
     print(
-        f'[{len(methods)}/{no:0>{methods_str_length}}]: Processing "{method_name}" method',
-        end=f" with args: {args}...\r" if args else "...\r",
+        f"{time.time() - start_time:<7.2f} seconds - {name:<22} - {build_click_url(file_path)}.json"
     )
 
-    data = method(user_instance, **args) if args else method(user_instance)
 
-    file_path = build_path(USER_FOLDER, method_name_without_prefix)
-    JsonFile.save(file_path, data)
-
-    print(
-        f"{time.time() - method_start_time:<7.2f} seconds - {method_name:<22} - {build_click_url(file_path)}.json"
-    )
+print("\nExporting data...")
+no = 0
+for no, (name, data, error) in enumerate(
+    user_instance.iter_prefetch(collections, max_workers=4), 1
+):
+    if error is not None:
+        print(
+            f"{time.time() - start_time:<7.2f} seconds - {name:<22} - failed: {error}"
+        )
+        continue
+    save_collection(no, name, data)
+
+# Read from the films crawled above, no extra requests
+save_collection(no + 1, "films_by_rating", user_instance.get_films_by_rating(5))
 
 os.system("title Completed!")
 print("\nProcessing complete!")
@@ -36,18 +36,23 @@ class LetterboxdStatisticsPlotter:
         print(f"Fetching statistics for @{self.username}...")
         print(f"Processing {year_count} year(s): {start_year}-{end_year}")
 
+        # One diary crawl covers every year of the range.
+        try:
+            wrapped_by_year = User(self.username).get_wrapped_range(
+                start_year, end_year
+            )
+        except Exception:
+            print("✗ Could not fetch the diary (using empty data)")
+            wrapped_by_year = {}
+
         for year in range(start_year, end_year + 1):
-            try:
-                print(f"Fetching data for {year}...", end=" ")
-                user = User(self.username)
-                stats = user.get_wrapped(year)
+            stats = wrapped_by_year.get(year)
+            if stats:
                 self.stats_by_year[year] = {
                     "monthly": stats.get("months"),
                     "daily": stats.get("days"),
                 }
-                print("✓")
-            except Exception:
-                print("✗ (using empty data)")
+            else:
                 self.stats_by_year[year] = {
                     "monthly": dict.fromkeys(range(1, 13), 0),  # 12 months with 0
                     "daily": dict.fromkeys(range(1, 8), 0),  # 7 days with 0
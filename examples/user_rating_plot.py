@@ -8,7 +8,6 @@ Recreates the ratings distribution section of a Letterboxd profile with a clean,
 """
 
 import argparse
-import contextlib
 import math
 
 import matplotlib.pyplot as plt
@@ -16,7 +15,7 @@ import numpy as np
 from fastfingertips.terminal_utils import get_input
 
 from letterboxdpy.constants.project import Colors
-from letterboxdpy.user import User
+from letterboxdpy.pages.user_profile import UserProfile
 
 
 class LetterboxdRatingPlotter:
@@ -172,17 +171,8 @@ class LetterboxdRatingPlotter:
         if not target_user:
             raise ValueError("Username must be provided")
 
-        # Initialize with 0
-        ratings = dict.fromkeys(np.arange(0.5, 5.5, 0.5), 0)
-
         print(f"Fetching ratings for @{target_user}...")
-        movies = User(target_user).get_films()["movies"]
-        print(f"Processing {len(movies)} rated movies...")
-
-        for movie in movies.values():
-            if rating := movie.get("rating"):
-                with contextlib.suppress(KeyError):
-                    ratings[float(rating)] += 1
+        ratings = UserProfile(target_user).get_rating_histogram()
 
         total_ratings = sum(ratings.values())
         print(f"Found {total_ratings} ratings. Creating plot...")
@@ -0,0 +1,270 @@
+"""
+Catalog sweep over the film discovery facets.
+
+Crawls many discovery pages (years, decades, genres, themes, nanogenres,
+services, ...) through one shared page budget, deduplicates films by id as
+each facet completes and records the facets every film appears in.
+Progress can be checkpointed to a JSON Lines journal and a sweep resumed
+from it: each completed or failed facet appends one record holding only
+the films it added, so a checkpoint costs the same however large the
+catalog grows.
+"""
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from letterboxdpy.constants.project import CURRENT_YEAR, DOMAIN, GENRES
+from letterboxdpy.films import Films
+from letterboxdpy.utils.utils_file import JsonLinesFile
+
+# Facet keys are "<kind>:<value>", e.g. "genre:horror" or "year:1999".
+FACET_URLS = {
+    "year": f"{DOMAIN}/films/ajax/popular/this/week/year/{{}}/",
+    "decade": f"{DOMAIN}/films/ajax/popular/this/week/decade/{{}}s/",
+    "genre": f"{DOMAIN}/films/ajax/genre/{{}}",
+    "theme": f"{DOMAIN}/films/ajax/theme/{{}}",
+    "mini-theme": f"{DOMAIN}/films/ajax/mini-theme/{{}}",
+    "nanogenre": f"{DOMAIN}/films/ajax/nanogenre/{{}}/",
+    "service": f"{DOMAIN}/films/popular/this/week/on/{{}}/",
+}
+
+FIRST_FILM_YEAR = 1874
+
+
+def facet_url(facet: str) -> str:
+    """Returns the discovery URL of a facet key."""
+    kind, _, value = facet.partition(":")
+    if kind not in FACET_URLS or not value:
+        raise ValueError(f"Invalid facet: {facet}")
+    return FACET_URLS[kind].format(value)
+
+
+def plan_facets(
+    years: Iterable[int] | None = None,
+    decades: Iterable[int] | None = None,
+    genres: Iterable[str] | None = None,
+    themes: Iterable[str] = (),
+    mini_themes: Iterable[str] = (),
+    nanogenres: Iterable[str] = (),
+    services: Iterable[str] = (),
+) -> list[str]:
+    """
+    Plans the facet keys of a sweep.
+
+    Years, decades and genres default to every value Letterboxd offers;
+    themes, nanogenres and services have no fixed list and must be given.
+    """
+    if years is None:
+        years = range(FIRST_FILM_YEAR, CURRENT_YEAR + 1)
+    if decades is None:
+        decades = range(FIRST_FILM_YEAR // 10 * 10, CURRENT_YEAR + 1, 10)
+    if genres is None:
+        genres = GENRES
+
+    plan = {
+        "year": years,
+        "decade": decades,
+        "genre": genres,
+        "theme": themes,
+        "mini-theme": mini_themes,
+        "nanogenre": nanogenres,
+        "service": services,
+    }
+    return [f"{kind}:{value}" for kind, values in plan.items() for value in values]
+
+
+class CatalogSweep:
+    """Crawls a set of facets into one deduplicated film catalog."""
+
+    def __init__(
+        self,
+        facets: Iterable[str],
+        checkpoint: str | None = None,
+        max_per_facet: int | None = None,
+        max_workers: int = 4,
+        checkpoint_every: int = 10,
+        max_pages: int | None = None,
+    ) -> None:
+        """
+        Args:
+            facets: Facet keys to crawl (see plan_facets).
+            checkpoint: JSON Lines journal to save progress to and resume from.
+            max_per_facet: Maximum number of films read from each facet.
+            max_workers: Pages fetched at the same time across the sweep. Facets
+                run in parallel and share the workers left over, so the last
+                facets of a sweep read several pages ahead.
+            checkpoint_every: Completed facets between two journal appends.
+            max_pages: Pages read by the whole sweep, None = no limit. Once
+                reached no further facet is started; the rest stay pending.
+        """
+        self.facets = list(dict.fromkeys(facets))
+        for facet in self.facets:
+            facet_url(facet)  # validate early
+
+        self.checkpoint = checkpoint
+        self.max_per_facet = max_per_facet
+        self.max_workers = max_workers
+        self.checkpoint_every = checkpoint_every
+        self.max_pages = max_pages
+        self.pages_read = 0
+
+        self.films: dict[str, dict] = {}
+        self.done: set[str] = set()
+        self.complete: set[str] = set()  # done and not cut by max_per_facet
+        self.failed: dict[str, str] = {}
+        self._journal: list[dict] = []  # records not appended yet
+
+        if checkpoint and JsonLinesFile.exists(checkpoint):
+            self.load(checkpoint)
+
+    @property
+    def pending(self) -> list[str]:
+        """Facets not crawled yet, in plan order."""
+        return [facet for facet in self.facets if facet not in self.done]
+
+    def run(self) -> dict:
+        """Crawls every pending facet and returns the catalog."""
+        for _ in self.iter_run():
+            pass
+        return self.films
+
+    def iter_run(self) -> Iterator[str]:
+        """Crawls the pending facets, yielding each facet key once merged."""
+        pending = list(reversed(self.pending))
+        completed = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+
+            def submit_next() -> None:
+                while pending and len(running) < self.max_workers:
+                    if self.max_pages is not None and self.pages_read >= self.max_pages:
+                        return
+                    facet = pending.pop()
+                    # Workers no other facet is left to use read pages ahead.
+                    workers = self.max_workers // min(
+                        self.max_workers, len(pending) + len(running) + 1
+                    )
+                    running[executor.submit(self._crawl, facet, workers)] = facet
+
+            try:
+                submit_next()
+                while running:
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        facet = running.pop(future)
+                        try:
+                            movies, pages = future.result()
+                        except Exception as e:
+                            self._record({"facet": facet, "error": str(e)})
+                            continue
+                        self.pages_read += pages
+                        self.merge(facet, movies)
+
+                        completed += 1
+                        if self.checkpoint and completed % self.checkpoint_every == 0:
+                            self.flush()
+                        yield facet
+                    submit_next()
+            finally:
+                # Also on an early break: keep what was merged so far.
+                for future in running:
+                    future.cancel()
+                if self.checkpoint:
+                    self.flush()
+
+    def _crawl(self, facet: str, max_workers: int) -> tuple[dict, int]:
+        films = Films(facet_url(facet), self.max_per_facet, max_workers)
+        return films.movies, films.pages_read
+
+    def merge(self, facet: str, movies: dict) -> None:
+        """Adds the films of a crawled facet to the catalog."""
+        new, known = {}, []
+        for movie_id, data in movies.items():
+            if movie_id in self.films:
+                known.append(movie_id)
+            else:
+                new[movie_id] = data
+        complete = self.max_per_facet is None or len(movies) < self.max_per_facet
+        self._record(
+            {"facet": facet, "films": new, "known": known, "complete": complete}
+        )
+
+    def _record(self, record: dict) -> None:
+        if self.checkpoint:
+            self._journal.append(record)
+        self._apply(record)
+
+    def _apply(self, record: dict) -> None:
+        facet = record["facet"]
+        if "error" in record:
+            self.failed[facet] = record["error"]
+            return
+        for movie_id, data in record["films"].items():
+            self.films[movie_id] = {**data, "facets": [facet]}
+        for movie_id in record["known"]:
+            self.films[movie_id]["facets"].append(facet)
+        self.done.add(facet)
+        if record.get("complete"):
+            self.complete.add(facet)
+        self.failed.pop(facet, None)
+
+    def flush(self) -> None:
+        """Appends the facets completed since the last flush to the journal."""
+        if self.checkpoint and self._journal:
+            JsonLinesFile.append(self.checkpoint, self._journal)
+        self._journal = []
+
+    def save(self, path: str) -> None:
+        """
+        Writes the whole progress as a compacted journal.
+
+        The file is written aside and renamed over `path`, so a crash leaves
+        either the old or the new journal.
+        """
+        temp = f"{path}.tmp"
+        JsonLinesFile.save(
+            temp,
+            [
+                {
+                    "films": self.films,
+                    "done": sorted(self.done),
+                    "complete": sorted(self.complete),
+                    "failed": self.failed,
+                }
+            ],
+        )
+        JsonLinesFile.replace(temp, path)
+        if path == self.checkpoint:
+            self._journal = []
+
+    def load(self, path: str) -> None:
+        """Restores the progress saved by `save` or appended by `flush`."""
+        try:
+            for record in JsonLinesFile.iter_load(path):
+                if "facet" in record:
+                    self._apply(record)
+                else:
+                    self.films = record["films"]
+                    self.done = set(record["done"])
+                    self.complete = set(record["complete"])
+                    self.failed = record["failed"]
+        except ValueError:
+            # A crash mid-append leaves a partial last line. Its facets are
+            # crawled again; compact the journal so new records follow
+            # valid JSON.
+            self.save(path)
+
+
+if __name__ == "__main__":
+    from fastfingertips.terminal_utils import setup_encoding
+
+    setup_encoding()
+
+    sweep = CatalogSweep(
+        plan_facets(years=[2024], decades=[], genres=["horror", "western"]),
+        checkpoint="catalog",
+        max_per_facet=100,
+    )
+    for facet in sweep.iter_run():
+        print(f"{facet:<20} {len(sweep.films)} films so far")
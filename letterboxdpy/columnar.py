@@ -0,0 +1,356 @@
+"""
+Columnar (Arrow) export of member collections.
+
+Films, diary, watchlist, reviews and followers/following are crawled page by
+page, buffered into Arrow record batches and streamed to a Parquet or Feather
+file, so a dataset spanning thousands of members never holds its rows as
+Python dicts. Slugs and usernames are dictionary-encoded against one growing
+dictionary per file, and Feather files are written uncompressed so that
+`read_columnar` can memory-map them without copying.
+
+Requires the optional pyarrow package: pip install letterboxdpy[arrow]
+"""
+
+from collections.abc import Iterable, Iterator
+from datetime import date as Date
+
+from letterboxdpy.constants.project import DOMAIN
+from letterboxdpy.pages.user_diary import iter_user_diary
+from letterboxdpy.pages.user_films import iter_user_films
+from letterboxdpy.pages.user_network import iter_network_pages
+from letterboxdpy.pages.user_reviews import iter_user_reviews
+from letterboxdpy.pages.user_watchlist import iter_watchlist
+from letterboxdpy.utils.interner import Interner
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional, see require_pyarrow
+    pa = pq = None
+
+FORMATS = {"parquet": ".parquet", "feather": ".feather"}
+
+# Columns of each collection as (name, type); "dictionary" columns are
+# dictionary-encoded strings. Every collection starts with the member it
+# was crawled from, so many members can share one file.
+COLLECTIONS: dict[str, tuple[tuple[str, str], ...]] = {
+    "films": (
+        ("owner", "dictionary"),
+        ("id", "string"),
+        ("slug", "dictionary"),
+        ("name", "string"),
+        ("year", "int16"),
+        ("rating", "float32"),
+        ("liked", "bool"),
+    ),
+    "diary": (
+        ("owner", "dictionary"),
+        ("log_id", "string"),
+        ("date", "date32"),
+        ("id", "string"),
+        ("slug", "dictionary"),
+        ("name", "string"),
+        ("release", "int16"),
+        ("runtime", "int32"),
+        ("rating", "float32"),
+        ("liked", "bool"),
+        ("rewatched", "bool"),
+        ("reviewed", "bool"),
+    ),
+    "watchlist": (
+        ("owner", "dictionary"),
+        ("id", "string"),
+        ("slug", "dictionary"),
+        ("name", "string"),
+        ("year", "int16"),
+        ("page", "int32"),
+    ),
+    "reviews": (
+        ("owner", "dictionary"),
+        ("log_id", "string"),
+        ("date", "date32"),
+        ("id", "string"),
+        ("slug", "dictionary"),
+        ("name", "string"),
+        ("release", "int16"),
+        ("type", "dictionary"),
+        ("no", "int32"),
+        ("rating", "float32"),
+        ("review", "string"),
+        ("spoiler", "bool"),
+    ),
+    "followers": (
+        ("owner", "dictionary"),
+        ("username", "dictionary"),
+        ("name", "string"),
+        ("followers", "int32"),
+        ("following", "int32"),
+        ("watched", "int32"),
+        ("lists", "int32"),
+        ("likes", "int32"),
+    ),
+}
+COLLECTIONS["following"] = COLLECTIONS["followers"]
+
+
+def require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "Columnar export requires the 'pyarrow' package: "
+            "pip install letterboxdpy[arrow]"
+        )
+
+
+def schema(collection: str) -> "pa.Schema":
+    """The Arrow schema of a collection, see COLLECTIONS."""
+    require_pyarrow()
+    if collection not in COLLECTIONS:
+        raise ValueError(
+            f"Unsupported collection '{collection}'. Use one of {tuple(COLLECTIONS)}."
+        )
+    types = {
+        "dictionary": pa.dictionary(pa.int32(), pa.string()),
+        "string": pa.string(),
+        "int16": pa.int16(),
+        "int32": pa.int32(),
+        "float32": pa.float32(),
+        "bool": pa.bool_(),
+        "date32": pa.date32(),
+    }
+    return pa.schema([(name, types[type_]) for name, type_ in COLLECTIONS[collection]])
+
+
+def _to_date(value: str | None) -> Date | None:
+    # Diary and review dates are ISO strings ('2024-01-01T00:00:00.000000Z').
+    return Date.fromisoformat(value[:10]) if value else None
+
+
+def iter_rows(
+    username: str, collection: str, max_workers: int | None = None
+) -> Iterator[list[tuple]]:
+    """
+    Crawls a collection of a member and yields the rows of each page as
+    tuples in the column order of COLLECTIONS.
+
+    Args:
+        max_workers: Threads for the diary's runtime lookups. None = no lookups.
+    """
+    if collection == "films":
+        for _, films in iter_user_films(f"{DOMAIN}/{username}/films", False):
+            yield [
+                (username, f.id, f.slug, f.name, f.year, f.rating, f.liked)
+                for f in films.values()
+            ]
+    elif collection == "diary":
+        pages = iter_user_diary(
+            username,
+            fetch_runtime=bool(max_workers),
+            max_workers=max_workers,
+            as_dicts=False,
+        )
+        for _, entries in pages:
+            yield [
+                (
+                    username,
+                    log_id,
+                    _to_date(e.date),
+                    e.id,
+                    e.slug,
+                    e.name,
+                    e.release,
+                    e.runtime,
+                    e.rating,
+                    e.liked,
+                    e.rewatched,
+                    e.reviewed,
+                )
+                for log_id, e in entries.items()
+            ]
+    elif collection == "watchlist":
+        for page, films in iter_watchlist(username, as_dicts=False):
+            yield [
+                (username, f.id, f.slug, f.name, f.year, page) for f in films.values()
+            ]
+    elif collection == "reviews":
+        for _, reviews in iter_user_reviews(f"{DOMAIN}/{username}/films/reviews"):
+            yield [
+                (
+                    username,
+                    log_id,
+                    _to_date(r["date"]),
+                    r["movie"]["id"],
+                    r["movie"]["slug"],
+                    r["movie"]["name"],
+                    r["movie"]["release"],
+                    r["type"],
+                    r["no"],
+                    r["rating"],
+                    r["review"]["content"],
+                    r["review"]["spoiler"],
+                )
+                for log_id, r in reviews.items()
+            ]
+    elif collection in ("followers", "following"):
+        for members in iter_network_pages(username, collection, as_dicts=False):
+            yield [
+                (
+                    username,
+                    m.username,
+                    m.name,
+                    m.followers,
+                    m.following,
+                    m.watched,
+                    m.lists,
+                    m.likes,
+                )
+                for m in members
+            ]
+    else:
+        raise ValueError(
+            f"Unsupported collection '{collection}'. Use one of {tuple(COLLECTIONS)}."
+        )
+
+
+class ColumnarWriter:
+    """
+    Streams the rows of one collection into a Parquet or Feather file.
+
+    Rows are buffered until `batch_size` of them are pending and then
+    written as one record batch. The dictionary of each dictionary column
+    only grows, so Feather files carry dictionary deltas instead of a new
+    dictionary per batch.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        collection: str,
+        format: str = "parquet",
+        batch_size: int = 64 * 1024,
+    ) -> None:
+        if format not in FORMATS:
+            raise ValueError(
+                f"Unsupported format '{format}'. Use one of {tuple(FORMATS)}."
+            )
+        self.schema = schema(collection)
+        self.collection = collection
+        self.format = format
+        self.batch_size = batch_size
+        self.path = path if path.endswith(FORMATS[format]) else path + FORMATS[format]
+        self.rows = 0
+        self._pending: list[tuple] = []
+        self._dictionaries = {
+            field.name: [Interner(), None]
+            for field in self.schema
+            if pa.types.is_dictionary(field.type)
+        }
+        if format == "parquet":
+            self._writer = pq.ParquetWriter(self.path, self.schema)
+        else:
+            self._sink = pa.OSFile(self.path, "wb")
+            self._writer = pa.ipc.new_file(
+                self._sink,
+                self.schema,
+                options=pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True),
+            )
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def add(self, rows: Iterable[tuple]) -> None:
+        """Adds rows in the column order of COLLECTIONS."""
+        self._pending.extend(rows)
+        while len(self._pending) >= self.batch_size:
+            rows, self._pending = (
+                self._pending[: self.batch_size],
+                self._pending[self.batch_size :],
+            )
+            self._write_batch(rows)
+
+    def add_member(self, username: str, max_workers: int | None = None) -> int:
+        """Crawls the collection of one member into the file. Returns its row count."""
+        count = 0
+        for rows in iter_rows(username, self.collection, max_workers):
+            self.add(rows)
+            count += len(rows)
+        return count
+
+    def flush(self) -> None:
+        if self._pending:
+            rows, self._pending = self._pending, []
+            self._write_batch(rows)
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+        if self.format == "feather":
+            self._sink.close()
+
+    def _write_batch(self, rows: list[tuple]) -> None:
+        columns = [
+            self._column(field, values)
+            for field, values in zip(self.schema, zip(*rows, strict=True), strict=True)
+        ]
+        self._writer.write_batch(pa.record_batch(columns, schema=self.schema))
+        self.rows += len(rows)
+
+    def _column(self, field, values: tuple):
+        if field.name not in self._dictionaries:
+            return pa.array(values, field.type)
+        entry = self._dictionaries[field.name]
+        names = entry[0]
+        indices = pa.array(
+            [None if value is None else names.intern(value) for value in values],
+            pa.int32(),
+        )
+        # Rebuilt only when new values were interned since the last batch.
+        if entry[1] is None or len(entry[1]) != len(names):
+            entry[1] = pa.array(list(names), pa.string())
+        return pa.DictionaryArray.from_arrays(indices, entry[1])
+
+
+def export_columnar(
+    usernames: Iterable[str],
+    collection: str,
+    path: str,
+    format: str = "parquet",
+    max_workers: int | None = None,
+) -> int:
+    """
+    Crawls a collection for every member into one file.
+
+    Returns:
+        int: The number of rows written.
+    """
+    with ColumnarWriter(path, collection, format) as writer:
+        for username in usernames:
+            writer.add_member(username, max_workers)
+    return writer.rows
+
+
+def read_columnar(path: str, columns: list[str] | None = None) -> "pa.Table":
+    """
+    Reads a file written by ColumnarWriter.
+
+    Feather files are memory-mapped and the table's buffers point into the
+    mapping (zero-copy); Parquet files are memory-mapped and decoded.
+    """
+    require_pyarrow()
+    if path.endswith(FORMATS["feather"]):
+        table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+        return table.select(columns) if columns else table
+    return pq.read_table(path, columns=columns, memory_map=True)
+
+
+if __name__ == "__main__":
+    from fastfingertips.terminal_utils import setup_encoding
+
+    setup_encoding()
+
+    rows = export_columnar(["nmcassa"], "diary", "nmcassa_diary", "feather")
+    table = read_columnar("nmcassa_diary.feather")
+    print(f"{rows} diary entries")
+    print(table.group_by("rating").aggregate([("log_id", "count")]))
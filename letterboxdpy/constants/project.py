@@ -57,7 +57,8 @@ REMEMBER_ME = "true"
 DOMAIN_MATCHES = [f"{DOMAIN_FULL}/", f"{DOMAIN_SHORT}/"]
 
 # Movie-Related Constants
-VALID_RATINGS = {0.5, 1, 1.5, 2, 2.5, 3, 3.5, 4, 4.5, 5}
+RATINGS = (0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0)  # ascending
+VALID_RATINGS = set(RATINGS)
 GENRES = [
     "action",
     "adventure",
@@ -0,0 +1,110 @@
+"""
+Bounded concurrent mapping for bulk scraping.
+
+Used when many independent pages (lists, profiles, ...) are loaded at once:
+at most `max_workers` calls run at a time and results stream back in input
+order as soon as each one is ready. `run_graph` does the same for tasks that
+depend on each other's results.
+"""
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_ordered(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int | None = None
+) -> Iterator[R]:
+    """
+    Yields func(item) for each item, in order.
+
+    Args:
+        func: Function applied to each item.
+        items: Items to process. Consumed lazily, so it can be a generator.
+        max_workers: Calls run in parallel. None = sequential.
+
+    Note:
+        Stopping the iteration early cancels the calls not started yet.
+    """
+    if not max_workers or max_workers <= 1:
+        yield from map(func, items)
+        return
+
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending: deque[Future] = deque(
+        executor.submit(func, item) for item in islice(items, max_workers)
+    )
+    try:
+        while pending:
+            result = pending.popleft().result()
+            for item in islice(items, 1):
+                pending.append(executor.submit(func, item))
+            yield result
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_graph(
+    tasks: dict[str, Callable[[], R]],
+    dependencies: dict[str, Iterable[str]],
+    max_workers: int | None = None,
+) -> Iterator[tuple[str, R | None, Exception | None]]:
+    """
+    Runs tasks that depend on each other, each as soon as its dependencies
+    have finished.
+
+    Args:
+        tasks: Callables by name.
+        dependencies: Names each task waits for. Missing names have none.
+        max_workers: Tasks run in parallel. None = sequential.
+
+    Yields:
+        tuple: (name, result, error) as each task finishes. A task whose
+        dependency failed is not run and yields that dependency's error.
+    """
+    waiting = {name: set(dependencies.get(name, ())) & tasks.keys() for name in tasks}
+    dependents: dict[str, list[str]] = {}
+    for name, needs in waiting.items():
+        for need in needs:
+            dependents.setdefault(need, []).append(name)
+
+    def ready() -> list[str]:
+        names = [name for name, needs in waiting.items() if not needs]
+        for name in names:
+            del waiting[name]
+        return names
+
+    def settle(name: str, result, error: Exception | None) -> list[tuple]:
+        settled = [(name, result, error)]
+        for dependent in dependents.get(name, ()):
+            if error is None:
+                waiting[dependent].discard(name)
+            elif waiting.pop(dependent, None) is not None:
+                settled.extend(settle(dependent, None, error))
+        return settled
+
+    executor = ThreadPoolExecutor(max_workers=max_workers or 1)
+    running: dict[Future, str] = {}
+    try:
+        while True:
+            for name in ready():
+                running[executor.submit(tasks[name])] = name
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                result = None if error else future.result()
+                yield from settle(running.pop(future), result, error)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if waiting:
+        raise ValueError(f"Circular dependencies between {sorted(waiting)}")
@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+from datetime import date
 from enum import Enum
 from json import JSONEncoder
 
@@ -14,6 +16,8 @@ class Encoder(JSONEncoder):
     def default(self, o):
         if isinstance(o, Enum):
             return o.value
+        if isinstance(o, date):
+            return o.isoformat()
 
         try:
             return o.__dict__
@@ -43,6 +47,8 @@ class SecretsEncoder(JSONEncoder):
         """Encodes the object to JSON format excluding specified attributes."""
         if isinstance(o, Enum):
             return o.value
+        if isinstance(o, date):
+            return o.isoformat()
 
         try:
             return {k: v for k, v in o.__dict__.items() if k not in self.secrets}
@@ -50,3 +56,53 @@ class SecretsEncoder(JSONEncoder):
             return super().default(o)
         except Exception as e:
             raise CustomEncoderError(f"An error occurred during encoding: {e}") from e
+
+
+def to_dict(obj, secrets: Iterable[str] = (), json_keys: bool = False) -> dict:
+    """
+    Structural dict of an object's attributes, without encoding to JSON.
+
+    Produces the same structure SecretsEncoder writes: attributes in
+    `secrets` are left out (also in nested objects), enums become their
+    values and tuples become lists. Nested objects with a `to_dict` method
+    are converted with it. With `json_keys`, dict keys are also turned into
+    the strings JSON gives them (e.g. 4.5 -> "4.5", True -> "true").
+    """
+    secrets = frozenset(secrets)
+    return {
+        key: _to_plain(value, secrets, json_keys)
+        for key, value in vars(obj).items()
+        if key not in secrets
+    }
+
+
+def _to_plain(value, secrets: frozenset, json_keys: bool = False):
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    if isinstance(value, dict):
+        return {
+            _json_key(key) if json_keys else key: _to_plain(item, secrets, json_keys)
+            for key, item in value.items()
+        }
+    if isinstance(value, list | tuple):
+        return [_to_plain(item, secrets, json_keys) for item in value]
+    if isinstance(value, Enum):
+        return value.value
+    if callable(getattr(value, "to_dict", None)):
+        data = value.to_dict()
+        return _to_plain(data, secrets, json_keys) if json_keys else data
+    if hasattr(value, "__dict__"):
+        return to_dict(value, secrets, json_keys)
+    return value
+
+
+def _json_key(key) -> str:
+    if isinstance(key, str):
+        return key
+    if key is None:
+        return "null"
+    if isinstance(key, bool):
+        return "true" if key else "false"
+    if isinstance(key, float):
+        return float.__repr__(key)
+    return str(key)
@@ -1,4 +1,10 @@
-from dataclasses import dataclass, field
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+
+from letterboxdpy.avatar import Avatar
+from letterboxdpy.constants.project import DOMAIN
+
+NO_AVATAR = {"exists": False, "upscaled": False, "url": ""}
 
 
 @dataclass
@@ -64,3 +70,161 @@ class MovieJSON:
             watchlist_action=data.get("watchlistAction", ""),
             directors=directors,
         )
+
+    def to_dict(self) -> dict:
+        """Returns the fields as a dictionary, directors included."""
+        return asdict(self)
+
+
+class Record(ABC):
+    """
+    Base of the slotted entry records returned with `as_dicts=False`.
+
+    Records read like the dicts they replace (`record["rating"]`), so code
+    written against the dict output keeps working; `to_dict()` gives the
+    exact dict output back.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    @abstractmethod
+    def to_dict(self) -> dict:
+        """The dict this record stands for."""
+
+
+@dataclass(slots=True)
+class FilmRef(Record):
+    """A film on a poster grid, as in extract_movie_info."""
+
+    id: str
+    slug: str | None
+    name: str
+    year: int | None
+
+    @property
+    def url(self) -> str:
+        return f"{DOMAIN}/film/{self.slug}/"
+
+    def to_dict(self) -> dict:
+        return {
+            "slug": self.slug,
+            "name": self.name,
+            "year": self.year,
+            "url": self.url,
+        }
+
+
+@dataclass(slots=True)
+class WatchedFilm(FilmRef):
+    """A film on a member's films page, with their rating and like."""
+
+    rating: float | None
+    liked: bool
+
+    def to_dict(self) -> dict:
+        return {
+            "slug": self.slug,
+            "name": self.name,
+            "year": self.year,
+            "url": self.url,
+            "id": self.id,
+            "rating": self.rating,
+            "liked": self.liked,
+        }
+
+
+@dataclass(slots=True)
+class DiaryEntry(Record):
+    """
+    A diary entry with the 'actions' and 'page' dicts flattened into fields.
+
+    `page_url` is the same string object for every entry of a page.
+    """
+
+    name: str
+    slug: str | None
+    id: str | None
+    release: int | None
+    runtime: int | None
+    rewatched: bool
+    rating: float | None
+    liked: bool
+    reviewed: bool
+    date: str | None
+    page_url: str
+    page_no: int
+
+    @property
+    def url(self) -> str:
+        return f"{DOMAIN}/film/{self.slug}/"
+
+    @property
+    def actions(self) -> dict:
+        return {
+            "rewatched": self.rewatched,
+            "rating": self.rating,
+            "liked": self.liked,
+            "reviewed": self.reviewed,
+        }
+
+    @property
+    def page(self) -> dict:
+        return {"url": self.page_url, "no": self.page_no}
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "slug": self.slug,
+            "id": self.id,
+            "release": self.release,
+            "runtime": self.runtime,
+            "actions": self.actions,
+            "date": self.date,
+            "page": self.page,
+        }
+
+
+@dataclass(slots=True)
+class Member(Record):
+    """A row of a member table; the avatar is upscaled only when read."""
+
+    username: str
+    name: str
+    avatar_url: str
+    followers: int | None
+    following: int | None
+    watched: int | None
+    lists: int | None
+    likes: int | None
+
+    @property
+    def url(self) -> str:
+        return f"{DOMAIN}/{self.username}"
+
+    @property
+    def avatar(self) -> dict:
+        if not self.avatar_url:
+            return NO_AVATAR.copy()
+        return Avatar(self.avatar_url).upscaled_data
+
+    def to_dict(self) -> dict:
+        return {
+            "username": self.username,
+            "name": self.name,
+            "url": self.url,
+            "avatar": self.avatar,
+            "followers": self.followers,
+            "following": self.following,
+            "watched": self.watched,
+            "lists": self.lists,
+            "likes": self.likes,
+        }
@@ -0,0 +1,155 @@
+"""
+Paginated fetching for Letterboxd listing pages.
+
+Letterboxd paginates almost every collection as /page/N/. This module streams
+those pages in order, optionally prefetching the next ones on a thread pool so
+that parsing of one page overlaps with the download of the following pages.
+"""
+
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from bs4 import BeautifulSoup
+
+from letterboxdpy.core.exceptions import ResourceNotFoundError
+from letterboxdpy.core.scraper import parse_url
+from letterboxdpy.utils.utils_url import get_page_url
+
+
+def pages_needed(max_items: int | None, items_per_page: int) -> int | None:
+    """Number of pages required to collect `max_items` items, None if unbounded."""
+    if not max_items:
+        return None
+    return -(-max_items // items_per_page)
+
+
+def find_last_page(dom) -> int | None:
+    """Returns the last page number from the pagination marker, None if absent."""
+    marker = dom.find("div", class_="paginate-pages")
+    if marker is None:
+        return None
+    numbers = [
+        int(text)
+        for li in marker.find_all("li")
+        if (text := li.get_text(strip=True).replace(",", "")).isdigit()
+    ]
+    return max(numbers, default=1)
+
+
+def iter_pages(
+    base_url: str,
+    start: int = 1,
+    last_page: int | None = None,
+    max_workers: int | None = None,
+    params: str = "",
+    allow_missing_start: bool = False,
+    fetch: Callable[[str], BeautifulSoup | str] | None = None,
+) -> Iterator[tuple[int, BeautifulSoup | str]]:
+    """
+    Yields (page_no, dom) for each page of a paginated URL, in page order.
+
+    The caller decides when the collection ends (e.g. a short page) and simply
+    stops iterating; pages still in flight are cancelled.
+
+    Args:
+        base_url: URL without the /page/N/ suffix.
+        start: First page number to fetch.
+        last_page: Last page number to fetch. None = until the caller stops.
+        max_workers: Number of pages fetched ahead in parallel. None = sequential.
+        params: Optional query string appended to each page URL.
+        allow_missing_start: Treat a 404 on `start` as the end too, for
+            callers that already read the pages before it.
+        fetch: Reads one page URL. None = parse_url; fetch_text yields the
+            raw HTML instead of a dom.
+
+    Note:
+        A 404 on any page after `start` is treated as the end of the collection.
+        With `max_workers` and an unknown `last_page`, up to `max_workers - 1`
+        pages past the end may be requested before the caller stops.
+    """
+    fetch = fetch or parse_url
+    if not max_workers or max_workers <= 1:
+        page = start
+        while last_page is None or page <= last_page:
+            try:
+                dom = fetch(get_page_url(base_url, page, params))
+            except ResourceNotFoundError:
+                if page == start and not allow_missing_start:
+                    raise
+                return
+            yield page, dom
+            page += 1
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending: deque[tuple[int, Future]] = deque()
+    next_page = start
+
+    def fill_window() -> None:
+        nonlocal next_page
+        while len(pending) < max_workers and (
+            last_page is None or next_page <= last_page
+        ):
+            url = get_page_url(base_url, next_page, params)
+            pending.append((next_page, executor.submit(fetch, url)))
+            next_page += 1
+
+    try:
+        fill_window()
+        while pending:
+            page, future = pending.popleft()
+            try:
+                dom = future.result()
+            except ResourceNotFoundError:
+                if page == start and not allow_missing_start:
+                    raise
+                return
+            yield page, dom
+            # Refill only once the caller asks for more, so stopping on a
+            # short page leaves at most max_workers - 1 pages past the end.
+            fill_window()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_all_pages(
+    base_url: str,
+    last_page: int | None = None,
+    max_workers: int | None = None,
+    first_dom: BeautifulSoup | None = None,
+    open_ended: bool = False,
+) -> Iterator[tuple[int, BeautifulSoup]]:
+    """
+    Yields (page_no, dom) for every page of a collection whose pages carry
+    the pagination marker (div.paginate-pages).
+
+    The first page is read on its own to learn the last page number; the
+    remaining pages are then fetched ahead with `max_workers` threads.
+
+    Args:
+        base_url: URL without the /page/N/ suffix.
+        last_page: Upper bound on the pages to fetch (e.g. from a `max`).
+        max_workers: Number of pages fetched ahead in parallel. None = sequential.
+        first_dom: Already parsed first page, saves one request when given.
+        open_ended: Without a marker, keep fetching until the caller stops
+            (e.g. on a short page) instead of assuming a single page.
+    """
+    if first_dom is None:
+        first_dom = parse_url(get_page_url(base_url, 1))
+    yield 1, first_dom
+
+    site_last_page = find_last_page(first_dom)
+    if site_last_page is None and not open_ended:
+        site_last_page = 1
+    last_page = min(filter(None, [last_page, site_last_page]), default=None)
+
+    if last_page is None or last_page > 1:
+        # Page 1 was there, so a missing page 2 only means one full page.
+        yield from iter_pages(
+            base_url,
+            start=2,
+            last_page=last_page,
+            max_workers=max_workers,
+            allow_missing_start=True,
+        )
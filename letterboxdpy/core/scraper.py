@@ -1,4 +1,5 @@
 import random
+import threading
 import time
 from typing import ClassVar
 from urllib.parse import quote
@@ -50,6 +51,11 @@ class Scraper:
     }
     builder = "lxml"
     timeout = (10, 30)  # (connect, read) in seconds; set None to disable
+    max_connections = 8  # requests in flight at once, shared by all threads
+    _connections = threading.BoundedSemaphore(max_connections)
+    max_rate: float | None = None  # requests started per second, all threads
+    _rate_lock = threading.Lock()
+    _next_request = 0.0  # monotonic time the next request may start
 
     def __init__(self, domain: str = headers["referer"], user_agent: str | None = None):
         """Initialize the scraper with the specified domain and user-agent."""
@@ -70,6 +76,14 @@ class Scraper:
         """Sets the singleton session instance."""
         cls._session = session
 
+    @classmethod
+    def set_max_connections(cls, limit: int) -> None:
+        """Sets how many requests may be in flight at once across all threads."""
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        cls.max_connections = limit
+        cls._connections = threading.BoundedSemaphore(limit)
+
     @classmethod
     def get_page(cls, url: str) -> BeautifulSoup:
         """Fetch, check, and parse the HTML content from the specified URL."""
@@ -77,6 +91,32 @@ class Scraper:
         cls._check_for_errors(url, response)
         return cls._parse_html(response)
 
+    @classmethod
+    def get_text(cls, url: str) -> str:
+        """Fetch and check the specified URL, returning the raw HTML unparsed."""
+        response = cls._fetch(url)
+        cls._check_for_errors(url, response)
+        return response.text
+
+    @classmethod
+    def set_rate_limit(cls, per_second: float | None) -> None:
+        """Sets how many requests may start per second across all threads."""
+        if per_second is not None and per_second <= 0:
+            raise ValueError("per_second must be positive")
+        cls.max_rate = per_second
+
+    @classmethod
+    def _throttle(cls) -> None:
+        """Waits until the rate limit lets another request start."""
+        if not cls.max_rate:
+            return
+        with cls._rate_lock:
+            now = time.monotonic()
+            start = max(now, cls._next_request)
+            cls._next_request = start + 1 / cls.max_rate
+        if start > now:
+            time.sleep(start - now)
+
     @classmethod
     def _fetch(cls, url: str) -> requests.Response:
         """Fetch the HTML content from the specified URL using a session with robust retry logic."""
@@ -93,12 +133,14 @@ class Scraper:
                     cls.timeout[1] + attempt * 5,
                 )
 
-                response = session.get(
-                    url,
-                    headers=cls.headers,
-                    timeout=current_timeout,
-                    impersonate="chrome",
-                )
+                with cls._connections:
+                    cls._throttle()
+                    response = session.get(
+                        url,
+                        headers=cls.headers,
+                        timeout=current_timeout,
+                        impersonate="chrome",
+                    )
 
                 # Success
                 if response.status_code == 200:
@@ -226,6 +268,11 @@ def parse_url(url: str) -> BeautifulSoup:
     return Scraper.get_page(url)
 
 
+def fetch_text(url: str) -> str:
+    """Fetch the raw HTML of the specified URL, for callers that read only a fragment."""
+    return Scraper.get_text(url)
+
+
 def url_encode(query: str, safe: str = "") -> str:
     """URL encode the given query."""
     return quote(query, safe=safe)
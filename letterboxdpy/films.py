@@ -1,11 +1,12 @@
+from collections.abc import Iterator
+
 from letterboxdpy.core.decorators import assert_instance
-from letterboxdpy.core.scraper import parse_url
+from letterboxdpy.core.pagination import iter_all_pages, pages_needed
 from letterboxdpy.utils.movies_extractor import (
     extract_movies_from_horizontal_list,
     extract_movies_from_vertical_list,
 )
 from letterboxdpy.utils.utils_transform import get_ajax_url
-from letterboxdpy.utils.utils_url import get_page_url
 
 
 class Films:
@@ -14,11 +15,15 @@ class Films:
     VERTICAL_MAX = 20 * 5
     HORIZONTAL_MAX = 12 * 6
 
-    def __init__(self, url: str, max: int | None = None):
+    def __init__(
+        self, url: str, max: int | None = None, max_workers: int | None = None
+    ):
         """Initialize Films class with a URL."""
         self.url = url
         self.max = max
+        self.max_workers = max_workers
         self.ajax_url = get_ajax_url(url)
+        self.pages_read = 0
         self._movies = None
 
     @property
@@ -42,92 +47,119 @@ class Films:
 
     def get_movies(self) -> dict:
         """Scrape and return a dictionary of movies from Letterboxd."""
-        page = 1
-        movies = {}
-
-        while True:
-            page_url = get_page_url(self.ajax_url, page)
-            dom = parse_url(page_url)
-
-            if ".com/films/" in self.url:
-                # https://letterboxd.com/films/popular/
-                # https://letterboxd.com/films/like/v-for-vendetta/
-                new_movies = extract_movies_from_horizontal_list(dom)
-                movies |= new_movies
-                if len(new_movies) < self.HORIZONTAL_MAX:
-                    break
-            elif ".com/film/" in self.url:
-                # https://letterboxd.com/film/the-shawshank-redemption/similar/
-                new_movies = extract_movies_from_vertical_list(dom)
-                movies |= new_movies
-                if len(new_movies) < self.VERTICAL_MAX:
-                    break
-
-            if self.max and len(movies) >= self.max:
-                break
-
-            page += 1
-
-        if self.max:
-            movies = dict(list(movies.items())[: self.max])
-
-        return movies
-
-
-def get_upcoming_movies(max: int | None = None) -> dict:
+        return dict(self.iter_movies())
+
+    def iter_movies(self) -> Iterator[tuple[str, dict]]:
+        """
+        Stream (movie_id, data) pairs from Letterboxd.
+
+        The first page tells how far the pagination goes. With `max` set only
+        the pages needed to reach it are requested; the remaining pages are
+        fetched ahead with `max_workers` threads (None = sequential).
+        """
+        if ".com/films/" in self.url:
+            # https://letterboxd.com/films/popular/
+            # https://letterboxd.com/films/like/v-for-vendetta/
+            extract, per_page = extract_movies_from_horizontal_list, self.HORIZONTAL_MAX
+        elif ".com/film/" in self.url:
+            # https://letterboxd.com/film/the-shawshank-redemption/similar/
+            extract, per_page = extract_movies_from_vertical_list, self.VERTICAL_MAX
+        else:
+            raise ValueError(f"Unsupported films URL: {self.url}")
+
+        # Without a pagination marker the end is found by the first short page.
+        pages = iter_all_pages(
+            self.ajax_url,
+            pages_needed(self.max, per_page),
+            self.max_workers,
+            open_ended=True,
+        )
+
+        seen = set()
+        for _, dom in pages:
+            self.pages_read += 1
+            new_movies = extract(dom)
+            for movie_id, data in new_movies.items():
+                if movie_id in seen:
+                    continue
+                seen.add(movie_id)
+                yield movie_id, data
+
+                if self.max and len(seen) >= self.max:
+                    return
+
+            if len(new_movies) < per_page:
+                return
+
+
+def get_upcoming_movies(max: int | None = None, max_workers: int | None = None) -> dict:
     BASE_URL = "https://letterboxd.com/films/popular/this/week/upcoming/"
-    return Films(BASE_URL, max).movies
+    return Films(BASE_URL, max, max_workers).movies
 
 
 @assert_instance(int)
-def get_movies_by_decade(decade: int, max: int | None = None) -> dict:
+def get_movies_by_decade(
+    decade: int, max: int | None = None, max_workers: int | None = None
+) -> dict:
     BASE_URL = f"https://letterboxd.com/films/ajax/popular/this/week/decade/{decade}s/"
-    return Films(BASE_URL, max).movies
+    return Films(BASE_URL, max, max_workers).movies
 
 
 @assert_instance(int)
-def get_movies_by_year(year: int, max: int | None = None) -> dict:
+def get_movies_by_year(
+    year: int, max: int | None = None, max_workers: int | None = None
+) -> dict:
     BASE_URL = f"https://letterboxd.com/films/ajax/popular/this/week/year/{year}/"
-    return Films(BASE_URL, max).movies
+    return Films(BASE_URL, max, max_workers).movies
 
 
 @assert_instance(str)
-def get_movies_by_genre(genre: str, max: int | None = None) -> dict:
+def get_movies_by_genre(
+    genre: str, max: int | None = None, max_workers: int | None = None
+) -> dict:
     """
     action, adventure, animation, comedy, crime, documentary,
     drama, family, fantasy, history, horror, music, mystery,
     romance, science-fiction, thriller, tv-movie, war, western
     """
     BASE_URL = f"https://letterboxd.com/films/ajax/genre/{genre}"
-    return Films(BASE_URL, max).movies
+    return Films(BASE_URL, max, max_workers).movies
 
 
 @assert_instance(str)
-def get_movies_by_service(service: str, max: int | None = None) -> dict:
+def get_movies_by_service(
+    service: str, max: int | None = None, max_workers: int | None = None
+) -> dict:
     """
     netflix, hulu, prime-video, disney-plus, itv-play, apple-tv,
     youtube-premium, amazon-prime-video, hbo-max, peacock, ...
     """
     BASE_URL = f"https://letterboxd.com/films/popular/this/week/on/{service}/"
-    return Films(BASE_URL, max).movies
+    return Films(BASE_URL, max, max_workers).movies
 
 
 @assert_instance(str)
-def get_movies_by_theme(theme: str, max: int | None = None) -> dict:
+def get_movies_by_theme(
+    theme: str, max: int | None = None, max_workers: int | None = None
+) -> dict:
     BASE_URL = f"https://letterboxd.com/films/ajax/theme/{theme}"
-    return Films(BASE_URL, max).movies
+    return Films(BASE_URL, max, max_workers).movies
 
 
 @assert_instance(str)
-def get_movies_by_nanogenre(nanogenre: str, max: int | None = None) -> dict:
+def get_movies_by_nanogenre(
+    nanogenre: str, max: int | None = None, max_workers: int | None = None
+) -> dict:
     BASE_URL = f"https://letterboxd.com/films/ajax/nanogenre/{nanogenre}/"
-    return Films(BASE_URL, max).movies
+    return Films(BASE_URL, max, max_workers).movies
 
 
 @assert_instance(str)
-def get_movies_by_mini_theme(theme: str, max: int | None = None) -> dict:
+def get_movies_by_mini_theme(
+    theme: str, max: int | None = None, max_workers: int | None = None
+) -> dict:
     BASE_URL = f"https://letterboxd.com/films/ajax/mini-theme/{theme}"
-    return Films(BASE_URL, max).movies
+    return Films(BASE_URL, max, max_workers).movies
 
 
 def print_movies(movies, title=None, max_count=None):
@@ -0,0 +1,226 @@
+"""
+Follow analytics over compact follower/following snapshots.
+
+Usernames are interned to integer ids once per store and each snapshot keeps
+its followers and following as sorted uint32 arrays. Mutuals, one-sided
+follows and the changes between two snapshots are then linear merges of
+those arrays, which keeps accounts with 100k followers cheap to track.
+"""
+
+from array import array
+from collections.abc import Iterable
+from datetime import date as Date
+
+from letterboxdpy.pages.user_network import extract_network_usernames
+from letterboxdpy.utils.interner import Interner
+from letterboxdpy.utils.utils_file import JsonFile
+
+
+def sorted_ids(names: Interner, usernames: Iterable[str]) -> array:
+    """Interns usernames and returns their ids as a sorted, duplicate-free array."""
+    return array("I", sorted(set(names.intern_many(usernames))))
+
+
+def intersect_sorted(a: array, b: array) -> array:
+    """Ids present in both sorted arrays."""
+    out = array("I")
+    i = j = 0
+    len_a, len_b = len(a), len(b)
+    while i < len_a and j < len_b:
+        x, y = a[i], b[j]
+        if x == y:
+            out.append(x)
+            i += 1
+            j += 1
+        elif x < y:
+            i += 1
+        else:
+            j += 1
+    return out
+
+
+def subtract_sorted(a: array, b: array) -> array:
+    """Ids of sorted array `a` missing from sorted array `b`."""
+    out = array("I")
+    j = 0
+    len_b = len(b)
+    for x in a:
+        while j < len_b and b[j] < x:
+            j += 1
+        if j == len_b or b[j] != x:
+            out.append(x)
+    return out
+
+
+class FollowSnapshot:
+    """Followers and following of one member at one date, as sorted id arrays."""
+
+    __slots__ = ("date", "followers", "following", "username")
+
+    def __init__(
+        self, username: str, followers: array, following: array, date: str
+    ) -> None:
+        self.username = username
+        self.followers = followers
+        self.following = following
+        self.date = date
+
+    def to_dict(self) -> dict:
+        return {
+            "date": self.date,
+            "followers": self.followers.tolist(),
+            "following": self.following.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, username: str, data: dict) -> "FollowSnapshot":
+        return cls(
+            username,
+            array("I", data["followers"]),
+            array("I", data["following"]),
+            data["date"],
+        )
+
+
+def compare_follows(snapshot: FollowSnapshot) -> dict:
+    """
+    Splits a snapshot into reciprocal and one-sided follows.
+
+    Returns:
+        dict: id arrays 'mutual' (follow each other), 'fans' (follow the
+        member, not followed back) and 'not_following_back' (followed by
+        the member, not following back).
+    """
+    return {
+        "mutual": intersect_sorted(snapshot.followers, snapshot.following),
+        "fans": subtract_sorted(snapshot.followers, snapshot.following),
+        "not_following_back": subtract_sorted(snapshot.following, snapshot.followers),
+    }
+
+
+def diff_follows(old: FollowSnapshot, new: FollowSnapshot) -> dict:
+    """
+    Changes between two snapshots of the same member.
+
+    Returns:
+        dict: id arrays 'new_followers', 'lost_followers', 'new_following'
+        and 'unfollowed'.
+    """
+    return {
+        "new_followers": subtract_sorted(new.followers, old.followers),
+        "lost_followers": subtract_sorted(old.followers, new.followers),
+        "new_following": subtract_sorted(new.following, old.following),
+        "unfollowed": subtract_sorted(old.following, new.following),
+    }
+
+
+class FollowSnapshotStore:
+    """Latest follow snapshot per member, optionally persisted to JSON."""
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path
+        self.names = Interner()
+        self.snapshots: dict[str, FollowSnapshot] = {}
+        if path and JsonFile.exists(path):
+            data = JsonFile.load(path) or {}
+            self.names = Interner(data.get("names", []))
+            self.snapshots = {
+                username: FollowSnapshot.from_dict(username, snapshot)
+                for username, snapshot in data.get("snapshots", {}).items()
+            }
+
+    def __len__(self) -> int:
+        return len(self.snapshots)
+
+    def __contains__(self, username: str) -> bool:
+        return username in self.snapshots
+
+    def get(self, username: str) -> FollowSnapshot | None:
+        return self.snapshots.get(username)
+
+    def set(self, snapshot: FollowSnapshot) -> None:
+        self.snapshots[snapshot.username] = snapshot
+
+    def usernames(self, ids: Iterable[int]) -> list[str]:
+        """Resolves ids of this store back to usernames."""
+        return self.names.names(ids)
+
+    def save(self, path: str | None = None) -> None:
+        path = path or self.path
+        if not path:
+            raise ValueError("No path to save the snapshots to")
+        JsonFile.save(
+            path,
+            {
+                "names": list(self.names),
+                "snapshots": {
+                    username: snapshot.to_dict()
+                    for username, snapshot in self.snapshots.items()
+                },
+            },
+            indent=None,
+        )
+
+
+def take_snapshot(
+    username: str, names: Interner, date: str | None = None
+) -> FollowSnapshot:
+    """Crawls the followers and following of a member (usernames only)."""
+    return FollowSnapshot(
+        username,
+        sorted_ids(names, extract_network_usernames(username, "followers")),
+        sorted_ids(names, extract_network_usernames(username, "following")),
+        date or Date.today().isoformat(),
+    )
+
+
+def track_follows(username: str, store: FollowSnapshotStore) -> dict:
+    """
+    Takes a new snapshot of a member and compares it with the stored one.
+
+    The new snapshot replaces the stored one, and the store is saved when it
+    has a path.
+
+    Returns:
+        dict: {'username', 'date', 'since', 'followers', 'following',
+        'mutual', 'fans', 'not_following_back', 'changes'}. 'followers' and
+        'following' are counts, the compare_follows keys hold usernames.
+        'changes' is None for the first snapshot, otherwise the usernames of
+        each diff_follows key since the previous snapshot's date ('since').
+    """
+    snapshot = take_snapshot(username, store.names)
+    previous = store.get(username)
+
+    result = {
+        "username": username,
+        "date": snapshot.date,
+        "since": previous.date if previous else None,
+        "followers": len(snapshot.followers),
+        "following": len(snapshot.following),
+        **{key: store.usernames(ids) for key, ids in compare_follows(snapshot).items()},
+        "changes": None,
+    }
+    if previous is not None:
+        result["changes"] = {
+            key: store.usernames(ids)
+            for key, ids in diff_follows(previous, snapshot).items()
+        }
+
+    store.set(snapshot)
+    if store.path:
+        store.save()
+    return result
+
+
+if __name__ == "__main__":
+    from fastfingertips.terminal_utils import setup_encoding
+
+    setup_encoding()
+
+    store = FollowSnapshotStore("follow_snapshots")
+    result = track_follows("nmcassa", store)
+    print(f"{result['followers']} followers, {result['following']} following")
+    print(f"{len(result['mutual'])} mutuals, {len(result['fans'])} fans")
+    if result["changes"]:
+        for key, usernames in result["changes"].items():
+            print(f"{key} since {result['since']}: {usernames}")
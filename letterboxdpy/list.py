@@ -1,9 +1,12 @@
 import re
+from collections.abc import Iterable, Iterator
 
-from letterboxdpy.core.encoder import SecretsEncoder
+from letterboxdpy.core.concurrency import map_ordered
+from letterboxdpy.core.encoder import to_dict
 from letterboxdpy.pages import user_list
 from letterboxdpy.pages.user_list import ListMetaData
 from letterboxdpy.utils.utils_file import JsonFile
+from letterboxdpy.utils.utils_url import parse_list_ref
 
 
 class List:
@@ -37,7 +40,12 @@ class List:
     @property
     def movies(self) -> dict:
         if self._movies is None:
-            self._movies = self.get_movies()
+            self.load_movies()
+        return self._movies
+
+    def load_movies(self) -> dict:
+        """Fetches the movies now rather than on first access, and keeps them."""
+        self._movies = self.get_movies()
         return self._movies
 
     # Magic Methods
@@ -67,12 +75,15 @@ class List:
             ) from None
 
     def __str__(self) -> str:
-        return JsonFile.stringify(
-            self, indent=2, encoder=SecretsEncoder, secrets=["pages"]
-        )
+        return JsonFile.stringify(self.to_dict(), indent=2)
+
+    def to_dict(self) -> dict:
+        """Attributes as a dict, built directly without a JSON round trip."""
+        return to_dict(self, secrets=["pages"])
 
     def jsonify(self) -> dict:
-        return JsonFile.parse(self.__str__())
+        """JSON-normalized to_dict(), e.g. with non-string keys as strings."""
+        return to_dict(self, secrets=["pages"], json_keys=True)
 
     # Data Retrieval Methods
     def get_url(self) -> str:
@@ -109,6 +120,40 @@ class List:
         return self.pages.list.get_list_meta(url)
 
 
+# -- FUNCTIONS --
+
+
+def load_lists(
+    list_refs: Iterable[str | tuple | dict],
+    with_movies: bool = True,
+    max_workers: int | None = 8,
+) -> Iterator[tuple[str | tuple | dict, List | None, Exception | None]]:
+    """
+    Loads many lists concurrently, streaming (ref, List, error) in input order.
+
+    Args:
+        list_refs: List URLs, (username, slug) pairs or list dicts with a
+            'url' key, e.g. the values of ListsExtractor results.
+        with_movies: Also fetch every list's movies.
+        max_workers: Lists loaded at the same time. None = sequential.
+
+    A list that fails to load (deleted, private, ...) is yielded as
+    (ref, None, error); the other lists are still loaded.
+    """
+
+    def load(ref) -> tuple:
+        try:
+            username, slug = parse_list_ref(ref)
+            loaded = List(username, slug)
+            if with_movies:
+                loaded.load_movies()
+        except Exception as e:
+            return ref, None, e
+        return ref, loaded, None
+
+    return map_ordered(load, list_refs, max_workers)
+
+
 if __name__ == "__main__":
     from fastfingertips.terminal_utils import setup_encoding
 
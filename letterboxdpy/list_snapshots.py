@@ -0,0 +1,157 @@
+"""
+Snapshots of tracked lists and cheap change detection.
+
+Each snapshot keeps a list's update date, film count and ordered film ids.
+`refresh_lists` reads only the first page of every list and re-crawls the
+films only when that metadata changed, reporting an ordered diff of the
+films (inserted, removed, moved).
+"""
+
+from collections.abc import Iterable, Iterator
+from difflib import SequenceMatcher
+
+from letterboxdpy.core.concurrency import map_ordered
+from letterboxdpy.pages.user_list import UserList
+from letterboxdpy.utils.utils_file import JsonFile
+from letterboxdpy.utils.utils_url import parse_list_ref
+
+
+class ListSnapshotStore:
+    """Snapshots keyed by 'username/slug', optionally persisted to JSON."""
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path
+        self.snapshots: dict[str, dict] = {}
+        if path and JsonFile.exists(path):
+            self.snapshots = JsonFile.load(path) or {}
+
+    def __len__(self) -> int:
+        return len(self.snapshots)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.snapshots
+
+    def get(self, key: str) -> dict | None:
+        return self.snapshots.get(key)
+
+    def set(self, key: str, snapshot: dict) -> None:
+        self.snapshots[key] = snapshot
+
+    def save(self, path: str | None = None) -> None:
+        path = path or self.path
+        if not path:
+            raise ValueError("No path to save the snapshots to")
+        JsonFile.save(path, self.snapshots, indent=None)
+
+
+def diff_film_ids(old: list[str], new: list[str]) -> dict:
+    """
+    Ordered diff of two film id sequences.
+
+    Returns:
+        dict: 'inserted' and 'removed' as [{'id', 'position'}], 'moved' as
+        [{'id', 'from', 'to'}]. Positions are 1-based ranks.
+    """
+    matcher = SequenceMatcher(None, old, new, autojunk=False)
+    removed, inserted = {}, {}
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag in ("delete", "replace"):
+            removed.update((old[i], i + 1) for i in range(i1, i2))
+        if tag in ("insert", "replace"):
+            inserted.update((new[j], j + 1) for j in range(j1, j2))
+
+    # A film taken out at one place and put back at another has moved.
+    moved = removed.keys() & inserted.keys()
+    return {
+        "inserted": [
+            {"id": id_, "position": position}
+            for id_, position in inserted.items()
+            if id_ not in moved
+        ],
+        "removed": [
+            {"id": id_, "position": position}
+            for id_, position in removed.items()
+            if id_ not in moved
+        ],
+        "moved": sorted(
+            ({"id": id_, "from": removed[id_], "to": inserted[id_]} for id_ in moved),
+            key=lambda item: item["to"],
+        ),
+    }
+
+
+def refresh_lists(
+    list_refs: Iterable[str | tuple | dict],
+    store: ListSnapshotStore,
+    max_workers: int | None = 8,
+) -> Iterator[dict]:
+    """
+    Checks tracked lists for changes, streaming one result per list.
+
+    Only the first page of each list is requested unless its update date or
+    film count differs from the stored snapshot; then the films are crawled
+    again and diffed. The store is updated as results come in and saved at
+    the end when it has a path.
+
+    Args:
+        list_refs: List URLs, (username, slug) pairs or list dicts.
+        store: Snapshots to compare with and update.
+        max_workers: Lists checked at the same time. None = sequential.
+
+    Yields:
+        dict: {'list', 'status', 'diff'}. Status is 'new', 'changed',
+        'unchanged' or 'error' (then 'error' holds the message).
+    """
+
+    def check(ref) -> dict:
+        try:
+            username, slug = parse_list_ref(ref)
+            key = f"{username}/{slug}"
+            page = UserList(username, slug)
+            meta = {"date_updated": page.get_date_updated(), "count": page.get_count()}
+
+            old = store.get(key)
+            if (
+                old is not None
+                and meta["date_updated"] is not None
+                and old["date_updated"] == meta["date_updated"]
+                and old["count"] == meta["count"]
+            ):
+                return {"list": key, "snapshot": None}
+            return {"list": key, "snapshot": {**meta, "films": list(page.get_movies())}}
+        except Exception as e:
+            return {"list": str(ref), "error": str(e)}
+
+    try:
+        for result in map_ordered(check, list_refs, max_workers):
+            key = result["list"]
+            if "error" in result:
+                yield {"list": key, "status": "error", "diff": None, **result}
+                continue
+
+            snapshot = result["snapshot"]
+            if snapshot is None:
+                yield {"list": key, "status": "unchanged", "diff": None}
+                continue
+
+            old = store.get(key)
+            store.set(key, snapshot)
+            if old is None:
+                yield {"list": key, "status": "new", "diff": None}
+            else:
+                diff = diff_film_ids(old["films"], snapshot["films"])
+                yield {"list": key, "status": "changed", "diff": diff}
+    finally:
+        if store.path:
+            store.save()
+
+
+if __name__ == "__main__":
+    from fastfingertips.terminal_utils import setup_encoding
+
+    setup_encoding()
+
+    store = ListSnapshotStore("list_snapshots")
+    lists = ["https://letterboxd.com/nmcassa/list/def-con-movie-list/"]
+    for result in refresh_lists(lists, store):
+        print(result["list"], result["status"], result["diff"])
@@ -1,7 +1,8 @@
 import re
 
-from letterboxdpy.core.encoder import Encoder
-from letterboxdpy.core.scraper import parse_url
+from letterboxdpy.core.encoder import to_dict
+from letterboxdpy.core.scraper import fetch_text
+from letterboxdpy.utils.members_extractor import parse_member_table
 from letterboxdpy.utils.utils_file import JsonFile
 from letterboxdpy.utils.utils_url import get_page_url
 
@@ -30,24 +31,16 @@ class Members:
         data = []
         page = 1
         while True:
-            url = get_page_url(self.url, page)
-            dom = parse_url(url)
+            html = fetch_text(get_page_url(self.url, page))
+            usernames = parse_member_table(html, usernames_only=True)
 
-            tables = dom.find_all("table", {"class": ["member-table"]})
-            if not tables:
-                break
-
-            avatars = tables[0].find_all("a", {"class": ["avatar -a40"]})
-
-            for avatar in avatars:
-                user_url = avatar["href"]
-                user_name = user_url.replace("/", "")
+            for user_name in usernames:
                 data.append(user_name)
 
                 if self.max and len(data) >= self.max:
                     return data
 
-            if len(avatars) < self.MEMBERS_PER_PAGE:
+            if len(usernames) < self.MEMBERS_PER_PAGE:
                 break
 
             page += 1
@@ -61,11 +54,15 @@ class Members:
 
     def __str__(self) -> str:
         """Return a JSON string representation of the instance."""
-        return JsonFile.stringify(self, indent=2, encoder=Encoder)
+        return JsonFile.stringify(self.to_dict(), indent=2)
+
+    def to_dict(self) -> dict:
+        """Return the instance attributes as a dictionary."""
+        return to_dict(self)
 
     def jsonify(self) -> dict | None:
         """Convert the instance to a JSON dictionary."""
-        return JsonFile.parse(self.__str__())
+        return to_dict(self, json_keys=True)
 
 
 # -- FUNCTIONS --
@@ -1,4 +1,4 @@
-from letterboxdpy.core.encoder import SecretsEncoder
+from letterboxdpy.core.encoder import to_dict
 from letterboxdpy.pages import (
     movie_lists,
     movie_members,
@@ -72,12 +72,15 @@ class Movie:
         self.popular_reviews = self.get_popular_reviews()
 
     def __str__(self) -> str:
-        return JsonFile.stringify(
-            self, indent=2, encoder=SecretsEncoder, secrets=["pages"]
-        )
+        return JsonFile.stringify(self.to_dict(), indent=2)
+
+    def to_dict(self) -> dict:
+        """Attributes as a dict, built directly without a JSON round trip."""
+        return to_dict(self, secrets=["pages"])
 
     def jsonify(self) -> dict:
-        return JsonFile.parse(self.__str__())
+        """JSON-normalized to_dict(), e.g. with non-string keys as strings."""
+        return to_dict(self, secrets=["pages"], json_keys=True)
 
     # PROFILE PAGE
     def get_url(self) -> str:
@@ -150,19 +153,42 @@ class Movie:
         return self.pages.profile.get_extended_details()
 
     # LISTS PAGE
-    def get_lists(self) -> dict:
-        return self.pages.lists.get_lists()
+    def get_lists(
+        self, max_lists: int | None = None, max_workers: int | None = None
+    ) -> dict:
+        return self.pages.lists.get_lists(max_lists, max_workers)
 
     # MEMBERS PAGE
     def get_watchers_stats(self) -> dict:
         return self.pages.members.get_watchers_stats()
 
+    def get_audience(
+        self,
+        section: str = "members",
+        max: int | None = None,
+        max_workers: int | None = None,
+    ) -> dict:
+        return self.pages.members.get_audience(
+            section, max=max, max_workers=max_workers
+        )
+
     # REVIEWS PAGE
-    def get_reviews(self) -> dict:
-        return self.pages.reviews.get_reviews()
+    def get_reviews(
+        self,
+        max: int | None = None,
+        since: str | None = None,
+        max_workers: int | None = None,
+    ) -> dict:
+        return self.pages.reviews.get_reviews(max, since, max_workers)
 
-    def get_reviews_by_rating(self, rating: float) -> dict:
-        return self.pages.reviews.get_reviews_by_rating(rating)
+    def get_reviews_by_rating(
+        self,
+        rating: float,
+        max: int | None = None,
+        since: str | None = None,
+        max_workers: int | None = None,
+    ) -> dict:
+        return self.pages.reviews.get_reviews_by_rating(rating, max, since, max_workers)
 
     # SIMILAR MOVIES
     def get_similar_movies(self) -> dict:
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 from letterboxdpy.constants.project import DOMAIN
 from letterboxdpy.utils.lists_extractor import ListsExtractor
 
@@ -10,5 +12,13 @@ class MovieLists:
         self.slug = slug
         self.url = f"{DOMAIN}/film/{slug}/lists"
 
-    def get_lists(self) -> dict:
-        return ListsExtractor.from_url(self.url)
+    def get_lists(
+        self, max_lists: int | None = None, max_workers: int | None = None
+    ) -> dict:
+        return ListsExtractor.from_url(self.url, max_lists, max_workers)
+
+    def iter_lists(
+        self, max_lists: int | None = None, max_workers: int | None = None
+    ) -> Iterator[tuple[str, dict]]:
+        """Stream (list_id, data) pairs of the lists containing this movie."""
+        return ListsExtractor.iter_from_url(self.url, max_lists, max_workers)
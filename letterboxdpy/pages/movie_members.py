@@ -1,30 +1,134 @@
+from array import array
+from collections.abc import Iterator
 from functools import cached_property
+from itertools import chain
 
 from bs4 import BeautifulSoup
 from fastfingertips.string_utils import extract_number_from_text
 
 from letterboxdpy.constants.project import DOMAIN
-from letterboxdpy.core.scraper import parse_url
+from letterboxdpy.core.pagination import iter_pages, pages_needed
+from letterboxdpy.core.scraper import Scraper, fetch_text
+from letterboxdpy.utils.interner import Interner
+from letterboxdpy.utils.members_extractor import parse_member_table
 
 
 class MovieMembers:
     """Movie members page operations - watchers statistics."""
 
+    # Member tables of a film: who watched, who has it as a favorite, who liked it.
+    # Reviews and lists have their own pages (MovieReviews, MovieLists).
+    AUDIENCE_SECTIONS = ("members", "fans", "likes")
+
     def __init__(self, slug: str):
         """Initialize MovieMembers with a movie slug."""
         self.slug = slug
         self.url = f"{DOMAIN}/film/{slug}/members"
 
+    @cached_property
+    def html(self) -> str:
+        """Raw first members page, shared by the stats and the audience."""
+        return fetch_text(self.url)
+
     @cached_property
     def dom(self) -> BeautifulSoup:
-        return parse_url(self.url)
+        return BeautifulSoup(self.html, Scraper.builder)
 
     def get_watchers_stats(self) -> dict:
         """Get movie watchers' statistics."""
         return extract_movie_watchers_stats(self.dom)
 
+    def get_audience_url(self, section: str = "members") -> str:
+        assert section in self.AUDIENCE_SECTIONS, (
+            f"Section must be one of {self.AUDIENCE_SECTIONS}"
+        )
+        return f"{DOMAIN}/film/{self.slug}/{section}"
+
+    def iter_audience(
+        self,
+        section: str = "members",
+        max: int | None = None,
+        max_workers: int | None = None,
+    ) -> Iterator[str]:
+        """Stream the usernames of a film's members, fans or likes table."""
+        first_html = self.html if section == "members" else None
+        return iter_movie_audience(
+            self.get_audience_url(section), max, max_workers, first_html
+        )
+
+    def get_audience(
+        self,
+        section: str = "members",
+        interner: Interner | None = None,
+        max: int | None = None,
+        max_workers: int | None = None,
+    ) -> dict:
+        """Get a film's members, fans or likes as interned username ids."""
+        interner = interner if interner is not None else Interner()
+        ids = interner.intern_many(self.iter_audience(section, max, max_workers))
+        return {
+            "section": section,
+            "count": len(ids),
+            "ids": ids,
+            "interner": interner,
+        }
+
+
+MEMBERS_PER_PAGE = 25
 
-# TODO: /fans, /likes, /reviews, /lists
+
+def iter_movie_audience(
+    url: str,
+    max: int | None = None,
+    max_workers: int | None = None,
+    first_html: str | None = None,
+) -> Iterator[str]:
+    """
+    Yields usernames from a film's member table pages (/members, /fans, /likes).
+
+    Args:
+        url: Member table URL without the /page/N/ suffix.
+        max: Stop after this many usernames.
+        max_workers: Pages fetched ahead in parallel. None = sequential.
+        first_html: Raw first page, if already fetched.
+    """
+    count = 0
+    last_page = pages_needed(max, MEMBERS_PER_PAGE)
+    if first_html is None:
+        pages = iter_pages(url, 1, last_page, max_workers, fetch=fetch_text)
+    else:
+        pages = chain(
+            [(1, first_html)],
+            iter_pages(
+                url,
+                2,
+                last_page,
+                max_workers,
+                allow_missing_start=True,
+                fetch=fetch_text,
+            ),
+        )
+
+    for _, html in pages:
+        usernames = parse_member_table(html, usernames_only=True)
+        for username in usernames:
+            yield username
+            count += 1
+            if max and count >= max:
+                return
+
+        if len(usernames) < MEMBERS_PER_PAGE:
+            return
+
+
+def extract_movie_audience(
+    url: str,
+    interner: Interner,
+    max: int | None = None,
+    max_workers: int | None = None,
+) -> array:
+    """Crawls a member table and returns the usernames as interned ids."""
+    return interner.intern_many(iter_movie_audience(url, max, max_workers))
 
 
 def extract_movie_watchers_stats(dom) -> dict:
@@ -51,3 +155,6 @@ if __name__ == "__main__":
     print(f"Movie: {members_instance.slug}")
     for key, value in members_instance.get_watchers_stats().items():
         print(f"{key}: {value}")
+
+    fans = members_instance.get_audience("fans", max=100, max_workers=4)
+    print(f"First {fans['count']} fans:", fans["interner"].names(fans["ids"][:10]))
@@ -1,4 +1,12 @@
-from letterboxdpy.constants.project import DOMAIN
+from collections.abc import Iterator
+from datetime import datetime
+
+from fastfingertips.string_utils import extract_number_from_text
+
+from letterboxdpy.constants.project import DOMAIN, VALID_RATINGS
+from letterboxdpy.core.pagination import iter_all_pages, pages_needed
+from letterboxdpy.pages.user_reviews import parse_review_log
+from letterboxdpy.utils.date_utils import DateUtils
 
 
 class MovieReviews:
@@ -9,29 +17,182 @@ class MovieReviews:
         self.slug = slug
         self.url = f"{DOMAIN}/film/{slug}/reviews"
 
-    def get_reviews(self) -> dict:
+    def get_reviews(
+        self,
+        max: int | None = None,
+        since: str | datetime | None = None,
+        max_workers: int | None = None,
+    ) -> dict:
         """Get all reviews for this movie."""
-        return extract_movie_reviews(self.url)
+        return extract_movie_reviews(self.url, max, since, max_workers)
 
-    def get_reviews_by_rating(self, rating: float) -> dict:
+    def get_reviews_by_rating(
+        self,
+        rating: float,
+        max: int | None = None,
+        since: str | datetime | None = None,
+        max_workers: int | None = None,
+    ) -> dict:
         """Get reviews filtered by rating."""
-        return extract_movie_reviews_by_rating(self.url, rating)
+        return extract_movie_reviews_by_rating(
+            self.url, rating, max, since, max_workers
+        )
 
+    def iter_reviews(
+        self,
+        rating: float | None = None,
+        max: int | None = None,
+        since: str | datetime | None = None,
+        max_workers: int | None = None,
+    ) -> Iterator[tuple[str, dict]]:
+        """Stream (log_id, review) pairs without keeping them in memory."""
+        url = self.url if rating is None else get_rated_url(self.url, rating)
+        return iter_movie_reviews(url, max, since, max_workers)
 
-def extract_movie_reviews(url: str) -> dict:
-    """Extract all reviews for a movie."""
 
-    # TODO: Implement movie reviews extraction
-    # This would parse /film/slug/reviews/ page
-    # Similar to user_reviews.py but for movie reviews
+REVIEWS_PER_PAGE = 12
+
+
+def get_rated_url(url: str, rating: float) -> str:
+    """Returns the reviews URL filtered by rating (/reviews/rated/X/)."""
+    if rating not in VALID_RATINGS:
+        raise ValueError(f"Invalid rating: {rating}")
+    return f"{url.rstrip('/')}/rated/{rating:g}"
+
+
+def iter_movie_reviews(
+    url: str,
+    max: int | None = None,
+    since: str | datetime | None = None,
+    max_workers: int | None = None,
+) -> Iterator[tuple[str, dict]]:
+    """
+    Yields (log_id, review) pairs from a film's reviews pages, page by page.
+
+    Args:
+        url: Reviews URL (/film/slug/reviews or a rated variant).
+        max: Stop after this many reviews.
+        since: Stop at the first review dated before this date. Switches
+               the ordering to newest first (/by/added/). Logs without a
+               label have no reliable date; old ones are skipped, and a
+               page with nothing newer than `since` ends the crawl.
+        max_workers: Pages fetched ahead in parallel. None = sequential.
+    """
+    since_iso = DateUtils.to_iso(since) if since else None
+    base_url = f"{url.rstrip('/')}/by/added" if since_iso else url
+
+    last_page = pages_needed(max, REVIEWS_PER_PAGE)
+    count = 0
+
+    for page, dom in iter_all_pages(base_url, last_page, max_workers):
+        logs = extract_review_logs(dom)
+        fresh = False
+
+        for log in logs:
+            review = extract_movie_review(log, page)
+            if review is None:
+                continue
+
+            log_id, data = review
+            if since_iso and data["date"] and data["date"] < since_iso:
+                if data["type"] is not None:
+                    return
+                continue
+
+            fresh = True
+            yield log_id, data
+            count += 1
+            if max and count >= max:
+                return
+
+        if len(logs) < REVIEWS_PER_PAGE or (since_iso and not fresh):
+            return
+
 
-    return {"available": False, "count": 0, "reviews": []}
+def extract_review_logs(dom) -> list:
+    """Returns the review articles listed on a film reviews page."""
+    container = dom.find("div", {"class": ["viewing-list"]}) or dom
+    return container.find_all("article", attrs={"data-object-id": True})
 
 
-def extract_movie_reviews_by_rating(url: str, rating: float) -> dict:
+def extract_movie_review(log, page: int) -> tuple[str, dict] | None:
+    """Parses a single review article of a film reviews page."""
+    log_id = log["data-object-id"].split(":")[-1]
+    if not log_id:
+        return None
+
+    username = log.get("data-owner")
+    avatar = log.find("a", {"class": "avatar"})
+    if not username and avatar:
+        username = avatar["href"].strip("/")
+
+    display_name_elem = log.find("strong", {"class": ["displayname", "name"]})
+    display_name = (
+        display_name_elem.get_text(strip=True) if display_name_elem else username
+    )
+
+    link_elem = log.find("a", href=lambda x: x and "/film/" in x and x != "/film/")
+    link = DOMAIN + link_elem["href"] if link_elem else None
+
+    likes_elem = log.find("p", {"class": "like-link-target"})
+    likes = (
+        extract_number_from_text(likes_elem.get("data-count"), join=True)
+        if likes_elem and likes_elem.get("data-count")
+        else None
+    )
+
+    details = parse_review_log(log)
+
+    return log_id, {
+        "user": {
+            "username": username,
+            "display_name": display_name,
+            "url": f"{DOMAIN}/{username}/",
+        },
+        "type": details["type"],
+        "link": link,
+        "rating": details["rating"],
+        "review": details["review"],
+        "likes": likes,
+        "date": details["date"],
+        "page": page,
+    }
+
+
+def extract_movie_reviews(
+    url: str,
+    max: int | None = None,
+    since: str | datetime | None = None,
+    max_workers: int | None = None,
+) -> dict:
+    """Extract all reviews for a movie."""
+    reviews = dict(iter_movie_reviews(url, max, since, max_workers))
+    return {
+        "available": len(reviews) > 0,
+        "count": len(reviews),
+        "reviews": reviews,
+    }
+
+
+def extract_movie_reviews_by_rating(
+    url: str,
+    rating: float,
+    max: int | None = None,
+    since: str | datetime | None = None,
+    max_workers: int | None = None,
+) -> dict:
     """Extract reviews filtered by specific rating."""
+    data = extract_movie_reviews(get_rated_url(url, rating), max, since, max_workers)
+    return {"rating": rating, **data}
+
+
+if __name__ == "__main__":
+    from fastfingertips.terminal_utils import setup_encoding
+
+    setup_encoding()
 
-    # TODO: Implement movie reviews by rating extraction
-    # This would parse /film/slug/reviews/by/rating/X/ page
+    reviews_instance = MovieReviews("v-for-vendetta")
 
-    return {"available": False, "rating": rating, "count": 0, "reviews": []}
+    print(f"Movie: {reviews_instance.slug}")
+    for log_id, review in reviews_instance.iter_reviews(max=5, max_workers=4):
+        print(log_id, review["user"]["username"], review["rating"])
@@ -1,4 +1,5 @@
 import warnings
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 
@@ -8,15 +9,19 @@ from letterboxdpy.constants.project import (
     CURRENT_YEAR,
     DOMAIN,
 )
+from letterboxdpy.core.models import DiaryEntry
 from letterboxdpy.core.scraper import parse_url
 from letterboxdpy.utils.date_utils import DateUtils
 from letterboxdpy.utils.utils_url import get_page_url
 
+ENTRIES_PER_PAGE = 50
+
 
 class UserDiary:
     def __init__(self, username: str) -> None:
         self.username = username
         self.url = f"{DOMAIN}/{username}/diary"
+        self._diary: dict[bool, dict] = {}  # full diaries by fetch_runtime
 
     def get_diary(
         self,
@@ -27,9 +32,16 @@ class UserDiary:
         fetch_runtime: bool = False,
         max_workers: int | None = None,
     ) -> dict:
-        return extract_user_diary(
-            self.username, year, month, day, page, fetch_runtime, max_workers
-        )
+        """The full diary (no filters) is crawled once per instance."""
+        if any((year, month, day, page)):
+            return extract_user_diary(
+                self.username, year, month, day, page, fetch_runtime, max_workers
+            )
+        if fetch_runtime not in self._diary:
+            self._diary[fetch_runtime] = extract_user_diary(
+                self.username, fetch_runtime=fetch_runtime, max_workers=max_workers
+            )
+        return self._diary[fetch_runtime]
 
     def get_year(
         self,
@@ -79,8 +91,37 @@ class UserDiary:
         fetch_runtime: bool = False,
         max_workers: int | None = None,
     ) -> dict:
+        """Derived from the full diary when it was already crawled."""
+        diary = self._get_crawled_diary(fetch_runtime)
+        if diary is not None:
+            entries = _year_entries(self.username, year, diary["entries"])
+            return build_user_wrapped(entries, year)
         return extract_user_wrapped(self.username, year, fetch_runtime, max_workers)
 
+    def get_wrapped_range(
+        self,
+        start: int,
+        end: int = CURRENT_YEAR,
+        fetch_runtime: bool = False,
+        max_workers: int | None = None,
+    ) -> dict:
+        diary = self._get_crawled_diary(fetch_runtime)
+        if diary is not None:
+            return {
+                year: build_user_wrapped(
+                    _year_entries(self.username, year, diary["entries"]), year
+                )
+                for year in range(start, end + 1)
+            }
+        return extract_user_wrapped_range(
+            self.username, start, end, fetch_runtime, max_workers
+        )
+
+    def _get_crawled_diary(self, fetch_runtime: bool) -> dict | None:
+        if True in self._diary:
+            return self._diary[True]
+        return None if fetch_runtime else self._diary.get(False)
+
 
 @lru_cache(maxsize=1024)
 def _get_runtime(slug: str) -> int | None:
@@ -105,28 +146,23 @@ def get_runtime_cache_info():
 
 
 def _fetch_missing_runtimes(
-    entries: dict, pagination: int, max_workers: int | None = None
+    entries: dict[str, DiaryEntry], max_workers: int | None = None
 ) -> None:
     """
     Fetches missing runtime data for diary entries.
 
     Args:
-        entries: Dictionary of diary entries to update (mutated in place).
-        pagination: Current page number to filter entries.
+        entries: Diary entries to update (mutated in place).
         max_workers: Max threads for parallel fetching. None = sequential.
     """
     entries_to_update = [
-        (log_id, entry["slug"])
-        for log_id, entry in entries.items()
-        if entry["runtime"] is None
-        and entry["slug"]
-        and entry["page"]["no"] == pagination
+        entry for entry in entries.values() if entry.runtime is None and entry.slug
     ]
 
     if not entries_to_update:
         return
 
-    slugs = [str(slug) for _, slug in entries_to_update]
+    slugs = [str(entry.slug) for entry in entries_to_update]
 
     if max_workers and max_workers > 1:
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -134,9 +170,9 @@ def _fetch_missing_runtimes(
     else:
         results = [_get_runtime(slug) for slug in slugs]
 
-    for (log_id, _), fetched_runtime in zip(entries_to_update, results, strict=False):
+    for entry, fetched_runtime in zip(entries_to_update, results, strict=False):
         if fetched_runtime:
-            entries[log_id]["runtime"] = fetched_runtime
+            entry.runtime = fetched_runtime
 
 
 def extract_user_diary(
@@ -147,6 +183,7 @@ def extract_user_diary(
     page: int | None = None,
     fetch_runtime: bool = False,
     max_workers: int | None = None,
+    as_dicts: bool = True,
 ) -> dict:
     """
     Extracts the user's diary entries, optionally filtering by year, month, and day.
@@ -160,10 +197,51 @@ def extract_user_diary(
         fetch_runtime (bool, optional): If True, fetches runtime for each film.
         max_workers (int, optional): Max threads for parallel runtime fetching.
                                      If None, runs sequentially (safer).
+        as_dicts (bool, optional): If False, entries are DiaryEntry records.
 
     Returns:
         dict: A dictionary with diary entries, each containing movie details, rewatch status, rating, like status, review status, and entry date (ISO 8601 string).
     """
+    ret = {"entries": {}}
+    last_page = page if page else 1
+    for page_no, entries in iter_user_diary(
+        username, year, month, day, page, fetch_runtime, max_workers, as_dicts
+    ):
+        ret["entries"].update(entries)
+        last_page = page_no
+
+    ret["count"] = len(ret["entries"])
+    ret["last_page"] = last_page
+
+    if not fetch_runtime and any(
+        entry["runtime"] is None for entry in ret["entries"].values()
+    ):
+        warnings.warn(
+            "Runtime data is missing for some entries. "
+            "Pass `fetch_runtime=True` to retrieve it (may require extra network requests).",
+            UserWarning,
+            stacklevel=2,
+        )
+
+    return ret
+
+
+def iter_user_diary(
+    username: str,
+    year: int | None = None,
+    month: int | None = None,
+    day: int | None = None,
+    page: int | None = None,
+    fetch_runtime: bool = False,
+    max_workers: int | None = None,
+    as_dicts: bool = True,
+) -> Iterator[tuple[int, dict]]:
+    """
+    Yields (page_no, entries) for each diary page, newest entries first.
+
+    Same arguments and entry format as `extract_user_diary`; stopping the
+    iteration early skips the remaining pages.
+    """
 
     def extract_movie_name(react_div, default="Unknown"):
         if not react_div:
@@ -185,7 +263,6 @@ def extract_user_diary(
 
     BASE_URL = f"{DOMAIN}/{username}/films/diary/{date_filter}"
     pagination = page if page else 1
-    ret = {"entries": {}}
 
     while True:
         url = get_page_url(BASE_URL, pagination)
@@ -198,132 +275,122 @@ def extract_user_diary(
             },
         )
 
-        if table:
-            # extract the headers class of the table to use as keys for the entries
-            # ['month','day','film','released','rating','like','rewatch','review', actions']
-            headers = [elem["class"][0].split("-")[-1] for elem in table.find_all("th")]
-            rows = dom.tbody.find_all("tr")
-
-            for row in rows:
-                # create a dictionary by mapping headers class
-                # to corresponding columns in the row
-                cols = dict(zip(headers, row.find_all("td"), strict=False))
-
-                # <tr class="diary-entry-row .." data-viewing-id="516951060" ..>
-                log_id = row["data-viewing-id"]
-
-                # day column (updated for new HTML structure)
-                if "daydate" in cols:
-                    date = DateUtils.to_iso(
-                        dict(
-                            zip(
-                                ["year", "month", "day"],
-                                map(int, cols["daydate"].a["href"].split("/")[-4:]),
-                                strict=False,
-                            )
+        if not table:
+            yield pagination, {}
+            break
+
+        entries = {}
+        # extract the headers class of the table to use as keys for the entries
+        # ['month','day','film','released','rating','like','rewatch','review', actions']
+        headers = [elem["class"][0].split("-")[-1] for elem in table.find_all("th")]
+        rows = dom.tbody.find_all("tr")
+
+        for row in rows:
+            # create a dictionary by mapping headers class
+            # to corresponding columns in the row
+            cols = dict(zip(headers, row.find_all("td"), strict=False))
+
+            # <tr class="diary-entry-row .." data-viewing-id="516951060" ..>
+            log_id = row["data-viewing-id"]
+
+            # day column (updated for new HTML structure)
+            if "daydate" in cols:
+                date = DateUtils.to_iso(
+                    dict(
+                        zip(
+                            ["year", "month", "day"],
+                            map(int, cols["daydate"].a["href"].split("/")[-4:]),
+                            strict=False,
                         )
                     )
-                elif "day" in cols:  # fallback for old structure
-                    date = DateUtils.to_iso(
-                        dict(
-                            zip(
-                                ["year", "month", "day"],
-                                map(int, cols["day"].a["href"].split("/")[-4:]),
-                                strict=False,
-                            )
+                )
+            elif "day" in cols:  # fallback for old structure
+                date = DateUtils.to_iso(
+                    dict(
+                        zip(
+                            ["year", "month", "day"],
+                            map(int, cols["day"].a["href"].split("/")[-4:]),
+                            strict=False,
                         )
                     )
-                else:
-                    date = None
-                # Extract film data from react-component
-                production_col = cols.get("production")
-                react_div = (
-                    production_col.find("div", {"class": "react-component"})
-                    if production_col
-                    else None
                 )
+            else:
+                date = None
+            # Extract film data from react-component
+            production_col = cols.get("production")
+            react_div = (
+                production_col.find("div", {"class": "react-component"})
+                if production_col
+                else None
+            )
 
-                name = extract_movie_name(react_div)
-                slug = react_div.get("data-item-slug") if react_div else None
-                id = react_div.get("data-film-id") if react_div else None
-                # released column (updated for new HTML structure)
-                if "releaseyear" in cols:
-                    release = cols["releaseyear"].text.strip()
-                elif "released" in cols:  # fallback for old structure
-                    release = cols["released"].text.strip()
-                else:
-                    release = ""
-                release = int(release) if len(release) else None
-                # rewatch column
-                rewatched = "icon-status-off" not in cols["rewatch"]["class"]
-                # rating column
-                rating = cols["rating"].span
-                is_rating = "rated-" in "".join(rating["class"])
-                rating = (
-                    int(rating["class"][-1].split("-")[-1]) / 2.0 if is_rating else None
-                )
-                # like column
-                liked = bool(cols["like"].find("span", attrs={"class": "icon-liked"}))
-                # review column
-                reviewed = bool(cols["review"].a)
-                # actions column
-                actions = cols["actions"]
-                """
-                id = actions["data-film-id"] # !film col
-                name = actions["data-film-name"] !# film col
-                slug = actions["data-film-slug"] # !film col
-                release = actions["ddata-film-release-year"] # !released col
-                """
-                # runtime from actions (handle missing attribute)
-                runtime = actions.get("data-film-run-time") or actions.get(
-                    "data-film-runtime"
-                )
-                runtime = int(runtime) if runtime else None
-
-                # create entry
-                entry = {
-                    "name": name,
-                    "slug": slug,
-                    "id": id,
-                    "release": release,
-                    "runtime": runtime,
-                    "actions": {
-                        "rewatched": rewatched,
-                        "rating": rating,
-                        "liked": liked,
-                        "reviewed": reviewed,
-                    },
-                    "date": date,
-                    "page": {"url": url, "no": pagination},
-                }
-                ret["entries"][log_id] = entry
-
-            # Fetch runtime data if requested
-            if fetch_runtime:
-                _fetch_missing_runtimes(ret["entries"], pagination, max_workers)
-
-            if len(rows) < 50 or pagination == page:
-                # no more entries
-                # or reached the requested page
-                break
-            pagination += 1
-        else:  # no table
-            break
+            name = extract_movie_name(react_div)
+            slug = react_div.get("data-item-slug") if react_div else None
+            id = react_div.get("data-film-id") if react_div else None
+            # released column (updated for new HTML structure)
+            if "releaseyear" in cols:
+                release = cols["releaseyear"].text.strip()
+            elif "released" in cols:  # fallback for old structure
+                release = cols["released"].text.strip()
+            else:
+                release = ""
+            release = int(release) if len(release) else None
+            # rewatch column
+            rewatched = "icon-status-off" not in cols["rewatch"]["class"]
+            # rating column
+            rating = cols["rating"].span
+            is_rating = "rated-" in "".join(rating["class"])
+            rating = (
+                int(rating["class"][-1].split("-")[-1]) / 2.0 if is_rating else None
+            )
+            # like column
+            liked = bool(cols["like"].find("span", attrs={"class": "icon-liked"}))
+            # review column
+            reviewed = bool(cols["review"].a)
+            # actions column
+            actions = cols["actions"]
+            """
+            id = actions["data-film-id"] # !film col
+            name = actions["data-film-name"] !# film col
+            slug = actions["data-film-slug"] # !film col
+            release = actions["ddata-film-release-year"] # !released col
+            """
+            # runtime from actions (handle missing attribute)
+            runtime = actions.get("data-film-run-time") or actions.get(
+                "data-film-runtime"
+            )
+            runtime = int(runtime) if runtime else None
+
+            # create entry
+            entries[log_id] = DiaryEntry(
+                name,
+                slug,
+                id,
+                release,
+                runtime,
+                rewatched,
+                rating,
+                liked,
+                reviewed,
+                date,
+                url,
+                pagination,
+            )
 
-    ret["count"] = len(ret["entries"])
-    ret["last_page"] = pagination
+        # Fetch runtime data if requested
+        if fetch_runtime:
+            _fetch_missing_runtimes(entries, max_workers)
 
-    if not fetch_runtime and any(
-        entry["runtime"] is None for entry in ret["entries"].values()
-    ):
-        warnings.warn(
-            "Runtime data is missing for some entries. "
-            "Pass `fetch_runtime=True` to retrieve it (may require extra network requests).",
-            UserWarning,
-            stacklevel=2,
-        )
+        if as_dicts:
+            entries = {log_id: entry.to_dict() for log_id, entry in entries.items()}
 
-    return ret
+        yield pagination, entries
+
+        if len(rows) < ENTRIES_PER_PAGE or pagination == page:
+            # no more entries
+            # or reached the requested page
+            break
+        pagination += 1
 
 
 # dependency: extract_user_diary()
@@ -357,6 +424,114 @@ def extract_user_wrapped(
             raise KeyError("Diary data does not contain 'entries' key.")
         return diary
 
+    diary = retrieve_diary()
+    return build_user_wrapped(diary["entries"], year)
+
+
+# dependency: iter_user_diary()
+def extract_user_wrapped_range(
+    username: str,
+    start: int,
+    end: int = CURRENT_YEAR,
+    fetch_runtime: bool = False,
+    max_workers: int | None = None,
+) -> dict[int, dict]:
+    """Wraps every year from `start` to `end` (inclusive) from one diary crawl.
+
+    The diary lists the newest entries first, so the crawl stops at the first
+    page that reaches back before `start`. Each year has the same shape as
+    `extract_user_wrapped`.
+
+    Args:
+        username (str): The Letterboxd username.
+        start (int): First year to wrap.
+        end (int, optional): Last year to wrap. Defaults to current year.
+        fetch_runtime (bool, optional): If True, fetches runtime for each film.
+        max_workers (int, optional): Max threads for parallel runtime fetching.
+
+    Returns:
+        dict: {year: wrapped} for each year in the range.
+    """
+    if start > end:
+        raise ValueError(f"start ({start}) must not be after end ({end})")
+
+    entries_by_year = {year: {} for year in range(start, end + 1)}
+    try:
+        for _, entries in iter_user_diary(username, as_dicts=False):
+            oldest = None
+            for log_id, entry in entries.items():
+                oldest = DateUtils.parse_letterboxd_date(entry.date).year
+                if oldest in entries_by_year:
+                    entries_by_year[oldest][log_id] = entry
+            if oldest is not None and oldest < start:
+                break
+
+        # Runtimes are looked up only for the entries kept in the range.
+        if fetch_runtime:
+            _fetch_missing_runtimes(
+                {
+                    log_id: entry
+                    for entries in entries_by_year.values()
+                    for log_id, entry in entries.items()
+                },
+                max_workers,
+            )
+    except Exception as e:
+        raise ValueError(f"Failed to retrieve diary for user {username}: {e}") from e
+
+    for year, entries in entries_by_year.items():
+        entries_by_year[year] = _year_entries(
+            username,
+            year,
+            {log_id: entry.to_dict() for log_id, entry in entries.items()},
+        )
+
+    if not fetch_runtime and any(
+        data["runtime"] is None
+        for entries in entries_by_year.values()
+        for data in entries.values()
+    ):
+        warnings.warn(
+            "Runtime data is missing for some entries. "
+            "Pass `fetch_runtime=True` to retrieve it (may require extra network requests).",
+            UserWarning,
+            stacklevel=2,
+        )
+
+    return {
+        year: build_user_wrapped(entries, year)
+        for year, entries in entries_by_year.items()
+    }
+
+
+def _year_entries(username: str, year: int, entries: dict) -> dict:
+    """
+    The diary entries (newest first) of one year, each moved to the page it
+    has in the diary of `year`, as `extract_user_diary(username, year)`
+    returns them. The given entries are not modified.
+    """
+    base_url = f"{DOMAIN}/{username}/films/diary/for/{year}/"
+    selected = {}
+    for log_id, data in entries.items():
+        if DateUtils.parse_letterboxd_date(data["date"]).year != year:
+            continue
+        index = len(selected)
+        page_no = index // ENTRIES_PER_PAGE + 1
+        if index % ENTRIES_PER_PAGE == 0:
+            page_url = get_page_url(base_url, page_no)
+        selected[log_id] = {**data, "page": {"url": page_url, "no": page_no}}
+    return selected
+
+
+def build_user_wrapped(entries: dict, year: int) -> dict:
+    """Calculates the wrapped statistics of one year from diary entries.
+
+    Args:
+        entries (dict): Diary entries by log id, newest first, as returned
+            by `extract_user_diary`. Entries from other years are skipped.
+        year (int): The year to wrap.
+    """
+
     def update_counters(
         date_info: str, day_counter: dict, month_counter: dict
     ) -> tuple:
@@ -392,8 +567,6 @@ def extract_user_wrapped(
             first_watched = {log_id: data}
         return first_watched, last_watched
 
-    diary = retrieve_diary()
-
     movies = {}
     milestones = {}
     months = {}.fromkeys(range(1, 13), 0)  # 12 months
@@ -404,7 +577,7 @@ def extract_user_wrapped(
     last_watched = None
 
     no = 0
-    for log_id, data in diary["entries"].items():
+    for log_id, data in entries.items():
         watched_date_str = data["date"]
         watched_date = DateUtils.parse_letterboxd_date(watched_date_str)
 
@@ -1,88 +1,145 @@
-from letterboxdpy.constants.project import DOMAIN, GENRES
-from letterboxdpy.core.scraper import parse_url
+import re
+from collections.abc import Iterator
+
+from bs4 import BeautifulSoup
+
+from letterboxdpy.constants.project import DOMAIN, GENRES, RATINGS
+from letterboxdpy.core.concurrency import map_ordered
+from letterboxdpy.core.models import WatchedFilm
+from letterboxdpy.core.scraper import fetch_text, parse_url
 from letterboxdpy.utils.movies_extractor import extract_movie_info
+from letterboxdpy.utils.utils_cache import TTLCache
 from letterboxdpy.utils.utils_url import get_page_url
 
+# Genre counts per username, see extract_user_genre_info.
+GENRE_INFO_CACHE = TTLCache(ttl=60 * 60, maxsize=1024)
+# '<span class="replace-if-you">You have</span> watched 1,234 action films'
+GENRE_COUNT_PATTERN = re.compile(
+    r'<span[^>]*class="[^"]*\breplace-if-you\b[^"]*"[^>]*>.*?</span>([^<]*)',
+    re.DOTALL,
+)
+
 
 class UserFilms:
     def __init__(self, username: str) -> None:
         self.username = username
         self.url = f"{DOMAIN}/{self.username}/films"
+        self._films = None
+        self._partitioned = None
 
     def get_films(self) -> dict:
-        return extract_user_films(self.url)
+        """All watched films, crawled once per instance."""
+        if self._films is None:
+            self._films = extract_user_films(self.url)
+        return self._films
+
+    def get_films_partitioned(self) -> dict:
+        """Watched films bucketed by rating, plus the unrated and liked ones."""
+        if self._partitioned is None:
+            self._partitioned = partition_user_films(self.get_films()["movies"])
+        return self._partitioned
 
     def get_films_rated(self, rating: float | int) -> dict:
-        assert rating in [0.5, 1, 1.5, 2, 2.5, 3, 3.5, 4, 4.5, 5], "Invalid rating"
-        url = f"{self.url}/rated/{rating}/by/date"
-        return extract_user_films(url)
+        assert rating in RATINGS, "Invalid rating"
+        return self.get_films_partitioned()["rated"][float(rating)]
 
     def get_films_not_rated(self) -> dict:
-        url = f"{self.url}/rated/none/by/date"
-        return extract_user_films(url)
+        return self.get_films_partitioned()["not_rated"]
 
-    def get_genre_info(self):
-        return extract_user_genre_info(self.username)
+    def get_genre_info(self, max_workers: int | None = 8, use_cache: bool = True):
+        return extract_user_genre_info(self.username, max_workers, use_cache)
 
 
-def extract_user_films(url: str) -> dict:
-    """Extracts user films and their details from the given URL"""
-    FILMS_PER_PAGE = 12 * 6
+def extract_user_films(url: str, as_dicts: bool = True) -> dict:
+    """
+    Extracts user films and their details from the given URL.
 
-    def process_page(page_number: int) -> dict:
-        """Fetches and processes a page of user films."""
-        dom = parse_url(get_page_url(url, page_number))
-        return extract_movies_from_user_watched(dom)
-
-    def calculate_statistics(movies: dict) -> dict:
-        """Calculates film statistics including liked and rating percentages."""
-        liked_count = sum(movie["liked"] for movie in movies.values())
-        rating_count = len(
-            [
-                movie["rating"]
-                for movie in movies.values()
-                if movie["rating"] is not None
-            ]
-        )
+    With as_dicts=False the films are WatchedFilm records; the statistics
+    and partition_user_films accept either form.
+    """
+    movie_list = {"movies": {}}
+    for _, movies in iter_user_films(url, as_dicts):
+        movie_list["movies"] |= movies
 
-        count = len(movies)
-        liked_percentage = round(liked_count / count * 100, 2) if liked_count else 0.0
-        rating_percentage = 0.0
-        rating_average = 0.0
-
-        if rating_count:
-            ratings = [movie["rating"] for movie in movies.values() if movie["rating"]]
-            rating_percentage = round(rating_count / count * 100, 2)
-            rating_average = round(sum(ratings) / rating_count, 2)
-
-        return {
-            "count": count,
-            "liked_count": liked_count,
-            "rating_count": rating_count,
-            "liked_percentage": liked_percentage,
-            "rating_percentage": rating_percentage,
-            "rating_average": rating_average,
-        }
+    movie_list.update(calculate_film_statistics(movie_list["movies"]))
+    return movie_list
 
-    movie_list = {"movies": {}}
-    page = 0
 
+def iter_user_films(url: str, as_dicts: bool = True) -> Iterator[tuple[int, dict]]:
+    """Yields (page_no, films) for each page of a films URL, as extract_user_films."""
+    FILMS_PER_PAGE = 12 * 6
+
+    page = 0
     while True:
         page += 1
-        movies = process_page(page)
-        movie_list["movies"] |= movies
+        dom = parse_url(get_page_url(url, page))
+        movies = extract_movies_from_user_watched(dom, as_dicts=as_dicts)
+        yield page, movies
 
         if len(movies) < FILMS_PER_PAGE:
-            stats = calculate_statistics(movie_list["movies"])
-            movie_list.update(stats)
             break
 
-    return movie_list
 
+def calculate_film_statistics(movies: dict) -> dict:
+    """Calculates film statistics including liked and rating percentages."""
+    liked_count = rating_count = 0
+    rating_sum = 0.0
+    for movie in movies.values():
+        liked_count += movie["liked"]
+        if movie["rating"] is not None:
+            rating_count += 1
+            rating_sum += movie["rating"]
+
+    count = len(movies)
+    liked_percentage = round(liked_count / count * 100, 2) if liked_count else 0.0
+    rating_percentage = 0.0
+    rating_average = 0.0
+
+    if rating_count:
+        rating_percentage = round(rating_count / count * 100, 2)
+        rating_average = round(rating_sum / rating_count, 2)
+
+    return {
+        "count": count,
+        "liked_count": liked_count,
+        "rating_count": rating_count,
+        "liked_percentage": liked_percentage,
+        "rating_percentage": rating_percentage,
+        "rating_average": rating_average,
+    }
+
+
+def partition_user_films(movies: dict) -> dict:
+    """
+    Splits watched films (as in extract_user_films) by the viewer's rating.
 
-def extract_movies_from_user_watched(dom, max=12 * 6) -> dict:
+    Returns:
+        dict: 'rated' maps each rating (0.5-5.0) to its films, 'not_rated'
+        holds the unrated films and 'liked' the liked ones of any rating.
+        Every bucket has the shape of extract_user_films.
+    """
+    rated = {rating: {} for rating in RATINGS}
+    not_rated, liked = {}, {}
+    for slug, movie in movies.items():
+        bucket = rated.get(movie["rating"], not_rated)
+        bucket[slug] = movie
+        if movie["liked"]:
+            liked[slug] = movie
+
+    def with_statistics(bucket: dict) -> dict:
+        return {"movies": bucket, **calculate_film_statistics(bucket)}
+
+    return {
+        "rated": {rating: with_statistics(bucket) for rating, bucket in rated.items()},
+        "not_rated": with_statistics(not_rated),
+        "liked": with_statistics(liked),
+    }
+
+
+def extract_movies_from_user_watched(dom, max=12 * 6, as_dicts=True) -> dict:
     """
     supports user watched films section
+    as_dicts=False keeps WatchedFilm records instead of dicts
     """
 
     def _extract_rating_and_like_status(container):
@@ -139,16 +196,14 @@ def extract_movies_from_user_watched(dom, max=12 * 6) -> dict:
 
     def _get_movie_details(container):
         """Extract complete movie information including rating and like status."""
-        movie_data = extract_movie_info(container)
+        movie_data = extract_movie_info(container, as_dicts=False)
         if not movie_data:
             return None
 
-        movie_id, data = movie_data
+        movie_id, film = movie_data
         rating, liked = _extract_rating_and_like_status(container)
-
-        data.update({"id": movie_id, "rating": rating, "liked": liked})
-
-        return data["slug"], data
+        watched = WatchedFilm(movie_id, film.slug, film.name, film.year, rating, liked)
+        return film.slug, watched.to_dict() if as_dicts else watched
 
     def _find_movie_containers(dom):
         """Find movie containers using modern structure with legacy fallback."""
@@ -179,20 +234,65 @@ def extract_movies_from_user_watched(dom, max=12 * 6) -> dict:
     return movies
 
 
-def extract_user_genre_info(username: str) -> dict:
-    ret = {}
-    for genre in GENRES:
-        dom = parse_url(f"{DOMAIN}/{username}/films/genre/{genre}/")
-        data = dom.find(
-            "span",
-            {
-                "class": ["replace-if-you"],
-            },
+def extract_user_genre_info(
+    username: str, max_workers: int | None = 8, use_cache: bool = True
+) -> dict:
+    """
+    Counts the user's watched films in every genre.
+
+    The genre pages are fetched concurrently and only the count next to
+    span.replace-if-you is read from each. Results are cached per user for
+    GENRE_INFO_CACHE.ttl seconds.
+    """
+    key = username.lower()
+    if use_cache and (cached := GENRE_INFO_CACHE.get(key)) is not None:
+        return dict(cached)
+
+    def fetch_genre_count(genre: str) -> int:
+        return extract_genre_count(
+            fetch_text(f"{DOMAIN}/{username}/films/genre/{genre}/")
         )
-        data = data.next_sibling.replace(",", "")
-        try:
-            ret[genre] = next(int(s) for s in data.split() if s.isdigit())
-        except IndexError:
-            ret[genre] = 0
 
-    return ret
+    counts = map_ordered(fetch_genre_count, GENRES, max_workers)
+    ret = dict(zip(GENRES, counts, strict=True))
+    GENRE_INFO_CACHE.set(key, ret)
+    return dict(ret)
+
+
+def extract_genre_count(html: str) -> int:
+    """
+    Reads the watched film count from a user's genre page HTML.
+    Pages without the count heading have no films (0).
+    """
+    match = GENRE_COUNT_PATTERN.search(html)
+    if match is not None and (count := _first_number(match.group(1))) is not None:
+        return count
+
+    # Unexpected markup (e.g. the count wrapped in its own element), fall
+    # back to parsing the whole page.
+    span = BeautifulSoup(html, "lxml").find("span", {"class": ["replace-if-you"]})
+    if span is None:
+        return 0
+    text = " ".join(
+        sibling if isinstance(sibling, str) else sibling.get_text(" ")
+        for sibling in span.next_siblings
+    )
+    if (count := _first_number(text)) is None:
+        raise RuntimeError("Failed to extract genre count from DOM")
+    return count
+
+
+def _first_number(text: str) -> int | None:
+    numbers = [s for s in text.replace(",", "").split() if s.isdigit()]
+    return int(numbers[0]) if numbers else None
+
+
+def genre_info_many(
+    usernames: list[str], max_workers: int | None = 4, use_cache: bool = True
+) -> dict:
+    """Genre counts for many users, `max_workers` users at a time."""
+
+    def fetch(username: str) -> dict:
+        return extract_user_genre_info(username, use_cache=use_cache)
+
+    return dict(zip(usernames, map_ordered(fetch, usernames, max_workers), strict=True))
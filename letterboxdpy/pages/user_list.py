@@ -54,7 +54,7 @@ class UserList:
         return extract_tags(self.dom)
 
     def get_movies(self) -> dict:
-        return extract_movies(self.url, self.LIST_ITEMS_PER_PAGE)
+        return extract_movies(self.url, self.LIST_ITEMS_PER_PAGE, self.dom)
 
     def get_count(self) -> int:
         return extract_count(self.dom)
@@ -120,12 +120,19 @@ def extract_count(dom) -> int:
         raise RuntimeError("Failed to extract film count: " + str(e)) from e
 
 
-def extract_movies(list_url: str, items_per_page) -> dict:
+def extract_movies(list_url: str, items_per_page, first_dom=None) -> dict:
+    """
+    Extracts the movies of every page of a list.
+    `first_dom` is the already parsed list page, reused as page 1.
+    """
     data = {}
 
     page = 1
     while True:
-        dom = parse_url(get_page_url(list_url, page))
+        if page == 1 and first_dom is not None:
+            dom = first_dom
+        else:
+            dom = parse_url(get_page_url(list_url, page))
         movies = extract_movies_from_vertical_list(dom)
         data |= movies
 
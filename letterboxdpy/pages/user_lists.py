@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 from letterboxdpy.constants.project import DOMAIN
 from letterboxdpy.utils.lists_extractor import ListsExtractor
 
@@ -7,8 +9,15 @@ class UserLists:
         self.username = username
         self.url = f"{DOMAIN}/{self.username}/lists"
 
-    def get_lists(self, max_lists: int | None = None) -> dict:
-        return ListsExtractor.from_url(self.url, max_lists)
+    def get_lists(
+        self, max_lists: int | None = None, max_workers: int | None = None
+    ) -> dict:
+        return ListsExtractor.from_url(self.url, max_lists, max_workers)
+
+    def iter_lists(
+        self, max_lists: int | None = None, max_workers: int | None = None
+    ) -> Iterator[tuple[str, dict]]:
+        return ListsExtractor.iter_from_url(self.url, max_lists, max_workers)
 
 
 if __name__ == "__main__":
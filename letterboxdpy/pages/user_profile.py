@@ -1,8 +1,10 @@
 import re
+from collections.abc import Iterable, Iterator
 
 from letterboxdpy.avatar import Avatar
 from letterboxdpy.constants.forms.favorites import FAVORITE_ATTRS
-from letterboxdpy.constants.project import DOMAIN
+from letterboxdpy.constants.project import DOMAIN, RATINGS
+from letterboxdpy.core.concurrency import map_ordered
 from letterboxdpy.core.scraper import parse_url
 from letterboxdpy.utils.movies_extractor import extract_movie_info
 from letterboxdpy.utils.utils_file import JsonFile
@@ -56,6 +58,9 @@ class UserProfile:
     def get_diary_recent(self) -> dict:
         return extract_diary_recent(self.dom)
 
+    def get_rating_histogram(self) -> dict:
+        return extract_rating_histogram(self.dom)
+
 
 def extract_id(dom) -> int:
     """Extracts the user ID from the DOM and returns it."""
@@ -319,3 +324,54 @@ def extract_diary_recent(dom) -> dict:
                     )
             break
     return diary_recent
+
+
+def extract_rating_histogram(dom) -> dict:
+    """
+    Extracts the per-rating film counts of the profile's ratings chart.
+
+    The chart counts every rated film, so this matches a rating histogram
+    of the full films crawl at the cost of the profile page alone.
+
+    Returns:
+        dict: Count by rating (0.5 to 5.0), all zero without ratings.
+    """
+    histogram = dict.fromkeys(RATINGS, 0)
+    section = dom.find("section", {"class": ["ratings-histogram-chart"]})
+    if not section:
+        return histogram
+
+    try:
+        bars = section.find_all("li", {"class": ["rating-histogram-bar"]})
+        for index, bar in enumerate(bars[: len(RATINGS)]):
+            link = bar.find("a")
+            if not link:
+                continue  # bars without ratings have no link
+
+            match = re.search(r"/rated/(\d*\.?\d+)/", link.get("href", ""))
+            rating = float(match.group(1)) if match else RATINGS[index]
+            label = link.get("data-original-title") or link.get("title") or link.text
+            count = re.match(r"\s*([\d,]+)", label)
+            histogram[rating] = int(count.group(1).replace(",", "")) if count else 0
+    except (AttributeError, ValueError, KeyError) as e:
+        raise RuntimeError("Failed to extract rating histogram from DOM") from e
+
+    return histogram
+
+
+def iter_rating_histograms(
+    usernames: Iterable[str], max_workers: int | None = 4
+) -> Iterator[tuple[str, dict]]:
+    """Yields (username, histogram) per member in order, one profile page each."""
+
+    def fetch(username: str) -> tuple[str, dict]:
+        return username, UserProfile(username).get_rating_histogram()
+
+    return map_ordered(fetch, usernames, max_workers)
+
+
+def extract_rating_histograms(
+    usernames: Iterable[str], max_workers: int | None = 4
+) -> dict:
+    """Rating histograms of many members, by username."""
+    return dict(iter_rating_histograms(usernames, max_workers))
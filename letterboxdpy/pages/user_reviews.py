@@ -1,9 +1,18 @@
+from collections.abc import Iterator
+
 from letterboxdpy.constants.project import DOMAIN
 from letterboxdpy.core.scraper import parse_url
 from letterboxdpy.utils.movies_extractor import extract_movie_info
-from letterboxdpy.utils.utils_parser import parse_review_date, parse_review_text
+from letterboxdpy.utils.utils_parser import (
+    parse_iso_date,
+    parse_review_date,
+    parse_review_text,
+    parse_written_date,
+)
 from letterboxdpy.utils.utils_url import get_page_url
 
+REVIEW_LOG_TYPES = ("Watched", "Rewatched", "Added")
+
 
 class UserReviews:
     def __init__(self, username: str) -> None:
@@ -20,10 +29,22 @@ def extract_user_reviews(url: str) -> dict:
     and each value is a dictionary with details about the review,
     including movie information, review type, rating, review content, date (ISO string), etc.
     """
+    data = {"reviews": {}}
+    last_page = 1
+    for page, reviews in iter_user_reviews(url):
+        data["reviews"].update(reviews)
+        last_page = page
+
+    data["count"] = len(data["reviews"])
+    data["last_page"] = last_page
+    return data
+
+
+def iter_user_reviews(url: str) -> Iterator[tuple[int, dict]]:
+    """Yields (page_no, reviews) for each page of a reviews URL, as extract_user_reviews."""
     LOGS_PER_PAGE = 12
 
     page = 0
-    data = {"reviews": {}}
     while True:
         page += 1
         dom = parse_url(get_page_url(url, page))
@@ -41,6 +62,7 @@ def extract_user_reviews(url: str) -> dict:
             # No item (article) found in container.
             break
 
+        reviews = {}
         for log in logs:
             # Extract movie info using centralized logic
             container = (
@@ -81,33 +103,9 @@ def extract_user_reviews(url: str) -> dict:
             #            example for first review:  /username/film/movie_name/0/
             #            example for second review: /username/film/movie_name/1/
             #                the number is specified at the end of the url ---^
-            rating = log.find(
-                "span",
-                {
-                    "class": ["rating"],
-                },
-            )
-            rating = int(rating["class"][-1].split("-")[-1]) / 2.0 if rating else None
-            # float ^^^--- rating: the numerical value of the rating given in the review (0.5-5.0)
-            review, spoiler = parse_review_text(log)
-            # str ^^^--- review: the text content of the review.
-            #            spoiler warning is checked to include or exclude the first paragraph.
-            date = log.find(
-                "span",
-                {
-                    "class": ["date"],
-                },
-            )
-            log_type = date.find_previous_sibling().text.strip()
-            # str   ^^^--- log_type: Types of logs, such as:
-            #              'Rewatched': (in diary) review, watched and rewatched
-            #              'Watched':   (in diary) review and watched
-            #              'Added': (not in diary) review
-            date = parse_review_date(log_type, date)
-            # str ^^^--- date: the date of the review (ISO 8601 format).
-            #             example: '2024-01-01T00:00:00.000000Z'
+            details = parse_review_log(log)
 
-            data["reviews"][log_id] = {
+            reviews[log_id] = {
                 # static
                 "movie": {
                     "name": movie_name,
@@ -117,18 +115,65 @@ def extract_user_reviews(url: str) -> dict:
                     "link": movie_link,
                 },
                 # dynamic
-                "type": log_type,
+                "type": details["type"],
                 "no": log_no,
                 "link": log_link,
-                "rating": rating,
-                "review": {"content": review, "spoiler": spoiler},
-                "date": date,
+                "rating": details["rating"],
+                "review": details["review"],
+                "date": details["date"],
                 "page": page,
             }
 
+        yield page, reviews
+
         if len(logs) < LOGS_PER_PAGE:
-            data["count"] = len(data["reviews"])
-            data["last_page"] = page
             break
 
-    return data
+
+def parse_review_log(log) -> dict:
+    """
+    Parses the fields every review log (article) shares, whichever page
+    lists it: the user's reviews page or a film's reviews page.
+    """
+    rating = log.find(
+        "span",
+        {
+            "class": ["rating"],
+        },
+    )
+    rating = int(rating["class"][-1].split("-")[-1]) / 2.0 if rating else None
+    # float ^^^--- rating: the numerical value of the rating given in the review (0.5-5.0)
+    review, spoiler = parse_review_text(log)
+    # str ^^^--- review: the text content of the review.
+    #            spoiler warning is checked to include or exclude the first paragraph.
+    date = log.find(
+        "span",
+        {
+            "class": ["date"],
+        },
+    )
+    log_type = None
+    if date is not None:
+        log_type_elem = date.find_previous_sibling()
+        if log_type_elem and log_type_elem.text.strip() in REVIEW_LOG_TYPES:
+            log_type = log_type_elem.text.strip()
+        # str   ^^^--- log_type: Types of logs, such as:
+        #              'Rewatched': (in diary) review, watched and rewatched
+        #              'Watched':   (in diary) review and watched
+        #              'Added': (not in diary) review
+        #              None: film review pages may not label the log
+        if log_type:
+            date = parse_review_date(log_type, date)
+        elif date.time and date.time.get("datetime"):
+            date = parse_iso_date(date.time["datetime"])
+        else:
+            date = parse_written_date(date.text.strip())
+        # str ^^^--- date: the date of the review (ISO 8601 format).
+        #             example: '2024-01-01T00:00:00.000000Z'
+
+    return {
+        "type": log_type,
+        "rating": rating,
+        "review": {"content": review, "spoiler": spoiler},
+        "date": date,
+    }
@@ -3,9 +3,13 @@ Page parser for user watchlist.
 Extracts watchlist data by scraping Letterboxd HTML pages.
 """
 
+from collections.abc import Iterable, Iterator
+from functools import cached_property
+
+from bs4 import BeautifulSoup
+
 from letterboxdpy.constants.project import DOMAIN
 from letterboxdpy.core.scraper import parse_url
-from letterboxdpy.pages.user_list import extract_movies
 from letterboxdpy.utils.movies_extractor import (
     extract_movies_from_vertical_list,
 )
@@ -18,26 +22,176 @@ class UserWatchlist:
     def __init__(self, username: str) -> None:
         self.username = username
         self.url = f"{DOMAIN}/{self.username}/watchlist"
+        self._cached = None
 
     def __str__(self) -> str:
         return f"Not printable object of type: {self.__class__.__name__}"
 
+    @cached_property
+    def dom(self) -> BeautifulSoup:
+        """First watchlist page, shared by the count and the movies."""
+        return parse_url(self.url)
+
     def get_owner(self) -> str:
         return self.username
 
     def get_count(self) -> int:
-        return extract_count(self.url)
+        return extract_count(self.dom)
+
+    @cached_property
+    def full_watchlist(self) -> dict:
+        """Unfiltered watchlist, crawled once for the movies and the cache."""
+        return extract_watchlist(self.username, None, self.dom)
 
     def get_movies(self) -> dict:
-        return extract_movies(self.url, self.FILMS_PER_PAGE)
+        return {
+            movie_id: {
+                key: value
+                for key, value in movie_data.items()
+                if key not in ("page", "no")
+            }
+            for movie_id, movie_data in self.full_watchlist["data"].items()
+        }
 
-    def get_watchlist(self, filters: dict | None = None) -> dict:
+    def get_watchlist(
+        self,
+        filters: dict | None = None,
+        catalog: dict | None = None,
+        complete: Iterable[str] = (),
+    ) -> dict:
+        """
+        With a film catalog (e.g. CatalogSweep.films) the full watchlist is
+        crawled once and filters on the facets in `complete` (e.g.
+        CatalogSweep.complete), year and decade are evaluated in memory.
+        """
+        if catalog is not None:
+            cached = self.get_cached_watchlist(catalog, complete)
+            return cached.get_watchlist(filters)
+        if not filters:
+            return self.full_watchlist
         return extract_watchlist(self.username, filters)
 
+    def get_cached_watchlist(
+        self, catalog: dict, complete: Iterable[str] = ()
+    ) -> "CachedWatchlist":
+        if self._cached is None or self._cached.catalog is not catalog:
+            self._cached = CachedWatchlist(self.username, catalog, self.full_watchlist)
+        self._cached.complete = frozenset(complete)
+        return self._cached
+
+
+class CachedWatchlist:
+    """
+    A full watchlist crawled once and filtered in memory.
+
+    Entries are enriched with year and decade from their own data and with
+    genres (and any other facet) from the film catalog, so the filters of
+    extract_watchlist give the same result without further requests. A
+    catalog facet is only decided in memory when the catalog covers it
+    completely: otherwise films missing from it, or from a facet cut by
+    max_per_facet, would silently drop out, so such filters are sent to the
+    server instead.
+    """
+
+    def __init__(
+        self,
+        username: str,
+        catalog: dict,
+        watchlist: dict | None = None,
+        complete: Iterable[str] = (),
+    ) -> None:
+        """
+        Args:
+            username: Watchlist owner.
+            catalog: Film id -> film dict with a 'facets' list, as built by
+                CatalogSweep (e.g. 'genre:horror', 'year:1999').
+            watchlist: Unfiltered extract_watchlist result, crawled if None.
+            complete: Catalog facets swept completely (CatalogSweep.complete).
+        """
+        self.username = username
+        self.catalog = catalog
+        self.complete = frozenset(complete)
+        self.watchlist = watchlist or extract_watchlist(username)
+        self.facets = {
+            movie_id: film_facets(movie_data, catalog.get(movie_id))
+            for movie_id, movie_data in self.watchlist["data"].items()
+        }
+
+    @property
+    def uncatalogued(self) -> list[str]:
+        """Watchlist films missing from the catalog."""
+        return [movie_id for movie_id in self.facets if movie_id not in self.catalog]
+
+    def get_watchlist(self, filters: dict | None = None) -> dict:
+        """Same result as extract_watchlist(username, filters), from memory."""
+        rules = parse_watchlist_filters(filters)
+        if any(
+            not facet.startswith(OWN_FACETS) and facet not in self.complete
+            for facet, _ in rules
+        ):
+            return extract_watchlist(self.username, filters)
+
+        matches = [
+            (movie_id, movie_data)
+            for movie_id, movie_data in self.watchlist["data"].items()
+            if match_watchlist_filters(self.facets[movie_id], rules)
+        ]
+
+        count = len(matches)
+        per_page = UserWatchlist.FILMS_PER_PAGE
+        return {
+            "available": count > 0,
+            "count": count,
+            # The crawl stops on the first short page, which is an empty one
+            # when the count is a multiple of the page size.
+            "last_page": count // per_page + 1,
+            "filters": filters,
+            "data": {
+                movie_id: {**movie_data, "page": i // per_page + 1, "no": count - i}
+                for i, (movie_id, movie_data) in enumerate(matches)
+            },
+        }
 
-def extract_count(url: str) -> int:
+
+# Facets every watchlist entry carries itself, whether catalogued or not.
+OWN_FACETS = ("year:", "decade:")
+
+
+def film_facets(movie_data: dict, catalog_film: dict | None) -> set[str]:
+    """Facets of a watchlist film: its year and decade plus catalog facets."""
+    facets = set(catalog_film.get("facets", ())) if catalog_film else set()
+    year = movie_data.get("year") or (catalog_film or {}).get("year")
+    if year:
+        facets |= {f"year:{year}", f"decade:{year // 10 * 10}"}
+    return facets
+
+
+def parse_watchlist_filters(filters: dict | None) -> list[tuple[str, bool]]:
+    """
+    Turns a watchlist filter dict into (facet, wanted) rules.
+    {'genre': ['action', '-drama'], 'decade': '1990s'} ->
+    [('genre:action', True), ('genre:drama', False), ('decade:1990', True)]
+    """
+    rules = []
+    for key, values in (filters or {}).items():
+        if not isinstance(values, list):
+            values = [values]
+        for value in map(str, values):
+            wanted = not value.startswith("-")
+            value = value.lstrip("-")
+            if key == "decade":
+                value = value.removesuffix("s")
+            rules.append((f"{key}:{value}", wanted))
+    return rules
+
+
+def match_watchlist_filters(facets: set[str], rules: list[tuple[str, bool]]) -> bool:
+    """Checks film facets against every (facet, wanted) rule."""
+    return all((facet in facets) == wanted for facet, wanted in rules)
+
+
+def extract_count(dom) -> int:
     """Extracts the number of films from the watchlist page's DOM."""
-    dom = parse_url(url)
 
     watchlist_div = dom.find("div", class_="s-watchlist-content")
     if watchlist_div and "data-num-entries" in watchlist_div.attrs:
@@ -52,9 +206,12 @@ def extract_count(url: str) -> int:
     raise ValueError("Watchlist count could not be extracted from DOM")
 
 
-def extract_watchlist(username: str, filters: dict | None = None) -> dict:
+def extract_watchlist(
+    username: str, filters: dict | None = None, first_dom=None
+) -> dict:
     """
     Extracts a user's watchlist from the platform.
+    `first_dom` is the already parsed first page of the same (filtered) URL.
 
     filter examples:
         - keys: decade, year, genre
@@ -77,6 +234,33 @@ def extract_watchlist(username: str, filters: dict | None = None) -> dict:
         "data": {},
     }
 
+    page = 1
+    no = 1
+    for page, movies_on_page in iter_watchlist(username, filters, first_dom):
+        for movie_id, movie_data in movies_on_page.items():
+            movie_data.update({"page": page, "no": no})
+            data["data"][movie_id] = movie_data
+            no += 1
+
+    # Set the count of films and availability
+    data["count"] = len(data["data"])
+    data["available"] = data["count"] > 0
+    data["last_page"] = page
+
+    # Reverse numbering for films
+    for fv in data["data"].values():
+        fv.update({"no": data["count"] - fv["no"] + 1})
+
+    return data
+
+
+def iter_watchlist(
+    username: str, filters: dict | None = None, first_dom=None, as_dicts: bool = True
+) -> Iterator[tuple[int, dict]]:
+    """
+    Yields (page_no, films) for each watchlist page, as extract_movies_from_vertical_list.
+    Same filters as `extract_watchlist`; as_dicts=False yields FilmRef records.
+    """
     FILMS_PER_PAGE = 28  # Total films per page (7 rows * 4 columns)
     BASE_URL = f"{DOMAIN}/{username}/watchlist/"
 
@@ -91,27 +275,14 @@ def extract_watchlist(username: str, filters: dict | None = None) -> dict:
         BASE_URL += f
 
     page = 1
-    no = 1
     while True:
-        dom = parse_url(get_page_url(BASE_URL, page))
-        movies_on_page = extract_movies_from_vertical_list(dom)
-
-        for movie_id, movie_data in movies_on_page.items():
-            movie_data.update({"page": page, "no": no})
-            data["data"][movie_id] = movie_data
-            no += 1
+        if page == 1 and first_dom is not None:
+            dom = first_dom
+        else:
+            dom = parse_url(get_page_url(BASE_URL, page))
+        movies_on_page = extract_movies_from_vertical_list(dom, as_dicts=as_dicts)
+        yield page, movies_on_page
 
         if len(movies_on_page) < FILMS_PER_PAGE:
             break
         page += 1
-
-    # Set the count of films and availability
-    data["count"] = len(data["data"])
-    data["available"] = data["count"] > 0
-    data["last_page"] = page
-
-    # Reverse numbering for films
-    for fv in data["data"].values():
-        fv.update({"no": data["count"] - fv["no"] + 1})
-
-    return data
@@ -1,7 +1,8 @@
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from itertools import islice
-from typing import Any
+from typing import Any, ClassVar
 
 from bs4 import Tag
 from fastfingertips.string_utils import extract_number_from_text
@@ -10,6 +11,8 @@ from letterboxdpy.avatar import Avatar
 from letterboxdpy.constants.project import DOMAIN
 from letterboxdpy.core.encoder import Encoder
 from letterboxdpy.core.scraper import parse_url, url_encode
+from letterboxdpy.utils.title_index import TitleIndex
+from letterboxdpy.utils.utils_cache import TTLCache
 from letterboxdpy.utils.utils_file import JsonFile
 from letterboxdpy.utils.utils_parser import extract_and_convert_shorthand
 from letterboxdpy.utils.utils_string import extract_name_year_from_movie_title
@@ -36,6 +39,23 @@ class Search:
     RESULTS_PER_PAGE = 20
     DEFAULT_NUM_PAGES = DEFAULT_NUM_RESULTS // RESULTS_PER_PAGE
 
+    # Parsers for mixed (ALL/FULL_TEXT) results, looked up by the modifier
+    # class of the <li>, or else by the classes of its <article>.
+    LI_CLASS_PARSERS: ClassVar[dict[str, str]] = {
+        "-production": "parse_film",
+        "-viewing": "parse_review",
+        "-list": "parse_list",
+        "-contributor": "parse_cast_crew",
+        "-person": "parse_member",
+        "-tag": "parse_tag",
+    }
+    ARTICLE_CLASS_PARSERS: ClassVar[dict[tuple[str, ...], str]] = {
+        ("card-summary-journal-article",): "parse_article",
+        ("card-summary", "-graph"): "parse_episode",
+        ("card-summary", "js-card-summary"): "parse_story",
+        ("card-summary", "-graph", "js-card-summary"): "parse_story",
+    }
+
     def __init__(
         self,
         query: str,
@@ -69,8 +89,13 @@ class Search:
         return self.get_results(num_pages * self.RESULTS_PER_PAGE)
 
     def get_results(self, num_results: int = DEFAULT_NUM_RESULTS) -> dict[str, Any]:
-        result_item_elems = islice(self.extract_search_results(), num_results)
+        result_item_elems = islice(
+            self.extract_search_results(num_results), num_results
+        )
         result_items = map(self.get_parse_func_from_filter(), result_item_elems)
+        return self.build_results(list(result_items))
+
+    def build_results(self, result_items: list[dict]) -> dict[str, Any]:
         results = [
             {"no": i + 1, "page": (i // self.RESULTS_PER_PAGE) + 1, **result}
             for i, result in enumerate(result_items)
@@ -85,19 +110,36 @@ class Search:
             "results": results,
         }
 
-    def extract_search_results(self) -> Iterator[Tag]:
-        cursor: str | None = None
-        while True:
-            url = self.get_search_page_url(cursor)
-            dom = parse_url(url)
-            result_elem = dom.html.body.find("ul", recursive=False)
-            if result_elem is None:
-                break
-            result_item_elems = iter(result_elem.find_all("li", recursive=False))
-            while (result_item := next(result_item_elems, None)) is not None:
-                yield result_item
-            if (cursor := self.get_cursor(result_elem)) is None:
-                break
+    def extract_search_results(self, max_results: int | None = None) -> Iterator[Tag]:
+        """
+        Yields result items page by page, following the cursor.
+
+        The next page is requested as soon as the cursor is read, so it
+        downloads while the current page is consumed. Once `max_results`
+        items have been seen no further page is requested.
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            seen = 0
+            next_page = executor.submit(parse_url, self.get_search_page_url(None))
+            while next_page is not None:
+                dom = next_page.result()
+                result_elem = dom.html.body.find("ul", recursive=False)
+                if result_elem is None:
+                    break
+                result_item_elems = result_elem.find_all("li", recursive=False)
+                seen += len(result_item_elems)
+
+                cursor = self.get_cursor(result_elem)
+                if cursor is None or (max_results and seen >= max_results):
+                    next_page = None
+                else:
+                    next_page = executor.submit(
+                        parse_url, self.get_search_page_url(cursor)
+                    )
+                yield from result_item_elems
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def get_cursor(self, result_elem: Tag) -> str | None:
         return None if (cursor := result_elem.get("data-cursor")) == "" else cursor
@@ -133,20 +175,10 @@ class Search:
 
     def parse_unknown(self, result_item_elem: Tag) -> dict[str, Any]:
         # Determine the appropriate parsing function by checking the classes on <li> or <article>
-        li_class = result_item_elem.get("class")
-        match li_class:
-            case [_, "-production"]:
-                return self.parse_film(result_item_elem)
-            case [_, "-viewing"]:
-                return self.parse_review(result_item_elem)
-            case [_, "-list"]:
-                return self.parse_list(result_item_elem)
-            case [_, "-contributor", _]:
-                return self.parse_cast_crew(result_item_elem)
-            case [_, "-person"]:
-                return self.parse_member(result_item_elem)
-            case [_, "-tag"]:
-                return self.parse_tag(result_item_elem)
+        li_class = result_item_elem.get("class") or []
+        parser = self.LI_CLASS_PARSERS.get(li_class[1]) if len(li_class) > 1 else None
+        if parser is not None:
+            return getattr(self, parser)(result_item_elem)
 
         article_elem = result_item_elem.find("article")
         if article_elem is None:
@@ -154,20 +186,10 @@ class Search:
                 "Unknown search result type: no identifiable classes or article element"
             )
 
-        article_class = article_elem.get("class")
-        match article_class:
-            case ["card-summary-journal-article"]:
-                return self.parse_article(result_item_elem)
-            case ["card-summary", "-graph"]:
-                return self.parse_episode(result_item_elem)
-            case ["card-summary", "js-card-summary"] | [
-                "card-summary",
-                "-graph",
-                "js-card-summary",
-            ]:
-                return self.parse_story(result_item_elem)
-            case _:
-                raise ValueError
+        parser = self.ARTICLE_CLASS_PARSERS.get(tuple(article_elem.get("class", ())))
+        if parser is None:
+            raise ValueError
+        return getattr(self, parser)(result_item_elem)
 
     def parse_film(self, result_item_elem: Tag) -> dict[str, Any]:
         film_container = result_item_elem.find("div", class_="react-component figure")
@@ -431,6 +453,86 @@ class Search:
         }
 
 
+class MultiSearch:
+    """
+    Runs one query through several search filters concurrently.
+
+    Per-filter results are cached for `cache.ttl` seconds, keyed by
+    (query, filter, adult), and shared by every MultiSearch instance.
+    """
+
+    DEFAULT_FILTERS = (SearchFilter.FILMS, SearchFilter.LISTS, SearchFilter.MEMBERS)
+    cache = TTLCache(ttl=300)
+
+    def __init__(
+        self,
+        query: str,
+        filters: Iterable[SearchFilter | str] = DEFAULT_FILTERS,
+        adult: bool = True,
+        max_workers: int | None = None,
+    ):
+        if not isinstance(query, str):
+            raise TypeError("query must be a string")
+
+        self.query = query
+        self.filters = list(dict.fromkeys(map(SearchFilter, filters)))
+        self.adult = adult
+        self.max_workers = max_workers or len(self.filters)
+
+    def get_results(
+        self, num_results: int = Search.DEFAULT_NUM_RESULTS
+    ) -> dict[str, Any]:
+        """
+        Returns up to `num_results` results per filter. `results` merges them
+        in filter order, each tagged with its filter; `by_filter` keeps the
+        per-filter Search.get_results output.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            filter_results = executor.map(
+                lambda search_filter: self.get_filter_results(
+                    search_filter, num_results
+                ),
+                self.filters,
+            )
+            by_filter = {
+                search_filter.value: data
+                for search_filter, data in zip(
+                    self.filters, filter_results, strict=True
+                )
+            }
+
+        results = [
+            {"filter": name, **result}
+            for name, data in by_filter.items()
+            for result in data["results"]
+        ]
+        return {
+            "available": len(results) > 0,
+            "query": url_encode(self.query),
+            "filters": list(by_filter),
+            "count": len(results),
+            "results": results,
+            "by_filter": by_filter,
+        }
+
+    def get_filter_results(
+        self, search_filter: SearchFilter, num_results: int
+    ) -> dict[str, Any]:
+        search = Search(self.query, search_filter, adult=self.adult)
+        key = (search.query, search.search_filter.value, self.adult)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            fetched_for, data = cached
+            # Enough results cached, or the search had no more to give.
+            if fetched_for >= num_results or data["count"] < fetched_for:
+                return search.build_results(data["results"][:num_results])
+
+        data = search.get_results(num_results)
+        self.cache.set(key, (num_results, data))
+        return data
+
+
 # -- FUNCTIONS --
 
 
@@ -457,6 +559,94 @@ def get_film_slug_from_title(title: str) -> str | None:
         return None
 
 
+def resolve_titles(
+    rows: Iterable[str | dict | tuple],
+    index: TitleIndex | None = None,
+    min_score: float = 0.8,
+    max_workers: int = 8,
+    num_results: int = 5,
+) -> list[dict]:
+    """
+    Resolves many film titles to slugs, e.g. the rows of a CSV import.
+
+    Each title is matched against the local `index` first (built from
+    Films/CatalogSweep results). Titles without a match of at least
+    `min_score` are searched on Letterboxd concurrently, and the best of
+    their first `num_results` film results is kept.
+
+    Args:
+        rows: Titles as "Title", "Title (Year)", (title, year) or
+            {"title": ..., "year": ...}.
+        index: Local TitleIndex. None = network search only.
+        min_score: Lowest confidence accepted, from the index or a search.
+        max_workers: Concurrent network searches.
+        num_results: Search results scored per missed title.
+
+    Returns:
+        list: One {"title", "year", "slug", "score", "source", "error"} dict
+        per row, in order. `source` is "index", "search" or None when
+        unresolved; `error` tells why a title's search failed.
+    """
+
+    def parse_row(row: str | dict | tuple) -> tuple[str, int | None]:
+        if isinstance(row, dict):
+            title, year = row.get("title") or row.get("name") or "", row.get("year")
+        elif isinstance(row, str):
+            title, year = row, None
+        else:
+            title, year = (*row, None)[:2]
+
+        title, title_year = extract_name_year_from_movie_title(title.strip())
+        try:
+            year = int(year) if year else None
+        except (TypeError, ValueError):
+            year = None  # malformed year cell
+        return title, year or title_year
+
+    def search_title(query: tuple[str, int | None]) -> tuple[dict | None, str | None]:
+        title, year = query
+        try:
+            results = Search(title, SearchFilter.FILMS).get_results(num_results)
+        except Exception as e:
+            # One failed search leaves its title unresolved, not the whole batch.
+            return None, str(e)
+        match = TitleIndex(results["results"]).match(title, year, min_score)
+        return match, None
+
+    queries = [parse_row(row) for row in rows]
+
+    matches, errors = {}, {}
+    if index is not None:
+        for query in dict.fromkeys(queries):
+            if (match := index.match(*query, min_score=min_score)) is not None:
+                matches[query] = {**match, "source": "index"}
+
+    misses = [query for query in dict.fromkeys(queries) if query not in matches]
+    if misses:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            found = executor.map(search_title, misses)
+            for query, (match, error) in zip(misses, found, strict=True):
+                if match is not None:
+                    matches[query] = {**match, "source": "search"}
+                elif error is not None:
+                    errors[query] = error
+
+    resolved = []
+    for query in queries:
+        match = matches.get(query, {})
+        resolved.append(
+            {
+                "title": query[0],
+                "year": query[1],
+                "slug": match.get("slug"),
+                "score": match.get("score", 0.0),
+                "source": match.get("source"),
+                "error": errors.get(query),
+            }
+        )
+    return resolved
+
+
 if __name__ == "__main__":
     from fastfingertips.terminal_utils import setup_encoding
 
@@ -490,6 +680,12 @@ if __name__ == "__main__":
     print("\nFilm search results (max 3):")
     print(JsonFile.stringify(q2.get_results(3), indent=2))
 
+    # Example: Films, lists and members at once
+    q3 = MultiSearch("V for Vendetta")
+    print("\nMulti search results (max 2 per filter):")
+    for result in q3.get_results(2)["results"]:
+        print(result["filter"], result["url"])
+
     # Example: Get film slug from title
     print("\n--- Slug Examples ---")
     print("slug 1:", get_film_slug_from_title("V for Vendetta"))
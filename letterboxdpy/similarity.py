@@ -0,0 +1,382 @@
+"""
+Taste similarity between members from a sparse member x film rating matrix.
+
+Members and films are interned to dense ids and the ratings kept as CSR
+(by member) and CSC (by film) arrays. Similarities are computed for blocks
+of members at a time: every rating of the block is paired with the other
+ratings of the same film through the CSC arrays, and the pair sums are
+reduced with `np.bincount`. Blocks are sized by their number of pairs, so
+memory stays bounded whatever the size of the matrix, and no Python loop
+runs per rating or per pair.
+
+Requires the optional numpy package: pip install letterboxdpy[stats]
+"""
+
+import importlib.util
+from array import array
+from collections.abc import Iterable, Iterator
+
+from letterboxdpy.constants.project import DOMAIN
+from letterboxdpy.core.concurrency import map_ordered
+from letterboxdpy.pages.user_films import extract_user_films
+from letterboxdpy.pages.user_network import extract_network_usernames
+from letterboxdpy.utils.interner import Interner
+
+try:
+    import numpy as np
+except ImportError:  # optional, see require_numpy
+    np = None
+
+METRICS = ("cosine", "pearson")
+
+
+def require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "Similarity requires the 'numpy' package: pip install letterboxdpy[stats]"
+        )
+
+
+def _has_scipy() -> bool:
+    return importlib.util.find_spec("scipy") is not None
+
+
+def _ranges(starts, lengths):
+    # Concatenation of range(start, start + length) for every pair.
+    offsets = np.cumsum(lengths) - lengths
+    return np.arange(int(lengths.sum())) + np.repeat(starts - offsets, lengths)
+
+
+class RatingMatrix:
+    """
+    Sparse member x film matrix of the ratings of many members.
+
+    Films are keyed by their Letterboxd id; unrated films are skipped.
+    With scipy installed, blocks are computed with sparse x dense products,
+    which is several times faster than the NumPy-only pair expansion.
+    """
+
+    def __init__(self, use_scipy: bool | None = None) -> None:
+        self.use_scipy = _has_scipy() if use_scipy is None else use_scipy
+        self.users = Interner()
+        self.films = Interner()
+        self._user_ids = array("I")
+        self._film_ids = array("I")
+        self._ratings = array("f")
+        self._arrays = None
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def add(self, username: str, movies: dict) -> int:
+        """
+        Adds the ratings of one member.
+
+        Args:
+            movies: Watched films as in extract_user_films()["movies"], dicts
+                or records.
+
+        Returns:
+            int: The number of ratings added.
+        """
+        if username in self.users:
+            raise ValueError(f"Ratings of '{username}' were already added")
+        user_id = self.users.intern(username)
+        count = 0
+        for movie in movies.values():
+            if movie["rating"] is not None and movie["id"]:
+                self._user_ids.append(user_id)
+                self._film_ids.append(self.films.intern(movie["id"]))
+                self._ratings.append(movie["rating"])
+                count += 1
+        self._arrays = None
+        return count
+
+    def add_many(self, films: Iterable[tuple[str, dict]]) -> None:
+        """Adds (username, movies) pairs, e.g. dict(films).items() from a cache."""
+        for username, movies in films:
+            self.add(username, movies)
+
+    def csr(self) -> tuple:
+        """(indptr, film ids, ratings) of the ratings sorted by member."""
+        return self._build()["csr"]
+
+    def csc(self) -> tuple:
+        """(indptr, member ids, ratings) of the ratings sorted by film."""
+        return self._build()["csc"]
+
+    def to_scipy(self):
+        """The matrix as a scipy.sparse.csr_matrix (members x films)."""
+        try:
+            from scipy.sparse import csr_matrix
+        except ImportError as e:
+            raise ImportError(
+                "to_scipy requires the 'scipy' package: pip install scipy"
+            ) from e
+        indptr, films, ratings = self.csr()
+        return csr_matrix(
+            (ratings, films, indptr), shape=(len(self.users), len(self.films))
+        )
+
+    def _sparse(self) -> tuple:
+        ratings = self.to_scipy()
+        present = ratings.copy()
+        present.data = np.ones_like(present.data)
+        squares = ratings.copy()
+        squares.data = squares.data**2
+        return ratings, present, squares
+
+    def _id(self, username: str) -> int:
+        user_id = self.users.get(username)
+        if user_id is None:
+            raise KeyError(f"No ratings were added for '{username}'")
+        return user_id
+
+    def _build(self) -> dict:
+        if self._arrays is not None:
+            return self._arrays
+        require_numpy()
+        users = np.frombuffer(self._user_ids, np.uint32).astype(np.intp)
+        films = np.frombuffer(self._film_ids, np.uint32).astype(np.intp)
+        ratings = np.frombuffer(self._ratings, np.float32).astype(np.float64)
+        n_users, n_films = len(self.users), len(self.films)
+
+        def compress(major, minor, size: int) -> tuple:
+            order = np.lexsort((minor, major))
+            indptr = np.zeros(size + 1, np.intp)
+            np.cumsum(np.bincount(major, minlength=size), out=indptr[1:])
+            return indptr, minor[order], ratings[order]
+
+        csr = compress(users, films, n_users)
+        csc = compress(films, users, n_films)
+        film_sizes = np.diff(csc[0])
+        self._arrays = {
+            "csr": csr,
+            "csc": csc,
+            "norms": np.sqrt(np.bincount(users, ratings * ratings, n_users)),
+            # Pairs each member's ratings expand to, for sizing the blocks.
+            "pairs": np.bincount(users, film_sizes[films], n_users).astype(np.int64),
+        }
+        if self.use_scipy:
+            self._arrays["sparse"] = self._sparse()
+        return self._arrays
+
+    def iter_blocks(
+        self,
+        usernames: Iterable[str] | None = None,
+        max_pairs: int = 1 << 24,
+        max_rows: int = 128,
+    ) -> Iterator[tuple]:
+        """
+        Yields the similarities of blocks of members with every member.
+
+        Args:
+            usernames: Members to compute the rows of. None = all of them.
+            max_pairs: Rating pairs per block, bounds the temporary arrays
+                of the NumPy-only path.
+            max_rows: Members per block, bounds the (rows x members) results
+                and, with scipy, the dense (3 * rows x films) block.
+
+        Yields:
+            tuple: (member ids, {'cosine', 'pearson', 'overlap'}) with
+            arrays of shape (len(ids), members). 'overlap' counts the films
+            both members rated; Pearson is computed over those films and is
+            NaN with fewer than two.
+        """
+        arrays = self._build()
+        if usernames is None:
+            rows = np.arange(len(self.users))
+        else:
+            rows = np.array([self._id(name) for name in usernames], np.intp)
+        block = []
+        pairs = 0
+        for row in rows.tolist():
+            row_pairs = int(arrays["pairs"][row])
+            if block and (pairs + row_pairs > max_pairs or len(block) == max_rows):
+                yield np.array(block), self._block(np.array(block))
+                block, pairs = [], 0
+            block.append(row)
+            pairs += row_pairs
+        if block:
+            yield np.array(block), self._block(np.array(block))
+
+    def _block(self, rows) -> dict:
+        arrays = self._build()
+        if self.use_scipy:
+            overlap, sx, sy, sxy, sxx, syy = self._sums_scipy(rows)
+        else:
+            overlap, sx, sy, sxy, sxx, syy = self._sums(rows)
+        norms = arrays["norms"]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cosine = sxy / (norms[rows][:, None] * norms[None, :])
+            pearson = (overlap * sxy - sx * sy) / np.sqrt(
+                (overlap * sxx - sx * sx) * (overlap * syy - sy * sy)
+            )
+        pearson[overlap < 2] = np.nan
+        return {
+            "cosine": cosine,
+            "pearson": pearson,
+            "overlap": np.rint(overlap).astype(np.int64),
+        }
+
+    def _sums(self, rows) -> tuple:
+        # Pair sums over the films each block member shares with every member:
+        # count, x, y, xy, xx and yy, x being the block member's rating.
+        arrays = self._build()
+        indptr, row_films, row_ratings = arrays["csr"]
+        col_ptr, col_users, col_ratings = arrays["csc"]
+        shape = (len(rows), len(self.users))
+
+        lengths = indptr[rows + 1] - indptr[rows]
+        local = np.repeat(np.arange(len(rows)), lengths)
+        nonzero = _ranges(indptr[rows], lengths)
+        films, x = row_films[nonzero], row_ratings[nonzero]
+
+        film_lengths = col_ptr[films + 1] - col_ptr[films]
+        pairs = _ranges(col_ptr[films], film_lengths)
+        keys = np.repeat(local, film_lengths) * shape[1] + col_users[pairs]
+        x = np.repeat(x, film_lengths)
+        y = col_ratings[pairs]
+
+        def total(weights=None):
+            return np.bincount(keys, weights, shape[0] * shape[1]).reshape(shape)
+
+        return total(), total(x), total(y), total(x * y), total(x * x), total(y * y)
+
+    def _sums_scipy(self, rows) -> tuple:
+        # Same sums as _sums, as sparse x dense products with the block's
+        # ratings, presence and squared ratings as dense rows.
+        ratings, present, squares = self._build()["sparse"]
+        n = len(rows)
+        dense = np.vstack([m[rows].toarray() for m in (ratings, present, squares)]).T
+        by_present = (present @ dense).T
+        by_ratings = (ratings @ dense[:, : 2 * n]).T
+        by_squares = (squares @ dense[:, n : 2 * n]).T
+        return (
+            by_present[n : 2 * n],
+            by_present[:n],
+            by_ratings[n:],
+            by_ratings[:n],
+            by_present[2 * n :],
+            by_squares,
+        )
+
+    def compare(
+        self, username: str, others: Iterable[str] | None = None, min_overlap: int = 1
+    ) -> list[dict]:
+        """
+        Similarity of one member with others, most similar (cosine) first.
+
+        Returns:
+            list: Dicts with 'username', 'cosine', 'pearson' (None when
+            undefined) and 'overlap', for the others sharing at least
+            `min_overlap` rated films.
+        """
+        ((_, block),) = self.iter_blocks([username])
+        row = self._id(username)
+        ids = (
+            range(len(self.users))
+            if others is None
+            else [self._id(name) for name in others]
+        )
+        results = []
+        for other in ids:
+            if other == row or block["overlap"][0, other] < min_overlap:
+                continue
+            pearson = block["pearson"][0, other]
+            results.append(
+                {
+                    "username": self.users.name(other),
+                    "cosine": float(block["cosine"][0, other]),
+                    "pearson": None if np.isnan(pearson) else float(pearson),
+                    "overlap": int(block["overlap"][0, other]),
+                }
+            )
+        results.sort(key=lambda result: result["cosine"], reverse=True)
+        return results
+
+    def top_neighbours(
+        self,
+        k: int = 10,
+        metric: str = "cosine",
+        min_overlap: int = 5,
+        usernames: Iterable[str] | None = None,
+        max_pairs: int = 1 << 24,
+    ) -> dict[str, list[tuple[str, float, int]]]:
+        """
+        The k most similar members of each member.
+
+        Returns:
+            dict: username -> [(username, score, overlap)], best first;
+            members sharing fewer than `min_overlap` films are left out.
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unsupported metric '{metric}'. Use one of {METRICS}.")
+        neighbours = {}
+        for rows, block in self.iter_blocks(usernames, max_pairs):
+            scores = np.where(block["overlap"] >= min_overlap, block[metric], np.nan)
+            scores[np.arange(len(rows)), rows] = np.nan
+            scores = np.nan_to_num(scores, nan=-np.inf)
+            top = min(k, scores.shape[1])
+            best = np.argpartition(-scores, top - 1, axis=1)[:, :top]
+            best_scores = np.take_along_axis(scores, best, axis=1)
+            order = np.argsort(-best_scores, axis=1, kind="stable")
+            best = np.take_along_axis(best, order, axis=1)
+            for row_index, others in enumerate(best.tolist()):
+                neighbours[self.users.name(int(rows[row_index]))] = [
+                    (
+                        self.users.name(other),
+                        float(scores[row_index, other]),
+                        int(block["overlap"][row_index, other]),
+                    )
+                    for other in others
+                    if np.isfinite(scores[row_index, other])
+                ]
+        return neighbours
+
+
+def following_compatibility(
+    username: str,
+    films: dict | None = None,
+    max_workers: int | None = 4,
+    min_overlap: int = 1,
+) -> list[dict]:
+    """
+    Taste similarity of a member with everyone they follow.
+
+    Args:
+        films: Already crawled watched films by username (e.g. from an
+            earlier run); only the missing members are crawled.
+        max_workers: Members whose films are crawled in parallel.
+
+    Returns:
+        list: As RatingMatrix.compare, most similar first.
+    """
+    following = extract_network_usernames(username, "following")
+    films = dict(films or {})
+    missing = [name for name in [username, *following] if name not in films]
+
+    def crawl(name: str) -> dict:
+        return extract_user_films(f"{DOMAIN}/{name}/films", as_dicts=False)["movies"]
+
+    for name, movies in zip(
+        missing, map_ordered(crawl, missing, max_workers), strict=True
+    ):
+        films[name] = movies
+
+    matrix = RatingMatrix()
+    for name in [username, *following]:
+        matrix.add(name, films[name])
+    return matrix.compare(username, following, min_overlap)
+
+
+if __name__ == "__main__":
+    from fastfingertips.terminal_utils import setup_encoding
+
+    setup_encoding()
+
+    for result in following_compatibility("nmcassa")[:10]:
+        print(
+            f"{result['username']:<20} cosine {result['cosine']:.3f}  "
+            f"pearson {result['pearson']}  shared {result['overlap']}"
+        )
@@ -0,0 +1,399 @@
+"""
+Follow graph crawler for ego networks of many members.
+
+Expands members breadth-first (or by a priority) from one or more seeds,
+reading their following/followers pages concurrently under the scraper's
+shared connection limit. Usernames are interned to dense integer ids, the
+seen-set is a bitmap over those ids and edges are flat uint32 arrays, so a
+crawl of millions of members stays compact in memory and on disk.
+
+A checkpoint is a set of files sharing one base path:
+    <path>.json   counts, frontier, failures and the expanded-ids bitmap
+    <path>.names  one username per line, in id order (appended)
+    <path>.edges  little-endian uint32 (follower, followed) pairs (appended)
+The state file is replaced atomically after the appends, so a crash at any
+point resumes from the last complete save.
+
+Pages are fetched through Scraper, so Scraper.set_max_connections and
+Scraper.set_rate_limit (requests per second) bound a crawl together with
+every other request of the process.
+"""
+
+import base64
+import heapq
+import os
+import sys
+from array import array
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import accumulate, count
+
+from letterboxdpy.pages.user_network import extract_network_usernames
+from letterboxdpy.utils.interner import Interner
+from letterboxdpy.utils.utils_file import JsonFile
+
+SECTIONS = ("following", "followers")
+
+
+def fetch_usernames(
+    username: str, section: str, max_pages: int | None = None
+) -> list[str]:
+    """Usernames on the following or followers pages of a member."""
+    if section not in SECTIONS:
+        raise ValueError(f"Section must be one of {SECTIONS}")
+    return extract_network_usernames(username, section, limit=max_pages)
+
+
+class SeenSet:
+    """Set of non-negative integer ids stored as a bitmap."""
+
+    __slots__ = ("_bits", "_count")
+
+    def __init__(self, data: bytes = b"") -> None:
+        self._bits = bytearray(data)
+        self._count = int.from_bytes(self._bits, "little").bit_count()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, id_: int) -> bool:
+        byte = id_ >> 3
+        return byte < len(self._bits) and bool(self._bits[byte] >> (id_ & 7) & 1)
+
+    def add(self, id_: int) -> bool:
+        """Adds an id, returns False if it was already in the set."""
+        byte, mask = id_ >> 3, 1 << (id_ & 7)
+        if byte >= len(self._bits):
+            self._bits.extend(bytes(max(byte + 1 - len(self._bits), len(self._bits))))
+        if self._bits[byte] & mask:
+            return False
+        self._bits[byte] |= mask
+        self._count += 1
+        return True
+
+    def to_bytes(self) -> bytes:
+        return bytes(self._bits)
+
+
+class Frontier:
+    """Members waiting to be expanded, as (id, depth)."""
+
+    def __init__(self, key: Callable[[int, int], float] | None = None) -> None:
+        """
+        Args:
+            key: Priority of an (id, depth), lowest first. None = breadth-first.
+        """
+        self.key = key
+        self._queue: deque[tuple[int, int]] = deque()
+        self._heap: list[tuple[float, int, int, int]] = []
+        self._order = count()
+
+    def __len__(self) -> int:
+        return len(self._heap) if self.key else len(self._queue)
+
+    def push(self, id_: int, depth: int) -> None:
+        if self.key:
+            heapq.heappush(
+                self._heap, (self.key(id_, depth), next(self._order), id_, depth)
+            )
+        else:
+            self._queue.append((id_, depth))
+
+    def pop(self) -> tuple[int, int]:
+        if self.key:
+            _, _, id_, depth = heapq.heappop(self._heap)
+            return id_, depth
+        return self._queue.popleft()
+
+    def items(self) -> list[tuple[int, int]]:
+        """Waiting (id, depth) pairs, in no particular order."""
+        if self.key:
+            return [(id_, depth) for _, _, id_, depth in self._heap]
+        return list(self._queue)
+
+
+class SocialGraphCrawler:
+    """Crawls the follow graph around a set of seed members."""
+
+    def __init__(
+        self,
+        seeds: Iterable[str],
+        sections: Iterable[str] = ("following",),
+        max_depth: int = 1,
+        max_nodes: int | None = None,
+        max_pages: int | None = None,
+        max_workers: int = 4,
+        checkpoint: str | None = None,
+        checkpoint_every: int = 100,
+        priority: Callable[[str, int], float] | None = None,
+    ) -> None:
+        """
+        Args:
+            seeds: Usernames to start from (depth 0).
+            sections: 'following' and/or 'followers' pages read per member.
+            max_depth: Hops from the seeds to expand. 0 reads only the seeds.
+            max_nodes: Maximum number of members expanded, None = no limit.
+            max_pages: Maximum pages read per member and section.
+            max_workers: Members expanded at the same time.
+            checkpoint: Base path to save progress to and resume from.
+            checkpoint_every: Expanded members between two checkpoint saves.
+                Members that fail are retried once the frontier is drained,
+                and on the next resume if they fail again.
+            priority: Key of (username, depth), lowest expanded first.
+                None = breadth-first.
+        """
+        self.sections = tuple(dict.fromkeys(sections))
+        for section in self.sections:
+            if section not in SECTIONS:
+                raise ValueError(f"Section must be one of {SECTIONS}")
+
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.max_pages = max_pages
+        self.max_workers = max_workers
+        self.checkpoint = checkpoint
+        self.checkpoint_every = checkpoint_every
+
+        self.names = Interner()
+        self.edges = array("I")  # flat (follower, followed) id pairs
+        self.seen = SeenSet()  # queued or expanded
+        self.done = SeenSet()  # expanded
+        self.failed: dict[str, str] = {}
+        self.frontier = Frontier(
+            (lambda id_, depth: priority(self.names.name(id_), depth))
+            if priority
+            else None
+        )
+        self._in_flight: dict[int, int] = {}
+        self._retry: list[tuple[int, int]] = []
+        self._saved_names = 0
+        self._saved_edges = 0
+
+        if checkpoint and JsonFile.exists(checkpoint):
+            self.load(checkpoint)
+        for seed in seeds:
+            self.enqueue(seed, 0)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edges) // 2
+
+    def enqueue(self, username: str, depth: int) -> bool:
+        """Queues a member for expansion unless it was seen before."""
+        id_ = self.names.intern(username)
+        if not self.seen.add(id_):
+            return False
+        self.frontier.push(id_, depth)
+        return True
+
+    def run(self) -> "SocialGraphCrawler":
+        """Crawls until the frontier or the node budget is exhausted."""
+        for _ in self.iter_run():
+            pass
+        return self
+
+    def iter_run(self) -> Iterator[str]:
+        """Expands members, yielding each username once its edges are merged."""
+        completed = 0
+        retried = False
+
+        def budget_left() -> bool:
+            if self.max_nodes is None:
+                return True
+            return len(self.done) + len(self._in_flight) < self.max_nodes
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+
+            def submit_next() -> None:
+                while (
+                    len(running) < self.max_workers and self.frontier and budget_left()
+                ):
+                    id_, depth = self.frontier.pop()
+                    self._in_flight[id_] = depth
+                    future = executor.submit(self._crawl, self.names.name(id_))
+                    running[future] = id_
+
+            try:
+                submit_next()
+                while running:
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        id_ = running.pop(future)
+                        depth = self._in_flight.pop(id_)
+                        username = self.names.name(id_)
+                        try:
+                            self.merge(id_, depth, future.result())
+                        except Exception as e:
+                            self.failed[username] = str(e)
+                            self._retry.append((id_, depth))
+                            continue
+
+                        completed += 1
+                        if self.checkpoint and completed % self.checkpoint_every == 0:
+                            self.save(self.checkpoint)
+                        yield username
+                    submit_next()
+
+                    if not running and self._retry and not retried:
+                        # One more attempt for the failed members in this run.
+                        retried = True
+                        for id_, depth in self._retry:
+                            self.frontier.push(id_, depth)
+                        self._retry = []
+                        submit_next()
+            finally:
+                # Stopped early: members still running go back to the frontier.
+                for future, id_ in running.items():
+                    future.cancel()
+                    self.frontier.push(id_, self._in_flight.pop(id_))
+
+        if self.checkpoint:
+            self.save(self.checkpoint)
+
+    def _crawl(self, username: str) -> dict[str, list[str]]:
+        return {
+            section: fetch_usernames(username, section, self.max_pages)
+            for section in self.sections
+        }
+
+    def merge(self, id_: int, depth: int, result: dict[str, list[str]]) -> None:
+        """Adds the edges of an expanded member and queues its neighbours."""
+        # With both sections, an edge between two expanded members is seen
+        # twice; only the member expanded first records it.
+        both = len(self.sections) > 1
+        for section, usernames in result.items():
+            for username in usernames:
+                other = self.names.intern(username)
+                if both and other in self.done:
+                    continue
+                if section == "following":
+                    self.edges.extend((id_, other))
+                else:
+                    self.edges.extend((other, id_))
+                if depth < self.max_depth and self.seen.add(other):
+                    self.frontier.push(other, depth + 1)
+        self.done.add(id_)
+        self.failed.pop(self.names.name(id_), None)
+
+    def adjacency(self, reverse: bool = False) -> tuple[array, array]:
+        """
+        Compressed adjacency of the graph.
+
+        Returns:
+            tuple: (offsets, targets); the neighbours of id i are
+            targets[offsets[i]:offsets[i + 1]]. Neighbours are the members
+            followed by i, or with `reverse` the followers of i.
+        """
+        sources, targets = self.edges[0::2], self.edges[1::2]
+        if reverse:
+            sources, targets = targets, sources
+
+        # Stable sort of the edge indices by source, then prefix sums of
+        # the per-source counts; both run over whole arrays at C speed.
+        order = sorted(range(len(sources)), key=sources.__getitem__)
+        counts = Counter(sources)
+        offsets = array("Q", [0])
+        offsets.extend(accumulate(map(counts.__getitem__, range(len(self.names)))))
+        return offsets, array("I", map(targets.__getitem__, order))
+
+    def iter_edges(self) -> Iterator[tuple[str, str]]:
+        """Yields (follower, followed) username pairs."""
+        name = self.names.name
+        edges = self.edges
+        for i in range(0, len(edges), 2):
+            yield name(edges[i]), name(edges[i + 1])
+
+    def save(self, path: str) -> None:
+        """Saves the progress so the crawl can be resumed."""
+        with open(f"{path}.names", "a", encoding="utf-8") as f:
+            f.writelines(
+                f"{username}\n"
+                for username in self.names.names(
+                    range(self._saved_names, len(self.names))
+                )
+            )
+        with open(f"{path}.edges", "ab") as f:
+            new_edges = self.edges[2 * self._saved_edges :]
+            if sys.byteorder == "big":
+                new_edges.byteswap()
+            new_edges.tofile(f)
+
+        # Written aside and renamed last: its counts mark how much of the
+        # appended files is valid, and the bitmap changes with them.
+        temp = f"{path}.tmp"
+        JsonFile.save(
+            temp,
+            {
+                "names": len(self.names),
+                "edges": self.edge_count,
+                "done": base64.b64encode(self.done.to_bytes()).decode("ascii"),
+                "frontier": self.frontier.items()
+                + list(self._in_flight.items())
+                + self._retry,
+                "failed": self.failed,
+            },
+            indent=None,
+        )
+        JsonFile.replace(temp, path)
+        self._saved_names = len(self.names)
+        self._saved_edges = self.edge_count
+
+    def load(self, path: str) -> None:
+        """Restores the progress saved by `save`."""
+        state = JsonFile.load(path) or {}
+        name_count, edge_count = state.get("names", 0), state.get("edges", 0)
+
+        self.names = Interner()
+        with open(f"{path}.names", encoding="utf-8") as f:
+            for _, line in zip(range(name_count), f, strict=False):
+                self.names.intern(line.rstrip("\n"))
+
+        self.edges = array("I")
+        with open(f"{path}.edges", "rb") as f:
+            self.edges.fromfile(f, 2 * edge_count)
+        if sys.byteorder == "big":
+            self.edges.byteswap()
+
+        # Seen is every expanded or queued member.
+        done = base64.b64decode(state.get("done", ""))
+        self.done, self.seen = SeenSet(done), SeenSet(done)
+        self.failed = state.get("failed", {})
+        for id_, depth in state.get("frontier", []):
+            self.seen.add(id_)
+            self.frontier.push(id_, depth)
+
+        # Anything appended after the last state file is dropped on the next save.
+        self._truncate(path, name_count, edge_count)
+        self._saved_names, self._saved_edges = name_count, edge_count
+
+    @staticmethod
+    def _truncate(path: str, name_count: int, edge_count: int) -> None:
+        with open(f"{path}.edges", "r+b") as f:
+            f.truncate(8 * edge_count)
+        with open(f"{path}.names", "r+b") as f:
+            for _ in range(name_count):
+                f.readline()
+            f.truncate(f.tell())
+
+
+def remove_checkpoint(path: str) -> None:
+    """Deletes the files of a crawl checkpoint."""
+    JsonFile.delete(path)
+    for suffix in ("names", "edges"):
+        if os.path.exists(f"{path}.{suffix}"):
+            os.remove(f"{path}.{suffix}")
+
+
+if __name__ == "__main__":
+    from fastfingertips.terminal_utils import setup_encoding
+
+    setup_encoding()
+
+    crawler = SocialGraphCrawler(["nmcassa"], max_depth=1, max_nodes=50)
+    for username in crawler.iter_run():
+        print(f"{username:<24} {len(crawler)} members, {crawler.edge_count} edges")
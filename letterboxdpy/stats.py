@@ -0,0 +1,280 @@
+"""
+Vectorized statistics over watched films and diary entries.
+
+`film_arrays` and `diary_arrays` turn the output of extract_user_films and
+extract_user_diary (dicts or records) into NumPy columns, with NaN / NaT for
+missing ratings, runtimes and dates. The functions below work on those
+columns without Python loops. Counting functions take an optional `owners`
+array, a member index per row, and then count for every member at once:
+concatenate the columns of thousands of members (or read them from a
+columnar export) and get one row of counts per member.
+
+Requires the optional numpy package: pip install letterboxdpy[stats]
+"""
+
+from collections.abc import Iterable
+
+# Histogram column i counts RATINGS[i].
+from letterboxdpy.constants.project import RATINGS
+
+try:
+    import numpy as np
+except ImportError:  # optional, see require_numpy
+    np = None
+
+
+def require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "Vectorized statistics require the 'numpy' package: "
+            "pip install letterboxdpy[stats]"
+        )
+
+
+def film_arrays(movies: dict, catalog: dict | None = None) -> dict:
+    """
+    Columns of watched films, as in extract_user_films()["movies"].
+
+    Args:
+        catalog: Films by id with their average 'rating' (e.g. a catalog
+            sweep); adds an 'average' column for rating_deviations.
+
+    Returns:
+        dict: 'rating' (float32, NaN when unrated) and 'liked' (bool), plus
+        'average' (float32, NaN when unknown) with a catalog.
+    """
+    require_numpy()
+    count = len(movies)
+    arrays = {
+        "rating": _float_column((movie["rating"] for movie in movies.values()), count),
+        "liked": np.fromiter(
+            (movie["liked"] for movie in movies.values()), bool, count
+        ),
+    }
+    if catalog is not None:
+        arrays["average"] = _float_column(
+            (catalog.get(movie["id"], {}).get("rating") for movie in movies.values()),
+            count,
+        )
+    return arrays
+
+
+def diary_arrays(entries: dict) -> dict:
+    """
+    Columns of diary entries, as in extract_user_diary()["entries"].
+
+    Returns:
+        dict: 'date' (datetime64[D], NaT when missing), 'rating' and
+        'runtime' (float32, NaN when missing), 'liked', 'rewatched' and
+        'reviewed' (bool).
+    """
+    require_numpy()
+    count = len(entries)
+    actions = [entry["actions"] for entry in entries.values()]
+    return {
+        "date": np.array(
+            [(entry["date"] or "NaT")[:10] for entry in entries.values()],
+            "datetime64[D]",
+        ),
+        "rating": _float_column((action["rating"] for action in actions), count),
+        "runtime": _float_column(
+            (entry["runtime"] for entry in entries.values()), count
+        ),
+        **{
+            key: np.fromiter((action[key] for action in actions), bool, count)
+            for key in ("liked", "rewatched", "reviewed")
+        },
+    }
+
+
+def _float_column(values: Iterable, count: int):
+    return np.fromiter(
+        (np.nan if value is None else value for value in values), np.float32, count
+    )
+
+
+def film_statistics(arrays: dict) -> dict:
+    """The statistics of calculate_film_statistics, from film_arrays columns."""
+    ratings = arrays["rating"]
+    count = len(ratings)
+    liked_count = int(arrays["liked"].sum())
+    rated = ratings[~np.isnan(ratings)]
+    rating_count = len(rated)
+    return {
+        "count": count,
+        "liked_count": liked_count,
+        "rating_count": rating_count,
+        "liked_percentage": round(liked_count / count * 100, 2) if liked_count else 0.0,
+        "rating_percentage": (
+            round(rating_count / count * 100, 2) if rating_count else 0.0
+        ),
+        "rating_average": (
+            round(float(rated.sum()) / rating_count, 2) if rating_count else 0.0
+        ),
+    }
+
+
+def _count(keys, size: int, owners=None, n_owners: int | None = None):
+    # Counts integer keys in [0, size), per owner row when owners are given.
+    if owners is None:
+        return np.bincount(keys, minlength=size)
+    n_owners = n_owners or (int(owners.max()) + 1 if len(owners) else 0)
+    flat = np.asarray(owners, np.intp) * size + keys
+    return np.bincount(flat, minlength=n_owners * size).reshape(n_owners, size)
+
+
+def rating_histogram(ratings, owners=None, n_owners: int | None = None):
+    """
+    Counts of each half-star rating (column i counts RATINGS[i]).
+
+    Returns:
+        ndarray: 10 counts, or (n_owners, 10) counts with owners.
+    """
+    require_numpy()
+    valid = ~np.isnan(ratings)
+    bins = (ratings[valid] * 2).astype(np.intp) - 1
+    return _count(
+        bins, len(RATINGS), None if owners is None else owners[valid], n_owners
+    )
+
+
+def histogram_mean(histogram):
+    """Mean rating of each histogram row (NaN without ratings)."""
+    histogram = np.asarray(histogram)
+    totals = histogram.sum(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return histogram @ np.array(RATINGS) / totals
+
+
+def histogram_percentiles(histogram, q: Iterable[float] = (25, 50, 75)):
+    """
+    Nearest-rank percentiles of each histogram row.
+
+    Ratings are discrete, so a percentile is the lowest rating whose
+    cumulative count reaches q% of the ratings.
+
+    Returns:
+        ndarray: Ratings of shape (..., len(q)); NaN without ratings.
+    """
+    histogram = np.asarray(histogram)
+    cumulative = histogram.cumsum(axis=-1)
+    totals = cumulative[..., -1:]
+    targets = np.maximum(np.ceil(np.asarray(q) / 100 * totals), 1)
+    indexes = (cumulative[..., None, :] < targets[..., None]).sum(axis=-1)
+    return np.where(totals > 0, np.take(RATINGS, np.minimum(indexes, 9)), np.nan)
+
+
+def month_counts(dates, owners=None, n_owners: int | None = None):
+    """
+    Entries per month of the year, January first (as the wrapped 'months').
+
+    Returns:
+        ndarray: 12 counts, or (n_owners, 12) counts with owners.
+    """
+    require_numpy()
+    valid = ~np.isnat(dates)
+    months = dates[valid].astype("datetime64[M]").astype(np.intp) % 12
+    return _count(months, 12, None if owners is None else owners[valid], n_owners)
+
+
+def weekday_counts(dates, owners=None, n_owners: int | None = None):
+    """
+    Entries per weekday, Monday first (as the wrapped 'days').
+
+    Returns:
+        ndarray: 7 counts, or (n_owners, 7) counts with owners.
+    """
+    require_numpy()
+    valid = ~np.isnat(dates)
+    # 1970-01-01 was a Thursday (index 3 when Monday is 0).
+    days = (dates[valid].astype("datetime64[D]").astype(np.intp) + 3) % 7
+    return _count(days, 7, None if owners is None else owners[valid], n_owners)
+
+
+def timeline(dates, unit: str = "M") -> tuple:
+    """
+    Entries per calendar period, oldest first.
+
+    Args:
+        unit: NumPy datetime unit of the periods ('Y', 'M', 'W' or 'D').
+
+    Returns:
+        tuple: (periods as datetime64[unit], counts).
+    """
+    require_numpy()
+    dates = dates[~np.isnat(dates)]
+    return np.unique(dates.astype(f"datetime64[{unit}]"), return_counts=True)
+
+
+def rolling_mean(values, window: int):
+    """
+    Trailing mean over the last `window` values, ignoring NaN.
+
+    Values are taken in the given order, sort diary columns by date first
+    (extract_user_diary lists the newest entries first). Windows without
+    any value are NaN.
+    """
+    require_numpy()
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    values = np.asarray(values, np.float64)
+    valid = ~np.isnan(values)
+    sums = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+    counts = np.concatenate(([0], np.cumsum(valid)))
+    start = np.maximum(np.arange(1, len(values) + 1) - window, 0)
+    window_sums = sums[1:] - sums[start]
+    window_counts = counts[1:] - counts[start]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(window_counts > 0, window_sums / window_counts, np.nan)
+
+
+def rating_deviations(ratings, averages):
+    """Member rating minus the film's average rating (NaN when either is missing)."""
+    require_numpy()
+    return np.asarray(ratings, np.float32) - np.asarray(averages, np.float32)
+
+
+def diary_summary(arrays: dict, year: int | None = None) -> dict:
+    """
+    The counters of the wrapped statistics, from diary_arrays columns.
+
+    Args:
+        year: Only count the entries of this year.
+
+    Returns:
+        dict: 'logged', 'total_review', 'total_runtime', 'hours_watched',
+        'months' (1-12) and 'days' (1=Monday to 7=Sunday) as in
+        build_user_wrapped.
+    """
+    require_numpy()
+    dates = arrays["date"]
+    if year is not None:
+        mask = dates.astype("datetime64[Y]") == np.datetime64(str(year), "Y")
+        arrays = {key: column[mask] for key, column in arrays.items()}
+        dates = arrays["date"]
+    total_runtime = int(np.nansum(arrays["runtime"]))
+    return {
+        "logged": len(dates),
+        "total_review": int(arrays["reviewed"].sum()),
+        "total_runtime": total_runtime,
+        "hours_watched": total_runtime // 60,
+        "months": dict(zip(range(1, 13), month_counts(dates).tolist(), strict=True)),
+        "days": dict(zip(range(1, 8), weekday_counts(dates).tolist(), strict=True)),
+    }
+
+
+if __name__ == "__main__":
+    from fastfingertips.terminal_utils import setup_encoding
+
+    from letterboxdpy.pages.user_films import extract_user_films
+
+    setup_encoding()
+
+    films = film_arrays(
+        extract_user_films("https://letterboxd.com/nmcassa/films")["movies"]
+    )
+    histogram = rating_histogram(films["rating"])
+    print(dict(zip(RATINGS, histogram.tolist(), strict=True)))
+    print(
+        "mean", histogram_mean(histogram), "quartiles", histogram_percentiles(histogram)
+    )
@@ -1,7 +1,10 @@
 import re
+from collections.abc import Iterable, Iterator
+from typing import ClassVar
 
 from letterboxdpy.constants.project import CURRENT_DAY, CURRENT_MONTH, CURRENT_YEAR
-from letterboxdpy.core.encoder import SecretsEncoder
+from letterboxdpy.core.concurrency import run_graph
+from letterboxdpy.core.encoder import to_dict
 from letterboxdpy.list import List as LetterboxdList
 from letterboxdpy.pages import (
     user_activity,
@@ -19,6 +22,27 @@ from letterboxdpy.utils.utils_file import JsonFile
 
 
 class User:
+    # Collection name -> (method, collections it is derived from or reuses).
+    PREFETCH_COLLECTIONS: ClassVar[dict[str, tuple[str, tuple[str, ...]]]] = {
+        "activity": ("get_activity", ()),
+        "activity_following": ("get_activity_following", ()),
+        "diary": ("get_diary", ()),
+        "wrapped": ("get_wrapped", ("diary",)),
+        "films": ("get_films", ()),
+        "films_partitioned": ("get_films_partitioned", ("films",)),
+        "films_not_rated": ("get_films_not_rated", ("films_partitioned",)),
+        "genre_info": ("get_genre_info", ()),
+        "liked_films": ("get_liked_films", ()),
+        "liked_reviews": ("get_liked_reviews", ()),
+        "lists": ("get_lists", ()),
+        "following": ("get_following", ()),
+        "followers": ("get_followers", ()),
+        "reviews": ("get_reviews", ()),
+        "user_tags": ("get_user_tags", ()),
+        "watchlist_movies": ("get_watchlist_movies", ()),
+        "watchlist": ("get_watchlist", ("watchlist_movies",)),
+    }
+
     class UserPages:
         def __init__(self, username: str) -> None:
             self.activity = user_activity.UserActivity(username)
@@ -55,12 +79,56 @@ class User:
         }
 
     def __str__(self) -> str:
-        return JsonFile.stringify(
-            self, indent=2, encoder=SecretsEncoder, secrets=["pages"]
-        )
+        return JsonFile.stringify(self.to_dict(), indent=2)
+
+    def to_dict(self) -> dict:
+        """Attributes as a dict, built directly without a JSON round trip."""
+        return to_dict(self, secrets=["pages"])
 
     def jsonify(self) -> dict:
-        return JsonFile.parse(self.__str__())
+        """JSON-normalized to_dict(), e.g. with non-string keys as strings."""
+        return to_dict(self, secrets=["pages"], json_keys=True)
+
+    def prefetch(
+        self, collections: Iterable[str] | None = None, max_workers: int | None = 4
+    ) -> dict:
+        """Fetches several collections concurrently, see iter_prefetch.
+
+        Returns:
+            dict: Results by collection name; failed collections are left out.
+        """
+        return {
+            name: result
+            for name, result, error in self.iter_prefetch(collections, max_workers)
+            if error is None
+        }
+
+    def iter_prefetch(
+        self, collections: Iterable[str] | None = None, max_workers: int | None = 4
+    ) -> Iterator[tuple[str, dict | None, Exception | None]]:
+        """
+        Fetches collections of PREFETCH_COLLECTIONS (all by default),
+        yielding (name, result, error) as soon as each one is ready.
+
+        Independent collections run concurrently. Derived ones (wrapped from
+        the diary, rating buckets from the films, the watchlist from the
+        watchlist movies crawl) wait for their source and
+        are computed from it without crawling again. The sources they need
+        are fetched and yielded too.
+        """
+        names = list(collections or self.PREFETCH_COLLECTIONS)
+        for name in names:
+            if name not in self.PREFETCH_COLLECTIONS:
+                raise ValueError(f"Unknown collection: {name}")
+            names.extend(
+                need for need in self.PREFETCH_COLLECTIONS[name][1] if need not in names
+            )
+
+        tasks = {
+            name: getattr(self, self.PREFETCH_COLLECTIONS[name][0]) for name in names
+        }
+        dependencies = {name: self.PREFETCH_COLLECTIONS[name][1] for name in names}
+        return run_graph(tasks, dependencies, max_workers)
 
     def get_activity(self) -> dict:
         return self.pages.activity.get_activity()
@@ -96,9 +164,15 @@ class User:
     def get_wrapped(self, year: int = CURRENT_YEAR) -> dict:
         return self.pages.diary.get_wrapped(year)
 
+    def get_wrapped_range(self, start: int, end: int = CURRENT_YEAR) -> dict:
+        return self.pages.diary.get_wrapped_range(start, end)
+
     def get_films(self) -> dict:
         return self.pages.films.get_films()
 
+    def get_films_partitioned(self) -> dict:
+        return self.pages.films.get_films_partitioned()
+
     def get_films_by_rating(self, rating: float | int) -> dict:
         return self.pages.films.get_films_rated(rating)
 
@@ -120,8 +194,10 @@ class User:
     def get_list(self, slug: str) -> LetterboxdList:
         return LetterboxdList(self.username, slug)
 
-    def get_lists(self) -> dict:
-        return self.pages.lists.get_lists()
+    def get_lists(
+        self, max_lists: int | None = None, max_workers: int | None = None
+    ) -> dict:
+        return self.pages.lists.get_lists(max_lists, max_workers)
 
     def get_following(self, page: int = 1, limit: int | None = None) -> dict:
         return self.pages.network.get_following(page=page, limit=limit)
@@ -168,6 +244,9 @@ class User:
     def get_diary_recent(self) -> dict:
         return self.pages.profile.get_diary_recent()
 
+    def get_rating_histogram(self) -> dict:
+        return self.pages.profile.get_rating_histogram()
+
     def get_reviews(self) -> dict:
         return self.pages.reviews.get_reviews()
 
@@ -180,8 +259,13 @@ class User:
     def get_watchlist_movies(self) -> dict:
         return self.pages.watchlist.get_movies()
 
-    def get_watchlist(self, filters: dict | None = None) -> dict:
-        return self.pages.watchlist.get_watchlist(filters)
+    def get_watchlist(
+        self,
+        filters: dict | None = None,
+        catalog: dict | None = None,
+        complete: Iterable[str] = (),
+    ) -> dict:
+        return self.pages.watchlist.get_watchlist(filters, catalog, complete)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,56 @@
+"""
+String interning for large username/slug collections.
+
+Crawls that touch hundreds of thousands of members keep each distinct name
+once and refer to it everywhere else by a dense integer id, so membership
+tables can be stored as compact `array("I")` buffers instead of dicts.
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator
+
+
+class Interner:
+    """Maps strings to dense integer ids (0, 1, 2, ...) and back."""
+
+    __slots__ = ("_ids", "_names")
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        for name in names:
+            self.intern(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def intern(self, name: str) -> int:
+        """Returns the id of `name`, assigning the next free id if it is new."""
+        id_ = self._ids.get(name)
+        if id_ is None:
+            id_ = len(self._names)
+            self._ids[name] = id_
+            self._names.append(name)
+        return id_
+
+    def intern_many(self, names: Iterable[str]) -> array:
+        """Interns every name and returns their ids as an unsigned int array."""
+        return array("I", map(self.intern, names))
+
+    def get(self, name: str) -> int | None:
+        """Returns the id of `name` without assigning one."""
+        return self._ids.get(name)
+
+    def name(self, id_: int) -> str:
+        """Returns the string behind an id."""
+        return self._names[id_]
+
+    def names(self, ids: Iterable[int]) -> list[str]:
+        """Returns the strings behind a sequence of ids."""
+        return [self._names[id_] for id_ in ids]
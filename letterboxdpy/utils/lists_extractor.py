@@ -4,14 +4,15 @@ This module provides common functionality for extracting list data
 from user lists, movie lists, and individual list pages.
 """
 
+from collections.abc import Iterator
 from typing import ClassVar
 
 from fastfingertips.string_utils import extract_number_from_text
 
 from letterboxdpy.constants.project import DOMAIN
-from letterboxdpy.core.scraper import parse_url
+from letterboxdpy.core.pagination import iter_all_pages, pages_needed
 from letterboxdpy.utils.utils_parser import extract_and_convert_shorthand
-from letterboxdpy.utils.utils_url import extract_path_segment, get_page_url
+from letterboxdpy.utils.utils_url import extract_path_segment
 
 
 class ListsExtractor:
@@ -37,51 +38,73 @@ class ListsExtractor:
     LISTS_PER_PAGE = 12
 
     @classmethod
-    def from_url(cls, base_url: str, max_lists: int | None = None) -> dict:
+    def from_url(
+        cls,
+        base_url: str,
+        max_lists: int | None = None,
+        max_workers: int | None = None,
+    ) -> dict:
         """
         Extract lists collection from URL.
 
         Args:
             base_url: Base URL without page parameter
             max_lists: Maximum number of lists to return (optional limit)
+            max_workers: Pages fetched ahead in parallel. None = sequential.
 
         Returns:
             dict: Contains 'lists', 'count', 'last_page'
         """
         data = {"limit": False, "count": 0, "last_page": 1, "lists": {}}
-        page = 1
 
-        while True:
-            lists = cls._fetch_page_data(base_url, page)
+        for page, list_id, list_data in cls._iter_pages_lists(
+            base_url, max_lists, max_workers
+        ):
+            data["lists"][list_id] = list_data
+            data["last_page"] = page
 
-            if not lists:
-                break
+        data["count"] = len(data["lists"])
+        data["limit"] = bool(max_lists) and data["count"] >= max_lists
 
-            for item in lists:
-                list_data = cls._extract_list_data(item)
-                data["lists"] |= list_data
+        return data
 
-                if max_lists and len(data["lists"]) >= max_lists:
-                    # Limit reached
-                    data["limit"] = True
-                    break
+    @classmethod
+    def iter_from_url(
+        cls,
+        base_url: str,
+        max_lists: int | None = None,
+        max_workers: int | None = None,
+    ) -> Iterator[tuple[str, dict]]:
+        """Stream (list_id, data) pairs from URL, page by page."""
+        for _, list_id, list_data in cls._iter_pages_lists(
+            base_url, max_lists, max_workers
+        ):
+            yield list_id, list_data
 
-            if data["limit"] or len(lists) < cls.LISTS_PER_PAGE:
-                # Is last page or limit reached
-                break
+    @classmethod
+    def _iter_pages_lists(
+        cls, base_url: str, max_lists: int | None, max_workers: int | None
+    ) -> Iterator[tuple[int, str, dict]]:
+        """Yields (page, list_id, data) until the last page or `max_lists`."""
+        count = 0
+        last_page = pages_needed(max_lists, cls.LISTS_PER_PAGE)
+        pages = iter_all_pages(base_url, last_page, max_workers, open_ended=True)
 
-            page += 1
+        for page, dom in pages:
+            lists = dom.find_all("article", {"class": "list-summary"})
 
-        data["count"] = len(data["lists"])
-        data["last_page"] = page
+            for item in lists:
+                for list_id, list_data in cls._extract_list_data(item).items():
+                    yield page, list_id, list_data
+                count += 1
 
-        return data
+                if max_lists and count >= max_lists:
+                    # Limit reached
+                    return
 
-    @classmethod
-    def _fetch_page_data(cls, base_url: str, page: int):
-        """Fetch and parse page data."""
-        dom = parse_url(get_page_url(base_url, page))
-        return dom.find_all("article", {"class": "list-summary"})
+            if len(lists) < cls.LISTS_PER_PAGE:
+                # Is last page
+                return
 
     @classmethod
     def _extract_list_data(cls, item) -> dict:
@@ -0,0 +1,97 @@
+"""
+Member table parsing for Letterboxd people pages.
+
+Followers, following and the members directory all list people in the same
+`member-table` markup. The table is parsed from the raw HTML with lxml and
+precompiled XPath expressions; with `usernames_only` a row costs a single
+attribute read, which matters when paging through very large accounts.
+"""
+
+import re
+
+from lxml import etree
+from lxml import html as lxml_html
+
+from letterboxdpy.core.models import Member
+
+
+def _has_class(name: str) -> str:
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+_TABLE = (
+    f"//table[{_has_class('member-table')} or {_has_class('person-table')}]"
+    f"//div[{_has_class('person-summary')}]"
+)
+AVATAR_HREFS = etree.XPath(f"{_TABLE}/a[{_has_class('avatar')}]/@href")
+SUMMARIES = etree.XPath(_TABLE)
+
+_AVATAR = etree.XPath(f"./a[{_has_class('avatar')}][@href]")
+_NAME = etree.XPath(f".//a[{_has_class('name')}]")
+_METADATA_LINKS = etree.XPath(f".//small[{_has_class('metadata')}]//a[@href]")
+_ROW = etree.XPath("./ancestor::tr[1]")
+_STAT_LINKS = {
+    stat: etree.XPath(f"./td[{_has_class(f'col-{stat}')}]//a")
+    for stat in ("watched", "lists", "likes")
+}
+
+NUMBER_PATTERN = re.compile(r"\d[\d,]*")
+
+
+def parse_member_table(
+    html: str | bytes, usernames_only: bool = False, as_dicts: bool = True
+) -> list:
+    """
+    Parses the people listed in a member table page.
+
+    Args:
+        html: Raw HTML of the page.
+        usernames_only: Return usernames only, skipping names, avatars and
+            stat columns.
+        as_dicts: Return dicts; False returns Member records instead.
+
+    Returns:
+        list: Usernames, or dicts with 'username', 'name', 'url', 'avatar',
+        'followers', 'following', 'watched', 'lists' and 'likes'.
+    """
+    root = lxml_html.fromstring(html)
+    if usernames_only:
+        return [href.strip("/") for href in AVATAR_HREFS(root)]
+
+    members = []
+    for summary in SUMMARIES(root):
+        avatar_links = _AVATAR(summary)
+        if avatar_links:
+            member = _parse_member(summary, avatar_links[0])
+            members.append(member.to_dict() if as_dicts else member)
+    return members
+
+
+def _parse_member(summary, avatar_link) -> Member:
+    username = avatar_link.get("href").strip("/")
+    images = avatar_link.xpath("./img")
+    display_name = images[0].get("alt", username) if images else username
+    avatar_url = images[0].get("src", "") if images else ""
+
+    name_links = _NAME(summary)
+    if name_links:
+        display_name = name_links[0].text_content().strip()
+
+    counts = {"followers": None, "following": None}
+    for link in _METADATA_LINKS(summary):
+        href = link.get("href")
+        for key in counts:
+            if counts[key] is None and key in href:
+                counts[key] = _to_number(link.text_content())
+
+    rows = _ROW(summary)
+    for stat, xpath in _STAT_LINKS.items():
+        links = xpath(rows[0]) if rows else []
+        counts[stat] = _to_number(links[0].text_content()) if links else None
+
+    return Member(username, display_name, avatar_url, **counts)
+
+
+def _to_number(text: str) -> int | None:
+    match = NUMBER_PATTERN.search(text)
+    return int(match.group().replace(",", "")) if match else None
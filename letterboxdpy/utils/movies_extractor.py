@@ -8,16 +8,18 @@ Letterboxd page types that display movies in different layouts.
 import json
 import re
 
+from letterboxdpy.core.models import FilmRef
 from letterboxdpy.utils.utils_string import (
     clean_movie_name,
     extract_year_from_movie_name,
 )
 
 
-def extract_movie_info(item):
+def extract_movie_info(item, as_dicts: bool = True):
     """
     Centralized function to extract movie information from a poster container.
     Supports both modern JSON identifiers and legacy data attributes.
+    With as_dicts=False the data is a FilmRef record instead of a dict.
     """
     # Find the element containing movie data (usually a react-component div)
     # Could be the item itself or a nested div
@@ -60,12 +62,8 @@ def extract_movie_info(item):
     movie_name = clean_movie_name(raw_name)
     year = extract_year_from_movie_name(raw_name)
 
-    return movie_id, {
-        "slug": movie_slug,
-        "name": movie_name,
-        "year": year,
-        "url": f"https://letterboxd.com/film/{movie_slug}/",
-    }
+    film = FilmRef(movie_id, movie_slug, movie_name, year)
+    return movie_id, film.to_dict() if as_dicts else film
 
 
 def extract_movies_from_horizontal_list(dom, max_items=12 * 6) -> dict:
@@ -111,7 +109,7 @@ def extract_movies_from_horizontal_list(dom, max_items=12 * 6) -> dict:
     return movies
 
 
-def extract_movies_from_vertical_list(dom, max_items=20 * 5) -> dict:
+def extract_movies_from_vertical_list(dom, max_items=20 * 5, as_dicts=True) -> dict:
     """
     Extract movies from vertical movie lists.
 
@@ -124,6 +122,7 @@ def extract_movies_from_vertical_list(dom, max_items=20 * 5) -> dict:
     Args:
         dom: BeautifulSoup DOM object
         max_items: Maximum number of items to extract
+        as_dicts: Store dicts; False stores FilmRef records instead
 
     Returns:
         dict: Movie data with film IDs as keys
@@ -137,7 +136,7 @@ def extract_movies_from_vertical_list(dom, max_items=20 * 5) -> dict:
         if len(movies) >= max_items:
             break
 
-        movie_data = extract_movie_info(item)
+        movie_data = extract_movie_info(item, as_dicts)
         if movie_data:
             movie_id, data = movie_data
             movies[movie_id] = data
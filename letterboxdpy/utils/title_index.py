@@ -0,0 +1,121 @@
+"""
+Local title -> film index for resolving many titles without searching.
+
+Titles are normalized with `normalize_title` and matched exactly first, then
+by trigram similarity. Every match carries a confidence score in [0, 1]
+that also accounts for the release year.
+"""
+
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+
+from letterboxdpy.utils.utils_string import (
+    extract_name_year_from_movie_title,
+    normalize_title,
+)
+
+
+def title_trigrams(normalized: str) -> set[str]:
+    """Returns the trigrams of a normalized title, padded at the edges."""
+    padded = f"  {normalized} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def year_factor(year: int | None, film_year: int | None) -> float:
+    """Confidence multiplier for the release year of a candidate."""
+    if year is None or film_year is None:
+        return 0.95
+    # Festival vs. release dates often differ by one year.
+    return {0: 1.0, 1: 0.9}.get(abs(year - film_year), 0.0)
+
+
+class TitleIndex:
+    """Exact and trigram index over (slug, title, year) films."""
+
+    def __init__(self, films: Iterable[dict] = ()) -> None:
+        """
+        Args:
+            films: Film dicts with `slug`, `name` (or `title`) and `year`,
+                e.g. the values of Films.movies or a CatalogSweep.
+        """
+        self.slugs: list[str] = []
+        self.titles: list[str] = []
+        self.years: list[int | None] = []
+        self._normalized: list[str] = []
+        self._trigram_counts = array("I")  # trigrams per title
+        self._exact: dict[str, list[int]] = {}
+        self._trigrams: dict[str, array] = {}
+        for film in films:
+            self.add(
+                film["slug"], film.get("name") or film.get("title"), film.get("year")
+            )
+
+    def __len__(self) -> int:
+        return len(self.slugs)
+
+    def add(self, slug: str, title: str, year: int | None = None) -> None:
+        """Adds a film to the index."""
+        normalized = normalize_title(title)
+        position = len(self.slugs)
+        self.slugs.append(slug)
+        self.titles.append(title)
+        self.years.append(year)
+        self._normalized.append(normalized)
+        self._exact.setdefault(normalized, []).append(position)
+        trigrams = title_trigrams(normalized)
+        self._trigram_counts.append(len(trigrams))
+        for trigram in trigrams:
+            self._trigrams.setdefault(trigram, array("I")).append(position)
+
+    def match(
+        self, title: str, year: int | None = None, min_score: float = 0.0
+    ) -> dict | None:
+        """
+        Returns the best matching film as {"slug", "title", "year", "score"},
+        or None if nothing scores at least `min_score`.
+
+        A year in parentheses at the end of the title is used when `year`
+        is not given, e.g. "The Matrix (1999)".
+        """
+        title, title_year = extract_name_year_from_movie_title(title.strip())
+        year = year or title_year
+        normalized = normalize_title(title)
+        if not normalized:
+            return None
+
+        scores = {
+            position: year_factor(year, self.years[position])
+            for position in self._exact.get(normalized, ())
+        }
+        if not any(scores.values()):
+            scores = self._fuzzy_scores(normalized, year)
+
+        if not scores:
+            return None
+        position, score = max(scores.items(), key=lambda item: item[1])
+        if score <= 0 or score < min_score:
+            return None
+        return {
+            "slug": self.slugs[position],
+            "title": self.titles[position],
+            "year": self.years[position],
+            "score": round(score, 3),
+        }
+
+    def _fuzzy_scores(self, normalized: str, year: int | None) -> dict[int, float]:
+        trigrams = title_trigrams(normalized)
+        shared = Counter()
+        for trigram in trigrams:
+            shared.update(self._trigrams.get(trigram, ()))
+
+        # Every candidate gets its normalized (Dice) score: ranking by the raw
+        # shared count would favour long titles.
+        sizes, years = self._trigram_counts, self.years
+        return {
+            position: 2
+            * count
+            / (len(trigrams) + sizes[position])
+            * year_factor(year, years[position])
+            for position, count in shared.items()
+        }
@@ -1,8 +1,17 @@
+import gzip
+import io
 import os
+from collections.abc import Iterable, Iterator
 from json import dump as json_dump
 from json import dumps as json_dumps
 from json import load as json_load
 from json import loads as json_loads
+from typing import ClassVar
+
+try:
+    import orjson
+except ImportError:  # optional, see JsonFile.set_backend
+    orjson = None
 
 
 class File:
@@ -22,6 +31,11 @@ class File:
         """Check if file exists."""
         return os.path.exists(cls._get_path(path))
 
+    @classmethod
+    def replace(cls, source: str, target: str) -> None:
+        """Renames `source` over `target` in one step, so readers see either whole."""
+        os.replace(cls._get_path(source), cls._get_path(target))
+
     @classmethod
     def delete(cls, path: str) -> bool:
         """Delete file if exists. Returns True if deleted."""
@@ -43,21 +57,52 @@ class File:
 
 
 class JsonFile(File):
-    """Utility class for JSON file operations."""
+    """Utility class for JSON file operations.
+
+    The serializer is the standard library by default; `set_backend("orjson")`
+    switches to the optional, much faster orjson package. Output is the same
+    JSON, except that orjson writes non-ASCII characters as UTF-8 instead of
+    escaping them.
+    """
 
     EXTENSION = ".json"
+    BACKENDS = ("json", "orjson")
+    backend = "json"
 
     @classmethod
-    def save(cls, path: str, data: dict | list, indent: int = 2) -> None:
-        """Save data to a JSON file."""
+    def set_backend(cls, name: str) -> None:
+        """Selects the serializer used by save, stringify and JsonLinesFile."""
+        if name not in cls.BACKENDS:
+            raise ValueError(
+                f"Unsupported backend '{name}'. Use one of {cls.BACKENDS}."
+            )
+        if name == "orjson" and orjson is None:
+            raise ImportError(
+                "The orjson backend requires the 'orjson' package: "
+                "pip install letterboxdpy[fast]"
+            )
+        cls.backend = name
+
+    @classmethod
+    def save(
+        cls, path: str, data: dict | list, indent: int | None = 2, encoder=None
+    ) -> None:
+        """Save data to a JSON file. Use indent=None for large exports."""
+        if cls._use_orjson(indent):
+            with open(cls._get_path(path), "wb") as f:
+                f.write(cls._orjson_dumps(data, indent, encoder))
+            return
         with open(cls._get_path(path), "w") as f:
-            json_dump(data, f, indent=indent)
+            json_dump(data, f, indent=indent, cls=encoder)
 
     @classmethod
     def load(cls, path: str) -> dict | None:
         """Load data from a JSON file. Returns None if file doesn't exist."""
         filepath = cls._get_path(path)
         if os.path.exists(filepath):
+            if cls.backend == "orjson":
+                with open(filepath, "rb") as f:
+                    return orjson.loads(f.read())
             with open(filepath, encoding="utf-8") as f:
                 return json_load(f)
         return None
@@ -70,11 +115,154 @@ class JsonFile(File):
         except (ValueError, TypeError):
             return None
 
-    @staticmethod
-    def stringify(data, indent: int | None = None, encoder=None, **kwargs) -> str:
+    @classmethod
+    def stringify(cls, data, indent: int | None = None, encoder=None, **kwargs) -> str:
         """Convert dict to JSON string. Supports custom encoder and extra args."""
+        if cls._use_orjson(indent, **kwargs):
+            return cls._orjson_dumps(data, indent, encoder, **kwargs).decode()
         return json_dumps(data, indent=indent, cls=encoder, **kwargs)
 
+    @classmethod
+    def _use_orjson(cls, indent: int | None, **kwargs) -> bool:
+        # orjson only indents by 2 and has no json.dumps keyword arguments;
+        # encoder options (e.g. secrets) are passed to the encoder instead.
+        extra = set(kwargs) - {"secrets"}
+        return cls.backend == "orjson" and indent in (None, 2) and not extra
+
+    @staticmethod
+    def _orjson_dumps(data, indent: int | None, encoder=None, **kwargs) -> bytes:
+        # Dataclasses and datetimes go to the encoder like with json, instead
+        # of orjson's own format, so both backends write the same JSON.
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        default = encoder(**kwargs).default if encoder else None
+        return orjson.dumps(data, default=default, option=option)
+
+
+class JsonLinesFile(File):
+    """Utility class for JSON Lines files (one JSON record per line).
+
+    Records are written and read one at a time, so exports of any size use
+    constant memory. A ".gz" or ".zst" suffix (or the `compression`
+    argument) compresses the file with gzip or zstd; zstd needs the
+    optional `zstandard` package. Lines use the JsonFile backend.
+    """
+
+    EXTENSION = ".jsonl"
+    COMPRESSIONS: ClassVar[dict[str, str]] = {"gzip": ".gz", "zstd": ".zst"}
+
+    @classmethod
+    def _get_path(cls, path: str, compression: str | None = None) -> str:
+        """Get full path with extension and compression suffix."""
+        if compression is not None and compression not in cls.COMPRESSIONS:
+            raise ValueError(
+                f"Unsupported compression '{compression}'. "
+                f"Use one of {list(cls.COMPRESSIONS)}."
+            )
+        if path.endswith(tuple(cls.COMPRESSIONS.values())):
+            return path
+        path = super()._get_path(path)
+        return path + cls.COMPRESSIONS[compression] if compression else path
+
+    @classmethod
+    def save(
+        cls,
+        path: str,
+        records: Iterable,
+        compression: str | None = None,
+        key: str | None = None,
+        encoder=None,
+    ) -> int:
+        """
+        Write records to a JSON Lines file, replacing it. Returns the count.
+
+        Args:
+            records: Any iterable, e.g. one of the iter_* APIs.
+            compression: 'gzip' or 'zstd'. Taken from the path suffix if None.
+            key: Write (key, dict) pairs as one object, the key under this field.
+            encoder: Optional JSON encoder class.
+        """
+        return cls._write(cls._get_path(path, compression), "w", records, key, encoder)
+
+    @classmethod
+    def append(
+        cls,
+        path: str,
+        records: Iterable,
+        compression: str | None = None,
+        key: str | None = None,
+        encoder=None,
+    ) -> int:
+        """Append records to a JSON Lines file, see `save`. Returns the count."""
+        return cls._write(cls._get_path(path, compression), "a", records, key, encoder)
+
+    @classmethod
+    def iter_load(cls, path: str, compression: str | None = None) -> Iterator:
+        """Yield the records of a JSON Lines file one by one."""
+        loads = orjson.loads if JsonFile.backend == "orjson" else json_loads
+        with cls._open(cls._get_path(path, compression), "r") as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+
+    @classmethod
+    def load(cls, path: str, compression: str | None = None) -> list | None:
+        """Load all records of a JSON Lines file. Returns None if file doesn't exist."""
+        if not os.path.exists(cls._get_path(path, compression)):
+            return None
+        return list(cls.iter_load(path, compression))
+
+    @classmethod
+    def _write(cls, filepath: str, mode: str, records: Iterable, key, encoder) -> int:
+        if JsonFile._use_orjson(None):
+
+            def dumps(record) -> str:
+                return JsonFile._orjson_dumps(record, None, encoder).decode()
+        else:
+
+            def dumps(record) -> str:
+                return json_dumps(record, cls=encoder, separators=(",", ":"))
+
+        count = 0
+        with cls._open(filepath, mode) as f:
+            for record in records:
+                if key is not None:
+                    record_key, record = record
+                    record = {key: record_key, **record}
+                f.write(dumps(record))
+                f.write("\n")
+                count += 1
+        return count
+
+    @classmethod
+    def _open(cls, filepath: str, mode: str):
+        if filepath.endswith(cls.COMPRESSIONS["gzip"]):
+            return gzip.open(filepath, f"{mode}t", encoding="utf-8")
+        if filepath.endswith(cls.COMPRESSIONS["zstd"]):
+            try:
+                import zstandard
+            except ImportError as e:
+                raise ImportError(
+                    "zstd compression requires the 'zstandard' package: "
+                    "pip install letterboxdpy[zstd]"
+                ) from e
+
+            raw = open(filepath, f"{mode}b")  # noqa: SIM115 - closed by the wrapper
+            if mode == "r":
+                stream = zstandard.ZstdDecompressor().stream_reader(
+                    raw, read_across_frames=True, closefd=True
+                )
+            else:
+                # Appending adds a new frame; readers continue across frames.
+                stream = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+            return io.TextIOWrapper(stream, encoding="utf-8")
+        return open(filepath, mode, encoding="utf-8")
+
 
 class CsvFile(File):
     """Utility class for CSV file operations."""
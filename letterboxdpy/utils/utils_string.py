@@ -1,6 +1,8 @@
 import re
+import unicodedata
 
 MOVIE_TITLE_YEAR_PATTERN = re.compile(r"^(.+?)(?:\s*\((\d{4})\))?$")
+LEADING_ARTICLES = ("the", "a", "an")
 
 
 def remove_prefix(text: str, prefix: str) -> str:
@@ -48,3 +50,18 @@ def extract_name_year_from_movie_title(movie_name: str) -> tuple[str, int | None
         return title, year if year is None else int(year)
 
     return movie_name, None
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a movie title for matching: no accents, case, punctuation or leading article.
+
+    Example:
+        normalize_title("The Lord of the Rings: The Two Towers") -> "lord of the rings the two towers"
+        normalize_title("Amélie & Nino") -> "amelie and nino"
+    """
+    title = unicodedata.normalize("NFKD", title)
+    title = "".join(char for char in title if not unicodedata.combining(char))
+    words = re.findall(r"[^\W_]+", title.casefold().replace("&", " and "))
+    if len(words) > 1 and words[0] in LEADING_ARTICLES:
+        words = words[1:]
+    return " ".join(words)
@@ -39,6 +39,19 @@ def parse_list_url(url: str) -> tuple:
     raise ValueError(f"Invalid list URL format: {url}")
 
 
+def parse_list_ref(ref: str | tuple | dict) -> tuple:
+    """
+    Normalize a list reference to (username, slug).
+    Accepts a list URL, a (username, slug) pair or a list dict with a 'url' key.
+    """
+    if isinstance(ref, dict):
+        ref = ref["url"]
+    if isinstance(ref, str):
+        return parse_list_url(ref)
+    username, slug = ref
+    return username, slug
+
+
 def get_page_url(base_url: str, page: int, params: str = "") -> str:
     """
     Generate a paginated URL from a base URL and page number.
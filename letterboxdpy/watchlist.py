@@ -5,7 +5,7 @@ Provides the Watchlist class for accessing user watchlist data.
 
 import re
 
-from letterboxdpy.core.encoder import SecretsEncoder
+from letterboxdpy.core.encoder import to_dict
 from letterboxdpy.core.exceptions import PrivateRouteError
 from letterboxdpy.pages import user_watchlist
 from letterboxdpy.utils.utils_file import JsonFile
@@ -39,12 +39,15 @@ class Watchlist:
         return self.count
 
     def __str__(self) -> str:
-        return JsonFile.stringify(
-            self, indent=2, encoder=SecretsEncoder, secrets=["pages"]
-        )
+        return JsonFile.stringify(self.to_dict(), indent=2)
+
+    def to_dict(self) -> dict:
+        """Attributes as a dict, built directly without a JSON round trip."""
+        return to_dict(self, secrets=["pages"])
 
     def jsonify(self) -> dict:
-        return JsonFile.parse(self.__str__())
+        """JSON-normalized to_dict(), e.g. with non-string keys as strings."""
+        return to_dict(self, secrets=["pages"], json_keys=True)
 
     # Data Retrieval Methods
     def get_owner(self) -> str:
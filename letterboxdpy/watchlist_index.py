@@ -0,0 +1,269 @@
+"""
+Watchlist overlap across a cohort of members with an inverted index.
+
+Members and films are interned to dense ids. The index maps every film to
+an int bitset of the members whose watchlist contains it (bit i = member
+id i), so the popularity of a film within any cohort is one AND and one
+popcount, and ranking films is a heap selection over those counts. Each
+member's film ids are kept as well: replacing a watchlist only flips the
+bits of the films that were added or removed.
+"""
+
+import heapq
+from collections.abc import Iterable, Iterator
+
+from letterboxdpy.core.concurrency import map_ordered
+from letterboxdpy.pages.user_watchlist import iter_watchlist
+from letterboxdpy.utils.interner import Interner
+from letterboxdpy.utils.utils_file import JsonFile
+
+
+def iter_bits(bitset: int) -> Iterator[int]:
+    """Yields the positions of the set bits, lowest first."""
+    while bitset:
+        low = bitset & -bitset
+        yield low.bit_length() - 1
+        bitset ^= low
+
+
+def fetch_watchlist_ids(username: str) -> list[str]:
+    """Crawls the film ids of a member's watchlist."""
+    ids = []
+    for _, films in iter_watchlist(username, as_dicts=False):
+        ids.extend(films)
+    return ids
+
+
+class WatchlistIndex:
+    """Inverted index from film id to the members who want to watch it."""
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path
+        self.members = Interner()
+        self.films = Interner()
+        self.bitsets: list[int] = []  # by film id
+        self.watchlists: dict[int, set[int]] = {}  # film ids by member id
+        if path and JsonFile.exists(path):
+            data = JsonFile.load(path) or {}
+            self.members = Interner(data.get("members", []))
+            self.films = Interner(data.get("films", []))
+            self.bitsets = [0] * len(self.films)
+            for member, film_ids in data.get("watchlists", {}).items():
+                self._set(int(member), set(film_ids))
+
+    def __len__(self) -> int:
+        return len(self.watchlists)
+
+    def __contains__(self, username: str) -> bool:
+        member = self.members.get(username)
+        return member is not None and member in self.watchlists
+
+    def set_watchlist(self, username: str, film_ids: Iterable[str]) -> dict:
+        """
+        Adds or replaces the watchlist of a member.
+
+        Returns:
+            dict: The number of films 'added' and 'removed'.
+        """
+        member = self.members.intern(username)
+        new = {self.films.intern(film_id) for film_id in film_ids}
+        self.bitsets.extend([0] * (len(self.films) - len(self.bitsets)))
+        return self._set(member, new)
+
+    def remove_member(self, username: str) -> None:
+        member = self.members.get(username)
+        if member is not None and member in self.watchlists:
+            self._set(member, set())
+            del self.watchlists[member]
+
+    def _set(self, member: int, new: set[int]) -> dict:
+        bit = 1 << member
+        old = self.watchlists.get(member, set())
+        added, removed = new - old, old - new
+        for film in added:
+            self.bitsets[film] |= bit
+        for film in removed:
+            self.bitsets[film] &= ~bit
+        self.watchlists[member] = new
+        return {"added": len(added), "removed": len(removed)}
+
+    def crawl(
+        self, usernames: Iterable[str], max_workers: int | None = 4
+    ) -> dict[str, Exception]:
+        """
+        Crawls and indexes the watchlists of members in parallel.
+
+        Returns:
+            dict: The error of every member whose watchlist could not be
+            crawled (e.g. a private one); those members are left unchanged.
+        """
+
+        def crawl_one(username: str) -> tuple:
+            try:
+                return username, fetch_watchlist_ids(username), None
+            except Exception as e:
+                return username, None, e
+
+        errors = {}
+        for username, film_ids, error in map_ordered(crawl_one, usernames, max_workers):
+            if error is None:
+                self.set_watchlist(username, film_ids)
+            else:
+                errors[username] = error
+        return errors
+
+    def mask(self, usernames: Iterable[str] | None = None) -> int:
+        """Bitset of a cohort; None = every indexed member."""
+        if usernames is None:
+            members = self.watchlists
+        else:
+            members = (self.members.get(username) for username in usernames)
+        mask = 0
+        for member in members:
+            if member is not None:
+                mask |= 1 << member
+        return mask
+
+    def watchlist(self, username: str) -> set[str]:
+        """Film ids of a member's indexed watchlist."""
+        member = self.members.get(username)
+        return {self.films.name(film) for film in self.watchlists.get(member, ())}
+
+    def popularity(self, film_id: str, among: Iterable[str] | None = None) -> int:
+        """How many members (of a cohort) want to watch a film."""
+        film = self.films.get(film_id)
+        if film is None:
+            return 0
+        return (self.bitsets[film] & self.mask(among)).bit_count()
+
+    def wanted_by(self, film_id: str, among: Iterable[str] | None = None) -> list[str]:
+        """Members (of a cohort) who want to watch a film, in indexing order."""
+        film = self.films.get(film_id)
+        if film is None:
+            return []
+        return self.members.names(iter_bits(self.bitsets[film] & self.mask(among)))
+
+    def popular(
+        self, k: int = 20, among: Iterable[str] | None = None
+    ) -> list[tuple[str, int]]:
+        """The k films most members of a cohort want to watch, with their counts."""
+        mask = self.mask(among)
+        counts = (
+            (film, count)
+            for film, bitset in enumerate(self.bitsets)
+            if (count := (bitset & mask).bit_count())
+        )
+        return [
+            (self.films.name(film), count)
+            for film, count in heapq.nlargest(k, counts, key=lambda item: item[1])
+        ]
+
+    def overlap(self, a: str, b: str) -> int:
+        """Number of films on both members' watchlists."""
+        return len(self._films_of(a) & self._films_of(b))
+
+    def overlaps(
+        self, username: str, among: Iterable[str] | None = None
+    ) -> dict[str, int]:
+        """Films shared by a member with each other member (of a cohort)."""
+        films = self._films_of(username)
+        member = self.members.get(username)
+        return {
+            self.members.name(other): len(films & self.watchlists[other])
+            for other in iter_bits(self.mask(among))
+            if other != member and other in self.watchlists
+        }
+
+    def pairwise_overlaps(
+        self, among: Iterable[str] | None = None
+    ) -> dict[tuple[str, str], int]:
+        """Shared films of every pair of members (of a cohort) sharing any."""
+        members = [m for m in iter_bits(self.mask(among)) if m in self.watchlists]
+        pairs = {}
+        for i, a in enumerate(members):
+            films = self.watchlists[a]
+            for b in members[i + 1 :]:
+                if shared := len(films & self.watchlists[b]):
+                    pairs[self.members.name(a), self.members.name(b)] = shared
+        return pairs
+
+    def top_shared(
+        self,
+        username: str,
+        k: int | None = None,
+        among: Iterable[str] | None = None,
+    ) -> list[tuple[str, int, list[str]]]:
+        """
+        Films of a member's watchlist that other members (of a cohort) want
+        to watch too, most wanted first.
+
+        Returns:
+            list: (film id, count, usernames) for up to k films (all with None).
+        """
+        member = self.members.get(username)
+        mask = self.mask(among) & ~(1 << member if member is not None else 0)
+        counts = [
+            (film, count)
+            for film in self.watchlists.get(member, ())
+            if (count := (self.bitsets[film] & mask).bit_count())
+        ]
+        # Ties keep the films' indexing order.
+        counts.sort()
+        if k is None:
+            ranked = sorted(counts, key=lambda item: item[1], reverse=True)
+        else:
+            ranked = heapq.nlargest(k, counts, key=lambda item: item[1])
+        return [
+            (
+                self.films.name(film),
+                count,
+                self.members.names(iter_bits(self.bitsets[film] & mask)),
+            )
+            for film, count in ranked
+        ]
+
+    def shared_films(self, a: str, b: str, k: int | None = None) -> list[str]:
+        """Films on both watchlists, the most wanted across the index first."""
+        shared = self._films_of(a) & self._films_of(b)
+        ranked = heapq.nlargest(
+            len(shared) if k is None else k,
+            sorted(shared),
+            key=lambda film: self.bitsets[film].bit_count(),
+        )
+        return [self.films.name(film) for film in ranked]
+
+    def _films_of(self, username: str) -> set[int]:
+        return self.watchlists.get(self.members.get(username), set())
+
+    def save(self, path: str | None = None) -> None:
+        path = path or self.path
+        if not path:
+            raise ValueError("No path to save the index to")
+        JsonFile.save(
+            path,
+            {
+                "members": list(self.members),
+                "films": list(self.films),
+                "watchlists": {
+                    member: sorted(films) for member, films in self.watchlists.items()
+                },
+            },
+            indent=None,
+        )
+
+
+if __name__ == "__main__":
+    from fastfingertips.terminal_utils import setup_encoding
+
+    from letterboxdpy.pages.user_network import extract_network_usernames
+
+    setup_encoding()
+
+    username = "nmcassa"
+    following = extract_network_usernames(username, "following")
+    index = WatchlistIndex("watchlist_index")
+    errors = index.crawl([username, *following])
+    index.save()
+    print(f"{len(index)} watchlists indexed, {len(errors)} failed")
+    for film_id, count, usernames in index.top_shared(username, k=10):
+        print(f"{film_id:>8} wanted by {count}: {', '.join(usernames)}")
@@ -0,0 +1,61 @@
+"""Tests for TTLCache and the MultiSearch result cache."""
+
+import unittest
+from unittest.mock import patch
+
+from letterboxdpy.search import MultiSearch, Search, SearchFilter
+from letterboxdpy.utils.utils_cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """Offline tests for TTLCache."""
+
+    def test_entries_expire(self):
+        cache = TTLCache(ttl=10)
+        with patch("letterboxdpy.utils.utils_cache.time.monotonic", return_value=0):
+            cache.set("key", "value")
+        with patch("letterboxdpy.utils.utils_cache.time.monotonic", return_value=5):
+            self.assertEqual(cache.get("key"), "value")
+        with patch("letterboxdpy.utils.utils_cache.time.monotonic", return_value=10):
+            self.assertIsNone(cache.get("key"))
+        self.assertEqual(len(cache), 0)
+
+    def test_maxsize_drops_oldest(self):
+        cache = TTLCache(maxsize=2)
+        for key in "abc":
+            cache.set(key, key)
+        self.assertNotIn("a", cache)
+        self.assertIn("c", cache)
+
+
+def fake_get_results(self, num_results=Search.DEFAULT_NUM_RESULTS):
+    items = [{"type": self.search_filter.value} for _ in range(num_results)]
+    return self.build_results(items)
+
+
+class TestMultiSearch(unittest.TestCase):
+    """Offline tests for MultiSearch merging and caching."""
+
+    def setUp(self):
+        MultiSearch.cache = TTLCache()
+
+    def test_merges_filters_and_reuses_cache(self):
+        filters = [SearchFilter.FILMS, SearchFilter.MEMBERS]
+        with patch.object(
+            Search, "get_results", autospec=True, side_effect=fake_get_results
+        ) as get_results:
+            data = MultiSearch("vendetta", filters).get_results(3)
+            self.assertEqual(data["filters"], ["films", "members"])
+            self.assertEqual(data["count"], 6)
+            self.assertEqual(data["results"][3]["filter"], "members")
+
+            smaller = MultiSearch("vendetta", filters).get_results(2)
+            self.assertEqual(get_results.call_count, 2)
+            self.assertEqual(smaller["by_filter"]["films"]["count"], 2)
+
+            MultiSearch("vendetta", filters).get_results(5)
+            self.assertEqual(get_results.call_count, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
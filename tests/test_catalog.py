@@ -0,0 +1,152 @@
+"""Tests for the catalog sweep."""
+
+import os
+import tempfile
+import unittest
+from typing import ClassVar
+from unittest.mock import patch
+
+from letterboxdpy.catalog import CatalogSweep, facet_url, plan_facets
+
+FACET_MOVIES = {
+    "genre:horror": {"1": {"slug": "alien"}, "2": {"slug": "the-thing"}},
+    "year:1982": {"2": {"slug": "the-thing"}, "3": {"slug": "blade-runner"}},
+}
+
+
+class FakeFilms:
+    """Stands in for Films, serving FACET_MOVIES by URL."""
+
+    requested: ClassVar[list] = []
+    workers: ClassVar[dict] = {}
+    broken: ClassVar[set] = set()
+
+    def __init__(
+        self, url: str, max: int | None = None, max_workers: int | None = None
+    ):
+        facet = next(f for f in FACET_MOVIES if facet_url(f) == url)
+        self.requested.append(facet)
+        self.workers[facet] = max_workers
+        if facet in self.broken:
+            raise RuntimeError("page failed")
+        self.movies = FACET_MOVIES[facet]
+        self.pages_read = 1
+
+
+class TestCatalogSweep(unittest.TestCase):
+    """Offline tests for plan_facets and CatalogSweep."""
+
+    def setUp(self):
+        FakeFilms.requested = []
+        FakeFilms.workers = {}
+        FakeFilms.broken = set()
+
+    def test_plan_facets(self):
+        plan = plan_facets(years=[1999], decades=[1990], genres=["drama"])
+        self.assertEqual(plan, ["year:1999", "decade:1990", "genre:drama"])
+        self.assertTrue(facet_url("decade:1990").endswith("/decade/1990s/"))
+        with self.assertRaises(ValueError):
+            facet_url("colour:red")
+
+    def test_run_dedupes_and_records_facets(self):
+        with patch("letterboxdpy.catalog.Films", FakeFilms):
+            films = CatalogSweep(FACET_MOVIES, max_workers=2).run()
+        self.assertEqual(sorted(films), ["1", "2", "3"])
+        self.assertEqual(sorted(films["2"]["facets"]), sorted(FACET_MOVIES))
+
+    def test_complete_facets(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "catalog")
+            with patch("letterboxdpy.catalog.Films", FakeFilms):
+                CatalogSweep(FACET_MOVIES, checkpoint=path).run()
+                capped = CatalogSweep(["genre:drama"], max_per_facet=2)
+                capped.merge("genre:drama", FACET_MOVIES["genre:horror"])
+            self.assertEqual(
+                CatalogSweep([], checkpoint=path).complete, {*FACET_MOVIES}
+            )
+        # Reading as many films as the cap may have cut the facet short.
+        self.assertEqual(capped.complete, set())
+
+    def test_resume_skips_done_facets(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "catalog")
+            with patch("letterboxdpy.catalog.Films", FakeFilms):
+                CatalogSweep(["genre:horror"], checkpoint=path).run()
+                sweep = CatalogSweep(FACET_MOVIES, checkpoint=path)
+                self.assertEqual(sweep.pending, ["year:1982"])
+                films = sweep.run()
+        self.assertEqual(FakeFilms.requested, ["genre:horror", "year:1982"])
+        self.assertEqual(len(films), 3)
+
+    def test_failures_are_saved_and_retried(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "catalog")
+            FakeFilms.broken = {"year:1982"}
+            with patch("letterboxdpy.catalog.Films", FakeFilms):
+                CatalogSweep(FACET_MOVIES, checkpoint=path, max_workers=1).run()
+                sweep = CatalogSweep(FACET_MOVIES, checkpoint=path)
+                self.assertEqual(sweep.failed, {"year:1982": "page failed"})
+                self.assertEqual(sweep.pending, ["year:1982"])
+
+                FakeFilms.broken = set()
+                sweep.run()
+            resumed = CatalogSweep(FACET_MOVIES, checkpoint=path)
+        self.assertEqual(resumed.failed, {})
+        self.assertEqual(resumed.pending, [])
+        self.assertEqual(resumed.films, sweep.films)
+
+    def test_truncated_journal(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "catalog")
+            with patch("letterboxdpy.catalog.Films", FakeFilms):
+                CatalogSweep(FACET_MOVIES, checkpoint=path, max_workers=1).run()
+                with open(f"{path}.jsonl") as f:
+                    first, second = f.readlines()
+                # A crash in the middle of the second append.
+                with open(f"{path}.jsonl", "w") as f:
+                    f.write(first + second[: len(second) // 2])
+
+                sweep = CatalogSweep(FACET_MOVIES, checkpoint=path)
+                self.assertEqual(len(sweep.pending), 1)
+                sweep.run()
+            resumed = CatalogSweep(FACET_MOVIES, checkpoint=path)
+        self.assertEqual(resumed.pending, [])
+        self.assertEqual(sorted(resumed.films), ["1", "2", "3"])
+        self.assertEqual(sorted(resumed.films["2"]["facets"]), sorted(FACET_MOVIES))
+
+    def test_save_compacts_the_journal(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "catalog")
+            with patch("letterboxdpy.catalog.Films", FakeFilms):
+                sweep = CatalogSweep(FACET_MOVIES, checkpoint=path, max_workers=1)
+                sweep.run()
+            sweep.save(path)
+            with open(f"{path}.jsonl") as f:
+                self.assertEqual(len(f.readlines()), 1)
+            self.assertEqual(os.listdir(tmp), ["catalog.jsonl"])
+            self.assertEqual(
+                CatalogSweep(FACET_MOVIES, checkpoint=path).films, sweep.films
+            )
+
+    def test_page_budget(self):
+        with patch("letterboxdpy.catalog.Films", FakeFilms):
+            sweep = CatalogSweep(FACET_MOVIES, max_workers=1, max_pages=1)
+            sweep.run()
+            self.assertEqual(sweep.pending, ["year:1982"])
+            # The only facet left gets every worker to read pages ahead.
+            CatalogSweep(["year:1982"], max_workers=4).run()
+        self.assertEqual(FakeFilms.workers, {"genre:horror": 1, "year:1982": 4})
+
+    def test_early_break_flushes_the_journal(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "catalog")
+            with patch("letterboxdpy.catalog.Films", FakeFilms):
+                sweep = CatalogSweep(FACET_MOVIES, checkpoint=path, max_workers=1)
+                crawl = sweep.iter_run()
+                facet = next(crawl)
+                crawl.close()
+            self.assertEqual(CatalogSweep([], checkpoint=path).done, {facet})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""Tests for the columnar (Arrow) export."""
+
+import importlib.util
+import os
+import tempfile
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+from letterboxdpy.core.models import DiaryEntry, Member
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+if HAS_PYARROW:
+    import pyarrow as pa
+
+    from letterboxdpy.columnar import (
+        ColumnarWriter,
+        export_columnar,
+        read_columnar,
+        schema,
+    )
+
+
+def fake_diary(username, *args, **kwargs):
+    """Two diary pages of three entries; the last one misses its slug."""
+    for page in (1, 2):
+        yield (
+            page,
+            {
+                f"{username}-{page}-{n}": DiaryEntry(
+                    f"Film {n}",
+                    None if (page, n) == (2, 2) else f"film-{n}",
+                    str(n),
+                    1990 + n,
+                    90 + n,
+                    False,
+                    n / 2 or None,
+                    n == 1,
+                    False,
+                    f"2024-0{page}-1{n}T00:00:00.000000Z",
+                    "https://letterboxd.com/",
+                    page,
+                )
+                for n in range(3)
+            },
+        )
+
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+class TestColumnar(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.base = os.path.join(tmp.name, "diary")
+        patcher = patch("letterboxdpy.columnar.iter_user_diary", side_effect=fake_diary)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_formats_roundtrip(self):
+        for format in ("parquet", "feather"):
+            with ColumnarWriter(self.base, "diary", format, batch_size=4) as writer:
+                self.assertEqual(writer.add_member("ana"), 6)
+                writer.add_member("bo")
+            self.assertEqual(writer.rows, 12)
+
+            table = read_columnar(writer.path)
+            self.assertEqual(table.schema, schema("diary"))
+            self.assertEqual(table.num_rows, 12)
+            rows = table.to_pylist()
+            self.assertEqual(rows[0]["owner"], "ana")
+            self.assertEqual(rows[0]["date"], date(2024, 1, 10))
+            self.assertEqual(rows[1]["rating"], 0.5)
+            self.assertIsNone(rows[5]["slug"])
+            self.assertEqual(rows[11]["log_id"], "bo-2-2")
+
+            slugs = table.column("slug").combine_chunks()
+            self.assertEqual(
+                slugs.dictionary.to_pylist(), ["film-0", "film-1", "film-2"]
+            )
+
+    def test_feather_is_memory_mapped(self):
+        path = f"{self.base}.feather"
+        self.assertEqual(export_columnar(["ana"], "diary", path, "feather"), 6)
+
+        allocated = pa.total_allocated_bytes()
+        table = read_columnar(path, columns=["owner", "runtime"])
+        self.assertEqual(table.column_names, ["owner", "runtime"])
+        self.assertEqual(pa.total_allocated_bytes(), allocated)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            schema("ratings")
+        with self.assertRaises(ValueError):
+            ColumnarWriter(self.base, "diary", "csv")
+
+    def test_member_rows(self):
+        members = [Member("cy", "Cy", "", 1, 2, 3, None, 5)]
+        with (
+            patch("letterboxdpy.columnar.iter_network_pages", return_value=[members]),
+            ColumnarWriter(self.base, "followers") as writer,
+        ):
+            writer.add_member("ana")
+        self.assertEqual(
+            read_columnar(writer.path).to_pylist(),
+            [
+                {
+                    "owner": "ana",
+                    "username": "cy",
+                    "name": "Cy",
+                    "followers": 1,
+                    "following": 2,
+                    "watched": 3,
+                    "lists": None,
+                    "likes": 5,
+                }
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Tests for the bounded concurrent map and task graph."""
+
+import threading
+import time
+import unittest
+
+from letterboxdpy.core.concurrency import map_ordered, run_graph
+
+
+class TestMapOrdered(unittest.TestCase):
+    """Offline tests for map_ordered."""
+
+    def test_keeps_input_order(self):
+        def slow_square(n):
+            time.sleep(0.01 * (5 - n))
+            return n * n
+
+        self.assertEqual(list(map_ordered(slow_square, range(5), 3)), [0, 1, 4, 9, 16])
+        self.assertEqual(list(map_ordered(slow_square, range(5))), [0, 1, 4, 9, 16])
+
+    def test_bounds_running_calls(self):
+        lock = threading.Lock()
+        running = peak = 0
+
+        def track(n):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return n
+
+        self.assertEqual(list(map_ordered(track, range(20), 4)), list(range(20)))
+        self.assertLessEqual(peak, 4)
+
+    def test_consumes_items_lazily(self):
+        pulled = []
+
+        def items():
+            for n in range(100):
+                pulled.append(n)
+                yield n
+
+        results = map_ordered(lambda n: n, items(), 2)
+        self.assertEqual(next(results), 0)
+        results.close()
+        self.assertLess(len(pulled), 5)
+
+
+class TestRunGraph(unittest.TestCase):
+    """Offline tests for run_graph."""
+
+    def test_dependencies_finish_first(self):
+        finished = []
+
+        def task(name):
+            def run():
+                time.sleep(0.01 if name == "diary" else 0)
+                finished.append(name)
+                return name.upper()
+
+            return run
+
+        tasks = {name: task(name) for name in ("diary", "wrapped", "films", "rated")}
+        dependencies = {"wrapped": ["diary"], "rated": ["films"]}
+        results = {
+            name: result for name, result, _ in run_graph(tasks, dependencies, 4)
+        }
+
+        self.assertEqual(results["wrapped"], "WRAPPED")
+        self.assertLess(finished.index("diary"), finished.index("wrapped"))
+        self.assertLess(finished.index("films"), finished.index("rated"))
+
+    def test_failure_skips_dependents(self):
+        def fail():
+            raise RuntimeError("offline")
+
+        tasks = {"diary": fail, "wrapped": lambda: 1, "films": lambda: 2}
+        outcome = {
+            name: (result, error)
+            for name, result, error in run_graph(tasks, {"wrapped": ["diary"]})
+        }
+        self.assertIsInstance(outcome["diary"][1], RuntimeError)
+        self.assertIs(outcome["wrapped"][1], outcome["diary"][1])
+        self.assertEqual(outcome["films"], (2, None))
+
+    def test_cycle(self):
+        tasks = {"a": lambda: 1, "b": lambda: 2}
+        with self.assertRaises(ValueError):
+            list(run_graph(tasks, {"a": ["b"], "b": ["a"]}))
+
+
+if __name__ == "__main__":
+    unittest.main()
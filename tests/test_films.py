@@ -0,0 +1,69 @@
+"""Tests for the concurrent Films discovery crawl."""
+
+import unittest
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from letterboxdpy.core.exceptions import ResourceNotFoundError
+from letterboxdpy.films import Films
+
+URL = "https://letterboxd.com/films/popular/"
+
+
+class FakeDiscovery:
+    """Serves horizontal discovery pages of `total` films, 72 per page."""
+
+    def __init__(self, total: int, per_page: int = Films.HORIZONTAL_MAX):
+        self.total = total
+        self.per_page = per_page
+        self.requested = []
+
+    def __call__(self, url: str) -> BeautifulSoup:
+        page = int(url.rstrip("/").split("/")[-1])
+        self.requested.append(page)
+        start = (page - 1) * self.per_page
+        if start >= self.total:
+            raise ResourceNotFoundError(url)
+        items = "".join(
+            f'<li class="posteritem" data-average-rating="3.5">'
+            f'<div class="react-component" data-film-id="{n}"'
+            f' data-item-slug="film-{n}" data-item-name="Film {n} (2001)"></div></li>'
+            for n in range(start, min(start + self.per_page, self.total))
+        )
+        return BeautifulSoup(f"<ul>{items}</ul>", "lxml")
+
+
+class TestFilms(unittest.TestCase):
+    def crawl(self, total: int, **kwargs) -> tuple[dict, FakeDiscovery]:
+        site = FakeDiscovery(total)
+        with patch("letterboxdpy.core.pagination.parse_url", site):
+            movies = Films(URL, **kwargs).movies
+        return movies, site
+
+    def test_max_bounds_the_pages(self):
+        movies, site = self.crawl(1000, max=100, max_workers=4)
+        self.assertEqual(len(movies), 100)
+        self.assertEqual(sorted(site.requested), [1, 2])
+
+    def test_short_page_ends_the_crawl(self):
+        movies, site = self.crawl(72 * 2 + 10)
+        self.assertEqual(len(movies), 154)
+        self.assertEqual(site.requested, [1, 2, 3])
+        self.assertEqual(movies["0"]["rating"], 3.5)
+
+    def test_workers_keep_page_order(self):
+        movies, site = self.crawl(72 * 3 + 1, max_workers=3)
+        self.assertEqual(list(movies), [str(n) for n in range(72 * 3 + 1)])
+        # Up to max_workers - 1 pages past the end may be requested.
+        self.assertLessEqual(len(site.requested), 4 + 2)
+
+    def test_exactly_one_full_page(self):
+        for max_workers in (None, 4):
+            with self.subTest(max_workers=max_workers):
+                movies, _ = self.crawl(72, max_workers=max_workers)
+                self.assertEqual(len(movies), 72)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+"""Tests for partitioning watched films by rating."""
+
+import unittest
+from unittest.mock import patch
+
+from letterboxdpy.pages.user_films import UserFilms, partition_user_films
+
+MOVIES = {
+    "alien": {"rating": 4.5, "liked": True},
+    "heat": {"rating": 4.5, "liked": False},
+    "cats": {"rating": 0.5, "liked": False},
+    "jaws": {"rating": None, "liked": True},
+}
+
+
+class TestPartitionUserFilms(unittest.TestCase):
+    """Offline tests for partition_user_films and the UserFilms snapshot."""
+
+    def test_buckets(self):
+        partitioned = partition_user_films(MOVIES)
+        self.assertEqual(list(partitioned["rated"][4.5]["movies"]), ["alien", "heat"])
+        self.assertEqual(partitioned["rated"][4.5]["rating_average"], 4.5)
+        self.assertEqual(partitioned["rated"][3.0]["count"], 0)
+        self.assertEqual(list(partitioned["not_rated"]["movies"]), ["jaws"])
+        self.assertEqual(list(partitioned["liked"]["movies"]), ["alien", "jaws"])
+
+    def test_rated_calls_share_one_crawl(self):
+        films = UserFilms("nmcassa")
+        with patch(
+            "letterboxdpy.pages.user_films.extract_user_films",
+            return_value={"movies": MOVIES},
+        ) as extract:
+            self.assertEqual(films.get_films_rated(0.5)["count"], 1)
+            self.assertEqual(films.get_films_rated(4.5)["count"], 2)
+            self.assertEqual(films.get_films_not_rated()["count"], 1)
+        extract.assert_called_once_with(films.url)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Tests that list and watchlist crawls reuse the already parsed first page."""
+
+import unittest
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from letterboxdpy.pages.user_list import UserList
+from letterboxdpy.pages.user_watchlist import UserWatchlist
+
+
+def vertical_page(films: range, count: int = 0) -> BeautifulSoup:
+    items = "".join(
+        f'<li class="posteritem"><div class="react-component" data-film-id="{n}"'
+        f' data-item-slug="film-{n}" data-item-name="Film {n}"></div></li>'
+        for n in films
+    )
+    return BeautifulSoup(
+        f'<div class="s-watchlist-content" data-num-entries="{count}"></div>'
+        f"<ul>{items}</ul>",
+        "lxml",
+    )
+
+
+class TestFirstPageReuse(unittest.TestCase):
+    def test_list_movies(self):
+        pages = [vertical_page(range(60)), vertical_page(range(60, 70))]
+        with patch(
+            "letterboxdpy.pages.user_list.parse_url", side_effect=pages
+        ) as parse_url:
+            movies = UserList("ana", "favourites").get_movies()
+        self.assertEqual(len(movies), 70)
+        self.assertEqual(parse_url.call_count, 2)
+
+    def test_watchlist_count_and_films(self):
+        first, second = vertical_page(range(28), 30), vertical_page(range(28, 30))
+        with patch(
+            "letterboxdpy.pages.user_watchlist.parse_url",
+            side_effect=[first, second],
+        ) as parse_url:
+            watchlist = UserWatchlist("ana")
+            self.assertEqual(watchlist.get_count(), 30)
+            self.assertEqual(len(watchlist.get_movies()), 30)
+            self.assertEqual(watchlist.get_watchlist()["count"], 30)
+            self.assertNotIn("page", watchlist.get_movies()["0"])
+        # The movies and the unfiltered watchlist share one crawl.
+        self.assertEqual(parse_url.call_count, 2)
+
+    def test_filtered_watchlist_fetches_its_own_first_page(self):
+        pages = [vertical_page(range(28), 30), vertical_page(range(3))]
+        with patch(
+            "letterboxdpy.pages.user_watchlist.parse_url", side_effect=pages
+        ) as parse_url:
+            watchlist = UserWatchlist("ana")
+            watchlist.get_count()
+            filtered = watchlist.get_watchlist({"genre": "drama"})
+        self.assertEqual(filtered["count"], 3)
+        self.assertIn("/genre/drama/", parse_url.call_args.args[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""Tests for follow snapshots, mutuals and follow diffs."""
+
+import os
+import tempfile
+import unittest
+from array import array
+from unittest.mock import patch
+
+from letterboxdpy.follow_analytics import (
+    FollowSnapshotStore,
+    intersect_sorted,
+    subtract_sorted,
+    track_follows,
+)
+
+
+class TestSortedSetAlgebra(unittest.TestCase):
+    def test_against_sets(self):
+        a = array("I", [1, 3, 4, 7, 9, 12])
+        b = array("I", [2, 3, 7, 8, 12, 15])
+        self.assertEqual(list(intersect_sorted(a, b)), sorted(set(a) & set(b)))
+        self.assertEqual(list(subtract_sorted(a, b)), sorted(set(a) - set(b)))
+        self.assertEqual(list(subtract_sorted(b, a)), sorted(set(b) - set(a)))
+        self.assertEqual(list(subtract_sorted(a, array("I"))), list(a))
+
+
+class TestTrackFollows(unittest.TestCase):
+    """Offline tests for track_follows with faked network pages."""
+
+    def track(self, store, followers, following, date):
+        network = {"followers": followers, "following": following}
+        with (
+            patch(
+                "letterboxdpy.follow_analytics.extract_network_usernames",
+                side_effect=lambda username, section: network[section],
+            ),
+            patch("letterboxdpy.follow_analytics.Date") as fake_date,
+        ):
+            fake_date.today.return_value.isoformat.return_value = date
+            return track_follows("ana", store)
+
+    def test_stats_and_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "follows")
+            first = self.track(
+                FollowSnapshotStore(path), ["ben", "cid", "dan"], ["ben", "eve"], "d1"
+            )
+            self.assertEqual(first["mutual"], ["ben"])
+            self.assertEqual(sorted(first["fans"]), ["cid", "dan"])
+            self.assertEqual(first["not_following_back"], ["eve"])
+            self.assertIsNone(first["changes"])
+
+            second = self.track(
+                FollowSnapshotStore(path), ["ben", "dan", "fay"], ["eve"], "d2"
+            )
+            self.assertEqual(second["since"], "d1")
+            self.assertEqual(
+                second["changes"],
+                {
+                    "new_followers": ["fay"],
+                    "lost_followers": ["cid"],
+                    "new_following": [],
+                    "unfollowed": ["ben"],
+                },
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
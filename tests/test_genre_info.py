@@ -0,0 +1,63 @@
+"""Tests for the concurrent, cached genre counts."""
+
+import unittest
+from unittest.mock import patch
+
+from letterboxdpy.constants.project import GENRES
+from letterboxdpy.pages import user_films
+from letterboxdpy.pages.user_films import (
+    extract_genre_count,
+    extract_user_genre_info,
+    genre_info_many,
+)
+from letterboxdpy.utils.utils_cache import TTLCache
+
+
+def genre_page(url: str) -> str:
+    genre = url.rstrip("/").split("/")[-1]
+    count = f"{GENRES.index(genre) * 1000:,}"
+    return (
+        '<p class="ui-block-heading"><span class="replace-if-you">'
+        f"<a href='/u/'>u</a> has</span> watched {count} {genre} films</p>"
+    )
+
+
+class TestGenreInfo(unittest.TestCase):
+    """Offline tests for extract_user_genre_info and genre_info_many."""
+
+    def setUp(self):
+        cache = patch.object(user_films, "GENRE_INFO_CACHE", TTLCache())
+        cache.start()
+        self.addCleanup(cache.stop)
+
+    def test_extract_genre_count(self):
+        horror = GENRES.index("horror") * 1000
+        self.assertEqual(extract_genre_count(genre_page("/genre/horror/")), horror)
+        self.assertEqual(extract_genre_count("<p>No films</p>"), 0)
+
+    def test_count_in_nested_element(self):
+        html = (
+            '<p><span class="replace-if-you">You have</span> watched'
+            ' <span class="count">1,234</span> horror films</p>'
+        )
+        self.assertEqual(extract_genre_count(html), 1234)
+        with self.assertRaises(RuntimeError):
+            extract_genre_count(
+                '<p><span class="replace-if-you">You have</span> watched</p>'
+            )
+
+    def test_counts_are_cached_per_user(self):
+        with patch(
+            "letterboxdpy.pages.user_films.fetch_text", side_effect=genre_page
+        ) as fetch:
+            info = extract_user_genre_info("nmcassa")
+            self.assertEqual(list(info), GENRES)
+            self.assertEqual(info["drama"], GENRES.index("drama") * 1000)
+
+            many = genre_info_many(["NMCASSA", "other"])
+            self.assertEqual(many["NMCASSA"], info)
+        self.assertEqual(fetch.call_count, 2 * len(GENRES))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+"""Tests for the Interner class."""
+
+import unittest
+
+from letterboxdpy.utils.interner import Interner
+
+
+class TestInterner(unittest.TestCase):
+    """Unit tests for string interning."""
+
+    def test_ids_are_dense_and_stable(self):
+        interner = Interner(["nmcassa", "fastfingertips"])
+        self.assertEqual(interner.intern("nmcassa"), 0)
+        self.assertEqual(interner.intern("new_user"), 2)
+        self.assertEqual(len(interner), 3)
+
+    def test_round_trip(self):
+        interner = Interner()
+        ids = interner.intern_many(["a", "b", "a", "c"])
+        self.assertEqual(list(ids), [0, 1, 0, 2])
+        self.assertEqual(interner.names(ids), ["a", "b", "a", "c"])
+        self.assertIsNone(interner.get("missing"))
+        self.assertIn("b", interner)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""Tests for the streaming JSON Lines file utility."""
+
+import importlib.util
+import os
+import tempfile
+import types
+import unittest
+
+from letterboxdpy.utils.utils_file import JsonLinesFile
+
+RECORDS = [{"id": str(n), "name": f"Film {n}", "year": 1990 + n} for n in range(100)]
+
+
+class TestJsonLinesFile(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.base = os.path.join(tmp.name, "films")
+
+    def test_roundtrip_plain_and_gzip(self):
+        for compression in (None, "gzip"):
+            count = JsonLinesFile.save(self.base, iter(RECORDS), compression)
+            self.assertEqual(count, len(RECORDS))
+            self.assertEqual(JsonLinesFile.load(self.base, compression), RECORDS)
+
+        self.assertTrue(os.path.exists(f"{self.base}.jsonl"))
+        self.assertEqual(JsonLinesFile.load(f"{self.base}.jsonl.gz"), RECORDS)
+
+    def test_append_and_lazy_read(self):
+        JsonLinesFile.save(self.base, RECORDS[:50], "gzip")
+        JsonLinesFile.append(self.base, RECORDS[50:], "gzip")
+
+        records = JsonLinesFile.iter_load(self.base, "gzip")
+        self.assertIsInstance(records, types.GeneratorType)
+        self.assertEqual(list(records), RECORDS)
+
+    def test_key_pairs(self):
+        pairs = ((record["id"], {"name": record["name"]}) for record in RECORDS[:2])
+        JsonLinesFile.save(self.base, pairs, key="id")
+        self.assertEqual(
+            JsonLinesFile.load(self.base),
+            [{"id": "0", "name": "Film 0"}, {"id": "1", "name": "Film 1"}],
+        )
+
+    def test_missing_and_invalid(self):
+        self.assertIsNone(JsonLinesFile.load(self.base))
+        with self.assertRaises(ValueError):
+            JsonLinesFile.save(self.base, RECORDS, compression="bz2")
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("zstandard"), "zstandard is not installed"
+    )
+    def test_zstd_across_frames(self):
+        JsonLinesFile.save(self.base, RECORDS[:50], "zstd")
+        JsonLinesFile.append(self.base, RECORDS[50:], "zstd")
+        self.assertEqual(JsonLinesFile.load(self.base, "zstd"), RECORDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
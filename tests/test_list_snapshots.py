@@ -0,0 +1,65 @@
+"""Tests for list snapshots and change detection."""
+
+import unittest
+from typing import ClassVar
+from unittest.mock import patch
+
+from letterboxdpy.list_snapshots import ListSnapshotStore, diff_film_ids, refresh_lists
+
+
+class FakeUserList:
+    """Stands in for UserList, serving LISTS by (username, slug)."""
+
+    LISTS: ClassVar[dict] = {}
+    crawled: ClassVar[list] = []
+
+    def __init__(self, username: str, slug: str):
+        self.key = f"{username}/{slug}"
+        self.date_updated, self.films = self.LISTS[self.key]
+
+    def get_date_updated(self):
+        return self.date_updated
+
+    def get_count(self):
+        return len(self.films)
+
+    def get_movies(self):
+        self.crawled.append(self.key)
+        return {film_id: {} for film_id in self.films}
+
+
+class TestListSnapshots(unittest.TestCase):
+    """Offline tests for diff_film_ids and refresh_lists."""
+
+    def test_diff_film_ids(self):
+        diff = diff_film_ids(["1", "2", "3", "4"], ["1", "4", "2", "5"])
+        self.assertEqual(diff["inserted"], [{"id": "5", "position": 4}])
+        self.assertEqual(diff["removed"], [{"id": "3", "position": 3}])
+        self.assertEqual(diff["moved"], [{"id": "4", "from": 4, "to": 2}])
+        self.assertEqual(
+            diff_film_ids(["1"], ["1"]), {"inserted": [], "removed": [], "moved": []}
+        )
+
+    def test_refresh_crawls_only_changed_lists(self):
+        store = ListSnapshotStore()
+        FakeUserList.crawled = []
+        FakeUserList.LISTS = {
+            "a/one": ("2024-01-01", ["1", "2"]),
+            "a/two": ("2024-01-01", ["3"]),
+        }
+        refs = [("a", "one"), "https://letterboxd.com/a/list/two/"]
+
+        with patch("letterboxdpy.list_snapshots.UserList", FakeUserList):
+            first = [r["status"] for r in refresh_lists(refs, store, max_workers=2)]
+            FakeUserList.LISTS["a/two"] = ("2024-02-01", ["4", "3"])
+            second = list(refresh_lists(refs, store))
+
+        self.assertEqual(first, ["new", "new"])
+        self.assertEqual([r["status"] for r in second], ["unchanged", "changed"])
+        self.assertEqual(second[1]["diff"]["inserted"], [{"id": "4", "position": 1}])
+        self.assertEqual(FakeUserList.crawled, ["a/one", "a/two", "a/two"])
+        self.assertEqual(store.get("a/two")["films"], ["4", "3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
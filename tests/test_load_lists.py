@@ -0,0 +1,49 @@
+"""Tests for the concurrent bulk list loader."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from letterboxdpy.core.exceptions import PageLoadError
+from letterboxdpy.list import List, load_lists
+
+
+class FakeListPages:
+    """Stands in for List.ListPages; the 'private' list fails to load."""
+
+    def __init__(self, username: str, slug: str) -> None:
+        if slug == "private":
+            raise PageLoadError(f"https://letterboxd.com/{username}/list/{slug}/")
+        self.list = MagicMock()
+        self.list.get_count.return_value = 2
+        self.list.get_movies.return_value = {"1": {"slug": slug}, "2": {}}
+
+
+class TestLoadLists(unittest.TestCase):
+    def test_failures_are_yielded_with_their_error(self):
+        refs = [
+            ("ana", "favourites"),
+            "https://letterboxd.com/ben/list/private/",
+            {"url": "https://letterboxd.com/cal/list/horror/"},
+        ]
+        with patch.object(List, "ListPages", FakeListPages):
+            results = list(load_lists(refs, max_workers=2))
+
+        self.assertEqual([ref for ref, _, _ in results], refs)
+        (_, first, no_error), (_, missing, error), (_, last, _) = results
+        self.assertIsNone(no_error)
+        self.assertIsNone(missing)
+        self.assertIsInstance(error, PageLoadError)
+        self.assertEqual(last.movies["1"]["slug"], "horror")
+        # Movies were fetched while loading, not on first access.
+        first.pages.list.get_movies.assert_called_once()
+        self.assertEqual(len(first.movies), 2)
+        first.pages.list.get_movies.assert_called_once()
+
+    def test_without_movies(self):
+        with patch.object(List, "ListPages", FakeListPages):
+            ((_, loaded, _),) = load_lists([("ana", "watch")], with_movies=False)
+        loaded.pages.list.get_movies.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
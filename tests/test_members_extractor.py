@@ -0,0 +1,118 @@
+"""Tests for the shared member table parser."""
+
+import unittest
+from unittest.mock import patch
+
+from letterboxdpy.pages.movie_members import MovieMembers
+from letterboxdpy.pages.user_network import extract_network, extract_network_usernames
+from letterboxdpy.utils.members_extractor import parse_member_table
+
+ROW = """
+<tr>
+  <td class="table-person">
+    <div class="person-summary">
+      <a class="avatar -a40" href="/{username}/">
+        <img alt="{username}" src="https://a.ltrbxd.com/resized/avatar/{username}-0-80-0-80-crop.jpg?v=1">
+      </a>
+      <h3 class="title-3"><a class="name" href="/{username}/">{name}</a></h3>
+      <small class="metadata">
+        <a href="/{username}/followers/">1,204 followers</a>,
+        <a href="/{username}/following/">following 6</a>
+      </small>
+    </div>
+  </td>
+  <td class="col-watched"><a href="/{username}/films/">2,345</a></td>
+  <td class="col-lists"><a href="/{username}/lists/">12</a></td>
+  <td class="col-likes"><a href="/{username}/likes/">87</a></td>
+</tr>
+"""
+
+
+def page(usernames) -> str:
+    rows = "".join(
+        ROW.format(username=username, name=username.title()) for username in usernames
+    )
+    return f'<html><body><table class="member-table">{rows}</table></body></html>'
+
+
+class TestMembersExtractor(unittest.TestCase):
+    """Offline tests for parse_member_table and the network extractors."""
+
+    def test_full_rows(self):
+        (member,) = parse_member_table(page(["ana"]))
+        self.assertEqual(
+            member,
+            {
+                "username": "ana",
+                "name": "Ana",
+                "url": "https://letterboxd.com/ana",
+                "avatar": {
+                    "exists": True,
+                    "upscaled": True,
+                    "url": "https://a.ltrbxd.com/resized/avatar/ana-0-1000-0-1000-crop.jpg",
+                },
+                "followers": 1204,
+                "following": 6,
+                "watched": 2345,
+                "lists": 12,
+                "likes": 87,
+            },
+        )
+
+    def test_usernames_only(self):
+        self.assertEqual(
+            parse_member_table(page(["ana", "ben"]), usernames_only=True),
+            ["ana", "ben"],
+        )
+        self.assertEqual(parse_member_table("<html><p>No members</p></html>"), [])
+
+    def test_network_pages(self):
+        pages = [page(f"user{i}" for i in range(25)), page(["last"])]
+        with patch(
+            "letterboxdpy.pages.user_network.fetch_text", side_effect=pages
+        ) as fetch:
+            network = extract_network("ana", "followers")
+        self.assertEqual(len(network), 26)
+        self.assertEqual(network["last"]["watched"], 2345)
+        self.assertEqual(fetch.call_count, 2)
+
+        with patch("letterboxdpy.pages.user_network.fetch_text", side_effect=pages):
+            usernames = extract_network_usernames("ana", "followers", limit=1)
+        self.assertEqual(usernames, [f"user{i}" for i in range(25)])
+
+    def test_film_audience(self):
+        fans = [f"fan{i}" for i in range(25)]
+        pages = [
+            html.replace("member-table", "person-table")
+            for html in [page(fans), page(["last"])]
+        ]
+        with patch(
+            "letterboxdpy.pages.movie_members.fetch_text", side_effect=pages
+        ) as fetch:
+            audience = MovieMembers("v-for-vendetta").get_audience("fans")
+        self.assertEqual(
+            fetch.call_args_list[0].args[0],
+            "https://letterboxd.com/film/v-for-vendetta/fans/page/1/",
+        )
+        self.assertEqual(audience["count"], 26)
+        self.assertEqual(audience["interner"].names(audience["ids"]), [*fans, "last"])
+
+        with patch("letterboxdpy.pages.movie_members.fetch_text", side_effect=pages):
+            likes = list(MovieMembers("v-for-vendetta").iter_audience("likes", max=3))
+        self.assertEqual(likes, fans[:3])
+
+    def test_members_audience_reuses_first_page(self):
+        members = MovieMembers("v-for-vendetta")
+        members.html = page([f"user{i}" for i in range(25)])
+        with patch(
+            "letterboxdpy.pages.movie_members.fetch_text", side_effect=[page(["last"])]
+        ) as fetch:
+            audience = list(members.iter_audience())
+        self.assertEqual(len(audience), 26)
+        fetch.assert_called_once_with(
+            "https://letterboxd.com/film/v-for-vendetta/members/page/2/"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""Tests for the film reviews parser and its cut-offs."""
+
+import unittest
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from letterboxdpy.pages.movie_reviews import (
+    extract_movie_review,
+    extract_review_logs,
+    get_rated_url,
+    iter_movie_reviews,
+)
+
+URL = "https://letterboxd.com/film/v-for-vendetta/reviews"
+
+ADDED = '<span>Added</span> <span class="date"><time datetime="{date}T10:00:00Z">x</time></span>'
+WATCHED = '<span>Watched</span> <span class="date">{day}</span>'
+UNLABELLED = '<span class="date"><time datetime="{date}T10:00:00Z">x</time></span>'
+
+
+def article(log_id: int, date: str, rating: int = 8) -> str:
+    return f"""
+    <article data-object-id="viewing:{log_id}" data-owner="user{log_id}">
+      <a class="avatar" href="/user{log_id}/"></a>
+      <strong class="displayname">User {log_id}</strong>
+      <a href="/user{log_id}/film/v-for-vendetta/">review</a>
+      <span class="rating rated-{rating}"></span>
+      {date}
+      <div class="body-text"><p>Review {log_id}</p></div>
+      <p class="like-link-target" data-count="1,204"></p>
+    </article>"""
+
+
+def page(articles: list) -> BeautifulSoup:
+    return BeautifulSoup(
+        f'<div class="viewing-list">{"".join(articles)}</div>', "html.parser"
+    )
+
+
+class TestMovieReviews(unittest.TestCase):
+    def test_extract_movie_review(self):
+        (log,) = extract_review_logs(
+            page([article(7, WATCHED.format(day="01 Mar 2024"))])
+        )
+        log_id, review = extract_movie_review(log, 3)
+        self.assertEqual(log_id, "7")
+        self.assertEqual(
+            review["user"],
+            {
+                "username": "user7",
+                "display_name": "User 7",
+                "url": "https://letterboxd.com/user7/",
+            },
+        )
+        self.assertEqual(review["type"], "Watched")
+        self.assertEqual(
+            review["link"], "https://letterboxd.com/user7/film/v-for-vendetta/"
+        )
+        self.assertEqual(review["rating"], 4.0)
+        self.assertEqual(review["review"]["content"], "Review 7")
+        self.assertEqual(review["likes"], 1204)
+        self.assertTrue(review["date"].startswith("2024-03-01"))
+        self.assertEqual(review["page"], 3)
+
+    def crawl(self, pages: list, **kwargs) -> tuple[list, list]:
+        doms = [page(articles) for articles in pages]
+        with patch(
+            "letterboxdpy.pages.movie_reviews.iter_all_pages",
+            return_value=iter(enumerate(doms, 1)),
+        ) as iter_all_pages:
+            ids = [log_id for log_id, _ in iter_movie_reviews(URL, **kwargs)]
+        return ids, iter_all_pages.call_args.args
+
+    def test_max(self):
+        pages = [[article(n, ADDED.format(date="2024-05-01")) for n in range(12)]] * 2
+        ids, (url, last_page, _) = self.crawl(pages, max=14)
+        self.assertEqual(len(ids), 14)
+        self.assertEqual((url, last_page), (URL, 2))
+
+    def test_since_stops_at_first_old_review(self):
+        pages = [
+            [
+                article(1, ADDED.format(date="2024-05-03")),
+                article(2, WATCHED.format(day="02 May 2024")),
+                # No label: skipped, the crawl goes on.
+                article(3, UNLABELLED.format(date="2019-01-01")),
+                article(4, WATCHED.format(day="01 Jan 2019")),
+                article(5, ADDED.format(date="2024-06-01")),
+            ]
+        ]
+        ids, (url, _, _) = self.crawl(pages, since="2024-01-01")
+        self.assertEqual(url, f"{URL}/by/added")
+        self.assertEqual(ids, ["1", "2"])
+
+    def test_since_stops_after_page_of_old_unlabelled_reviews(self):
+        old = [article(n, UNLABELLED.format(date="2019-01-01")) for n in range(12)]
+        new = [article(n, ADDED.format(date="2024-05-01")) for n in range(12, 24)]
+        ids, _ = self.crawl([new, old, new], since="2024-01-01")
+        self.assertEqual(ids, [str(n) for n in range(12, 24)])
+
+    def test_invalid_rating(self):
+        with self.assertRaises(ValueError):
+            get_rated_url(URL, 4.2)
+        self.assertEqual(get_rated_url(URL, 4.5), f"{URL}/rated/4.5")
+
+
+if __name__ == "__main__":
+    unittest.main()
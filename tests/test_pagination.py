@@ -0,0 +1,105 @@
+"""Tests for the paginated page streaming helpers."""
+
+import unittest
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from letterboxdpy.core.exceptions import ResourceNotFoundError
+from letterboxdpy.core.pagination import iter_all_pages, iter_pages, pages_needed
+
+BASE_URL = "https://letterboxd.com/film/v-for-vendetta/reviews"
+
+
+def make_page(page: int, last_page: int) -> BeautifulSoup:
+    """Builds a minimal page carrying the pagination marker."""
+    items = "".join(
+        f'<li><a href="/page/{n}/">{n}</a></li>' for n in range(1, last_page + 1)
+    )
+    return BeautifulSoup(
+        f'<div class="paginate-pages"><ul>{items}</ul></div><p>{page}</p>', "lxml"
+    )
+
+
+class FakeSite:
+    """Serves numbered pages up to `last_page`, 404 afterwards."""
+
+    def __init__(self, last_page: int):
+        self.last_page = last_page
+        self.requested = []
+
+    def __call__(self, url: str) -> BeautifulSoup:
+        page = int(url.rstrip("/").split("/")[-1])
+        self.requested.append(page)
+        if page > self.last_page:
+            raise ResourceNotFoundError(url)
+        return make_page(page, self.last_page)
+
+
+class TestPagination(unittest.TestCase):
+    """Offline tests for iter_pages and iter_all_pages."""
+
+    def test_pages_needed(self):
+        self.assertIsNone(pages_needed(None, 12))
+        self.assertEqual(pages_needed(12, 12), 1)
+        self.assertEqual(pages_needed(13, 12), 2)
+
+    def test_iter_pages_keeps_order_with_workers(self):
+        site = FakeSite(last_page=9)
+        with patch("letterboxdpy.core.pagination.parse_url", site):
+            pages = [page for page, _ in iter_pages(BASE_URL, max_workers=4)]
+        self.assertEqual(pages, list(range(1, 10)))
+
+    def test_iter_pages_first_page_missing_raises(self):
+        site = FakeSite(last_page=0)
+        with (
+            patch("letterboxdpy.core.pagination.parse_url", site),
+            self.assertRaises(ResourceNotFoundError),
+        ):
+            list(iter_pages(BASE_URL))
+
+    def test_iter_all_pages_reads_marker(self):
+        site = FakeSite(last_page=5)
+        with patch("letterboxdpy.core.pagination.parse_url", site):
+            pages = [page for page, _ in iter_all_pages(BASE_URL, max_workers=3)]
+        self.assertEqual(pages, [1, 2, 3, 4, 5])
+        self.assertEqual(sorted(site.requested), [1, 2, 3, 4, 5])
+
+    def test_iter_all_pages_respects_last_page(self):
+        site = FakeSite(last_page=50)
+        with patch("letterboxdpy.core.pagination.parse_url", site):
+            pages = [page for page, _ in iter_all_pages(BASE_URL, last_page=2)]
+        self.assertEqual(pages, [1, 2])
+        self.assertEqual(site.requested, [1, 2])
+
+    def test_iter_all_pages_open_ended_without_marker(self):
+        site = FakeSite(last_page=3)
+        unmarked = BeautifulSoup("<p>1</p>", "lxml")
+        with patch("letterboxdpy.core.pagination.parse_url", site):
+            closed = [page for page, _ in iter_all_pages(BASE_URL, first_dom=unmarked)]
+            opened = [
+                page
+                for page, _ in iter_all_pages(
+                    BASE_URL, first_dom=unmarked, open_ended=True
+                )
+            ]
+        self.assertEqual(closed, [1])
+        self.assertEqual(opened, [1, 2, 3])
+
+    def test_iter_all_pages_open_ended_single_page(self):
+        unmarked = BeautifulSoup("<p>1</p>", "lxml")
+        for max_workers in (None, 4):
+            with self.subTest(max_workers=max_workers):
+                site = FakeSite(last_page=1)
+                with patch("letterboxdpy.core.pagination.parse_url", site):
+                    pages = [
+                        page
+                        for page, _ in iter_all_pages(
+                            BASE_URL, None, max_workers, unmarked, open_ended=True
+                        )
+                    ]
+                self.assertEqual(pages, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
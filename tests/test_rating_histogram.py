@@ -0,0 +1,71 @@
+"""Tests for the profile ratings chart parser."""
+
+import unittest
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from letterboxdpy.pages.user_profile import (
+    extract_rating_histogram,
+    extract_rating_histograms,
+)
+
+BAR = (
+    '<li class="rating-histogram-bar" style="width: 15px; left: {left}px">'
+    '<a href="/nmcassa/films/rated/{rating}/by/date/" class="ir tooltip"'
+    ' data-original-title="{count}&nbsp;{stars} ratings (3%)">'
+    "{count}&nbsp;{stars} ratings (3%)<i></i></a></li>"
+)
+EMPTY_BAR = '<li class="rating-histogram-bar"><i style="height: 1px;"></i></li>'
+
+
+def profile(counts: list) -> BeautifulSoup:
+    bars = "".join(
+        BAR.format(
+            left=index * 16,
+            rating=(".5", "1", "1.5", "2", "2.5", "3", "3.5", "4", "4.5", "5")[index],
+            count=count,
+            stars="★" * (index // 2 + 1),
+        )
+        if count
+        else EMPTY_BAR
+        for index, count in enumerate(counts)
+    )
+    return BeautifulSoup(
+        '<section class="section ratings-histogram-chart">'
+        f'<div class="rating-histogram"><ul>{bars}</ul></div></section>',
+        "html.parser",
+    )
+
+
+class TestRatingHistogram(unittest.TestCase):
+    def test_counts_by_rating(self):
+        counts = [3, 0, 12, 40, "1,204", 88, 0, 61, 9, 27]
+        histogram = extract_rating_histogram(profile(counts))
+        self.assertEqual(list(histogram), [0.5 * n for n in range(1, 11)])
+        self.assertEqual(histogram[0.5], 3)
+        self.assertEqual(histogram[1.0], 0)
+        self.assertEqual(histogram[2.5], 1204)
+        self.assertEqual(histogram[5.0], 27)
+
+    def test_no_ratings(self):
+        histogram = extract_rating_histogram(
+            BeautifulSoup("<div></div>", "html.parser")
+        )
+        self.assertEqual(sum(histogram.values()), 0)
+        self.assertEqual(len(histogram), 10)
+
+    def test_many_members(self):
+        doms = {"a": profile([1] * 10), "b": profile([0] * 9 + [5])}
+        with patch(
+            "letterboxdpy.pages.user_profile.parse_url",
+            side_effect=lambda url: doms[url.rsplit("/", 1)[-1]],
+        ):
+            histograms = extract_rating_histograms(["b", "a"], max_workers=2)
+        self.assertEqual(list(histograms), ["b", "a"])
+        self.assertEqual(sum(histograms["a"].values()), 10)
+        self.assertEqual(histograms["b"][5.0], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
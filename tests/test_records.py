@@ -0,0 +1,122 @@
+"""Tests for the slotted records returned with as_dicts=False."""
+
+import unittest
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from letterboxdpy.core.models import DiaryEntry, FilmRef, Member, WatchedFilm
+from letterboxdpy.pages.user_diary import extract_user_diary
+from letterboxdpy.pages.user_films import (
+    calculate_film_statistics,
+    extract_movies_from_user_watched,
+    partition_user_films,
+)
+from letterboxdpy.utils.members_extractor import parse_member_table
+from letterboxdpy.utils.movies_extractor import extract_movies_from_vertical_list
+
+FILM = """
+<li class="griditem">
+  <div class="react-component" data-film-id="{id}" data-item-slug="{slug}"
+       data-item-name="{name} (1979)"></div>
+  <p class="poster-viewingdata"><span class="rating rated-{stars}"></span>{like}</p>
+</li>
+"""
+
+DIARY = """
+<table id="diary-table">
+  <thead><tr>
+    <th class="col-daydate"></th><th class="col-production"></th>
+    <th class="col-releaseyear"></th><th class="col-rating"></th>
+    <th class="col-like"></th><th class="col-rewatch"></th>
+    <th class="col-review"></th><th class="col-actions"></th>
+  </tr></thead>
+  <tbody><tr data-viewing-id="516951060">
+    <td class="col-daydate"><a href="/ana/films/diary/for/2024/05/06/">06</a></td>
+    <td class="col-production">
+      <div class="react-component" data-item-slug="alien" data-film-id="51714"
+           data-item-name="Alien (1979)"></div>
+    </td>
+    <td class="col-releaseyear">1979</td>
+    <td class="col-rating"><span class="rating rated-9"></span></td>
+    <td class="col-like"><span class="icon-liked"></span></td>
+    <td class="col-rewatch icon-status-off"></td>
+    <td class="col-review"><a href="/ana/film/alien/">review</a></td>
+    <td class="col-actions" data-film-run-time="117"></td>
+  </tr></tbody>
+</table>
+"""
+
+MEMBERS = """
+<table class="person-table"><tr>
+  <td><div class="person-summary">
+    <a class="avatar" href="/ana/"><img alt="ana" src=""></a>
+    <a class="name" href="/ana/">Ana</a>
+  </div></td>
+  <td class="col-watched"><a href="/ana/films/">2,345</a></td>
+</tr></table>
+"""
+
+
+def films_page() -> BeautifulSoup:
+    html = FILM.format(
+        id="51714", slug="alien", name="Alien", stars=9, like='<span class="like">'
+    ) + FILM.format(id="2", slug="heat", name="Heat", stars=0, like="")
+    return BeautifulSoup(f"<ul>{html}</ul>", "html.parser")
+
+
+class TestRecords(unittest.TestCase):
+    def assertRecordsMatch(self, records: dict, dicts: dict) -> None:
+        self.assertEqual(list(records), list(dicts))
+        for key, record in records.items():
+            self.assertFalse(hasattr(record, "__dict__"))
+            self.assertEqual(record.to_dict(), dicts[key])
+
+    def test_films(self):
+        records = extract_movies_from_user_watched(films_page(), as_dicts=False)
+        dicts = extract_movies_from_user_watched(films_page())
+        self.assertRecordsMatch(records, dicts)
+
+        alien = records["alien"]
+        self.assertIsInstance(alien, WatchedFilm)
+        self.assertEqual(alien.url, "https://letterboxd.com/film/alien/")
+        self.assertEqual((alien["rating"], alien.get("liked")), (4.5, True))
+        with self.assertRaises(KeyError):
+            alien["missing"]
+
+        self.assertEqual(
+            calculate_film_statistics(records), calculate_film_statistics(dicts)
+        )
+        self.assertIs(
+            partition_user_films(records)["rated"][4.5]["movies"]["alien"], alien
+        )
+
+        refs = extract_movies_from_vertical_list(films_page(), as_dicts=False)
+        self.assertIsInstance(refs["51714"], FilmRef)
+        self.assertRecordsMatch(refs, extract_movies_from_vertical_list(films_page()))
+
+    def test_diary(self):
+        dom = BeautifulSoup(DIARY, "html.parser")
+        with patch("letterboxdpy.pages.user_diary.parse_url", return_value=dom):
+            records = extract_user_diary("ana", as_dicts=False)
+            dicts = extract_user_diary("ana")
+
+        self.assertEqual(records["count"], dicts["count"])
+        self.assertRecordsMatch(records["entries"], dicts["entries"])
+        entry = records["entries"]["516951060"]
+        self.assertIsInstance(entry, DiaryEntry)
+        self.assertEqual(entry["actions"]["rating"], 4.5)
+        self.assertEqual(entry.page_no, 1)
+        self.assertEqual(dicts["entries"]["516951060"]["runtime"], 117)
+
+    def test_members(self):
+        (member,) = parse_member_table(MEMBERS, as_dicts=False)
+        self.assertIsInstance(member, Member)
+        self.assertEqual(member.to_dict(), parse_member_table(MEMBERS)[0])
+        self.assertEqual(member.url, "https://letterboxd.com/ana")
+        self.assertEqual(member["watched"], 2345)
+        self.assertFalse(member.avatar["exists"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
 """Tests for the Scraper class."""
 
+import time
 import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from bs4 import BeautifulSoup
 
@@ -32,3 +35,23 @@ class TestScraper(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
+
+
+class TestRateLimit(unittest.TestCase):
+    """Offline test for the shared request rate limit."""
+
+    def test_requests_are_spaced(self):
+        session = SimpleNamespace(
+            get=lambda url, **kwargs: SimpleNamespace(status_code=200, text="")
+        )
+        Scraper.set_rate_limit(50)
+        self.addCleanup(Scraper.set_rate_limit, None)
+        with self.assertRaises(ValueError):
+            Scraper.set_rate_limit(0)
+
+        with patch.object(Scraper, "instance", return_value=session):
+            started = time.monotonic()
+            for _ in range(6):
+                Scraper.get_text("https://letterboxd.com/")
+        # Six starts at 50/s span at least five intervals of 20 ms.
+        self.assertGreaterEqual(time.monotonic() - started, 0.1)
@@ -0,0 +1,135 @@
+"""Tests for the to_dict protocol and the JSON backends."""
+
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+
+from letterboxdpy.core.encoder import Encoder, SecretsEncoder, to_dict
+from letterboxdpy.core.models import MovieJSON
+from letterboxdpy.utils.utils_file import JsonFile, JsonLinesFile
+from letterboxdpy.watchlist import Watchlist
+
+
+class Color(Enum):
+    RED = "red"
+
+
+class Poster:
+    def __init__(self):
+        self.url = "https://a.ltrbxd.com/poster.jpg"
+        self.pages = "hidden in nested objects too"
+
+
+@dataclass
+class Entry:
+    slug: str
+    watched: datetime
+
+
+def sample() -> Watchlist:
+    """A Watchlist facade without the requests made by __init__."""
+    watchlist = Watchlist.__new__(Watchlist)
+    watchlist.username = "ana"
+    watchlist.pages = object()
+    watchlist.count = 2
+    watchlist.color = Color.RED
+    watchlist.poster = Poster()
+    watchlist.ratings = {4.5: ("alien", "heat"), 1: ["cats"]}
+    watchlist.title = "Amélie"
+    return watchlist
+
+
+class TestToDict(unittest.TestCase):
+    def test_matches_secrets_encoder(self):
+        watchlist = sample()
+        expected = json.loads(
+            json.dumps(watchlist, cls=SecretsEncoder, secrets=["pages"])
+        )
+        self.assertEqual(watchlist.jsonify(), expected)
+        self.assertEqual(json.loads(str(watchlist)), expected)
+
+        data = watchlist.to_dict()
+        self.assertNotIn("pages", data)
+        self.assertEqual(data["poster"], {"url": "https://a.ltrbxd.com/poster.jpg"})
+        self.assertEqual(data["ratings"][4.5], ["alien", "heat"])
+        self.assertEqual(to_dict(Poster()), vars(Poster()))
+
+    def test_json_keys(self):
+        watchlist = sample()
+        watchlist.ratings = {
+            4.5: {1: "alien"},
+            True: [],
+            None: MovieJSON.from_dict({"id": 1}),
+        }
+        data = to_dict(watchlist, secrets=["pages"], json_keys=True)
+        self.assertEqual(data, json.loads(JsonFile.stringify(watchlist.to_dict())))
+        self.assertEqual(list(data["ratings"]), ["4.5", "true", "null"])
+
+    def test_movie_json(self):
+        movie = MovieJSON.from_dict(
+            {"id": 1, "name": "Alien", "directors": [{"name": "Ridley Scott"}]}
+        )
+        data = movie.to_dict()
+        self.assertEqual(data["name"], "Alien")
+        self.assertEqual(data["directors"], [{"name": "Ridley Scott"}])
+
+
+@unittest.skipUnless(importlib.util.find_spec("orjson"), "orjson is not installed")
+class TestOrjsonBackend(unittest.TestCase):
+    def setUp(self):
+        JsonFile.set_backend("orjson")
+        self.addCleanup(JsonFile.set_backend, "json")
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.base = os.path.join(tmp.name, "export")
+
+    def test_same_json(self):
+        data = sample().to_dict()
+        for indent in (None, 2):
+            self.assertEqual(
+                json.loads(JsonFile.stringify(data, indent=indent)),
+                json.loads(json.dumps(data, indent=indent)),
+            )
+        self.assertEqual(
+            json.loads(str(sample())), json.loads(json.dumps(sample().jsonify()))
+        )
+
+    def test_encoder_and_files(self):
+        text = JsonFile.stringify(sample(), encoder=SecretsEncoder, secrets=["pages"])
+        self.assertNotIn("pages", json.loads(text))
+
+        data = sample().jsonify()
+        JsonFile.save(self.base, data, indent=None)
+        self.assertEqual(JsonFile.load(self.base), data)
+
+        JsonLinesFile.save(self.base, [data, data], "gzip")
+        self.assertEqual(JsonLinesFile.load(self.base, "gzip"), [data, data])
+
+    def test_dataclass_and_datetime_match_json(self):
+        entry = Entry("alien", datetime(2024, 5, 1, 10, 0, 0, 120, timezone.utc))
+        lines = {}
+        for backend in JsonFile.BACKENDS:
+            JsonFile.set_backend(backend)
+            JsonLinesFile.save(self.base, [entry], encoder=Encoder)
+            with open(f"{self.base}.jsonl", "rb") as f:
+                lines[backend] = f.read()
+            with self.assertRaises(TypeError):
+                JsonFile.stringify(entry)
+        self.assertEqual(lines["orjson"], lines["json"])
+        self.assertEqual(
+            json.loads(lines["json"]),
+            {"slug": "alien", "watched": "2024-05-01T10:00:00.000120+00:00"},
+        )
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            JsonFile.set_backend("ujson")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""Tests for the sparse rating matrix similarity."""
+
+import importlib.util
+import math
+import unittest
+from unittest.mock import patch
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+if HAS_NUMPY:
+    from letterboxdpy.similarity import RatingMatrix, following_compatibility
+
+
+def make_films(seed: int) -> dict:
+    """Overlapping, uneven ratings of 40 films, some unrated."""
+    ratings = (None, 0.5, 2.0, 3.5, 4.0, 5.0)
+    return {
+        f"film-{n}": {
+            "id": str(n),
+            "rating": ratings[(n * 7 + seed * seed) % 6],
+            "liked": False,
+        }
+        for n in range(40)
+        if (n + seed) % 3 or n % (seed + 2) == 0
+    }
+
+
+FILMS = {f"user{n}": make_films(n) for n in range(12)}
+
+
+def brute_force(a: dict, b: dict) -> tuple:
+    ra = {m["id"]: m["rating"] for m in a.values() if m["rating"] is not None}
+    rb = {m["id"]: m["rating"] for m in b.values() if m["rating"] is not None}
+    shared = ra.keys() & rb.keys()
+    dot = sum(ra[f] * rb[f] for f in shared)
+    norm = math.sqrt(sum(r * r for r in ra.values()) * sum(r * r for r in rb.values()))
+    x, y = [ra[f] for f in shared], [rb[f] for f in shared]
+    pearson = None
+    if len(shared) > 1:
+        mx, my = sum(x) / len(x), sum(y) / len(y)
+        cov = sum((i - mx) * (j - my) for i, j in zip(x, y, strict=True))
+        var = sum((i - mx) ** 2 for i in x) * sum((j - my) ** 2 for j in y)
+        pearson = cov / math.sqrt(var) if var else None
+    return dot / norm, pearson, len(shared)
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class TestRatingMatrix(unittest.TestCase):
+    def setUp(self):
+        self.matrix = RatingMatrix()
+        self.matrix.add_many(FILMS.items())
+
+    def test_matches_brute_force(self):
+        for result in self.matrix.compare("user0"):
+            cosine, pearson, overlap = brute_force(
+                FILMS["user0"], FILMS[result["username"]]
+            )
+            self.assertAlmostEqual(result["cosine"], cosine, 5)
+            self.assertEqual(result["overlap"], overlap)
+            if pearson is None:
+                self.assertIsNone(result["pearson"])
+            else:
+                self.assertAlmostEqual(result["pearson"], pearson, 5)
+
+    def test_blocks_do_not_change_results(self):
+        ((rows, block),) = self.matrix.iter_blocks()
+        self.assertEqual(len(rows), 12)
+        blocks = list(self.matrix.iter_blocks(max_pairs=200, max_rows=5))
+        self.assertGreater(len(blocks), 2)
+        for ids, small in blocks:
+            for key in ("cosine", "overlap"):
+                self.assertTrue((small[key] == block[key][ids]).all())
+
+    def test_top_neighbours(self):
+        top = self.matrix.top_neighbours(k=3, min_overlap=2)
+        self.assertEqual(len(top), 12)
+        expected = sorted(
+            (
+                (brute_force(FILMS["user3"], FILMS[name])[0], name)
+                for name in FILMS
+                if name != "user3" and brute_force(FILMS["user3"], FILMS[name])[2] >= 2
+            ),
+            reverse=True,
+        )[:3]
+        self.assertEqual(
+            [name for name, _, _ in top["user3"]], [n for _, n in expected]
+        )
+        with self.assertRaises(ValueError):
+            self.matrix.top_neighbours(metric="jaccard")
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            self.matrix.add("user0", {})
+        with self.assertRaises(KeyError):
+            self.matrix.compare("nobody")
+
+    @unittest.skipUnless(importlib.util.find_spec("scipy"), "scipy is not installed")
+    def test_scipy_path(self):
+        sparse = self.matrix.to_scipy()
+        self.assertEqual(sparse.shape, (12, len(self.matrix.films)))
+        self.assertEqual(sparse.nnz, len(self.matrix.csr()[1]))
+
+        numpy_only = RatingMatrix(use_scipy=False)
+        numpy_only.add_many(FILMS.items())
+        with_scipy = RatingMatrix(use_scipy=True)
+        with_scipy.add_many(FILMS.items())
+        self.assertEqual(numpy_only.compare("user4"), with_scipy.compare("user4"))
+
+    def test_following_compatibility(self):
+        with (
+            patch(
+                "letterboxdpy.similarity.extract_network_usernames",
+                return_value=["user1", "user2"],
+            ),
+            patch(
+                "letterboxdpy.similarity.extract_user_films",
+                side_effect=lambda url, as_dicts: {"movies": FILMS[url.split("/")[3]]},
+            ) as crawl,
+        ):
+            results = following_compatibility("user0", {"user2": FILMS["user2"]})
+        self.assertEqual(crawl.call_count, 2)
+        self.assertEqual({r["username"] for r in results}, {"user1", "user2"})
+
+
+if __name__ == "__main__":
+    unittest.main()
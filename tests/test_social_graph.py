@@ -0,0 +1,155 @@
+"""Tests for the follow graph crawler."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from letterboxdpy.social_graph import SeenSet, SocialGraphCrawler
+
+# username -> people they follow
+FOLLOWING = {
+    "ana": ["ben", "cid"],
+    "ben": ["ana", "dan"],
+    "cid": ["dan", "eve"],
+    "dan": ["fay"],
+    "eve": [],
+    "fay": ["ana"],
+}
+
+
+def fake_fetch_usernames(username, section, max_pages=None):
+    if section == "following":
+        return list(FOLLOWING[username])
+    return [name for name, follows in FOLLOWING.items() if username in follows]
+
+
+class TestSeenSet(unittest.TestCase):
+    def test_add_and_contains(self):
+        seen = SeenSet()
+        self.assertTrue(seen.add(3))
+        self.assertFalse(seen.add(3))
+        self.assertTrue(seen.add(1000))
+        self.assertIn(1000, seen)
+        self.assertNotIn(4, seen)
+        self.assertNotIn(10**6, seen)
+        self.assertEqual(len(SeenSet(seen.to_bytes())), 2)
+
+
+class TestSocialGraphCrawler(unittest.TestCase):
+    """Offline tests for SocialGraphCrawler with a fake follow graph."""
+
+    def setUp(self):
+        patcher = patch(
+            "letterboxdpy.social_graph.fetch_usernames",
+            side_effect=fake_fetch_usernames,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_depth_budget(self):
+        crawler = SocialGraphCrawler(["ana"], max_depth=1).run()
+        self.assertEqual(len(crawler.done), 3)  # ana, ben, cid
+        self.assertEqual(
+            sorted(crawler.iter_edges()),
+            [
+                ("ana", "ben"),
+                ("ana", "cid"),
+                ("ben", "ana"),
+                ("ben", "dan"),
+                ("cid", "dan"),
+                ("cid", "eve"),
+            ],
+        )
+
+    def test_node_budget(self):
+        crawler = SocialGraphCrawler(["ana"], max_depth=5, max_nodes=4).run()
+        self.assertEqual(len(crawler.done), 4)
+
+    def test_both_sections_store_each_edge_once(self):
+        crawler = SocialGraphCrawler(
+            ["ana"], sections=("following", "followers"), max_depth=5, max_workers=1
+        ).run()
+        expected = sorted(
+            (name, other) for name, follows in FOLLOWING.items() for other in follows
+        )
+        self.assertEqual(sorted(crawler.iter_edges()), expected)
+
+    def test_adjacency(self):
+        crawler = SocialGraphCrawler(["ana"], max_depth=5).run()
+        offsets, targets = crawler.adjacency()
+        ana = crawler.names.get("ana")
+        followed = crawler.names.names(targets[offsets[ana] : offsets[ana + 1]])
+        self.assertEqual(sorted(followed), ["ben", "cid"])
+
+        offsets, targets = crawler.adjacency(reverse=True)
+        dan = crawler.names.get("dan")
+        followers = crawler.names.names(targets[offsets[dan] : offsets[dan + 1]])
+        self.assertEqual(sorted(followers), ["ben", "cid"])
+
+    def test_priority(self):
+        crawler = SocialGraphCrawler(
+            ["ana"], max_depth=5, max_workers=1, priority=lambda name, depth: name
+        )
+        order = list(crawler.iter_run())
+        self.assertEqual(order, ["ana", "ben", "cid", "dan", "eve", "fay"])
+
+    def test_checkpoint_resume(self):
+        full = SocialGraphCrawler(["ana"], max_depth=5, max_workers=1).run()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "graph")
+            first = SocialGraphCrawler(
+                ["ana"], max_depth=5, max_workers=1, checkpoint=path, max_nodes=2
+            ).run()
+            self.assertEqual(len(first.done), 2)
+
+            resumed = SocialGraphCrawler(
+                ["ana"], max_depth=5, max_workers=1, checkpoint=path
+            ).run()
+            self.assertEqual(len(resumed.done), len(full.done))
+            self.assertEqual(sorted(resumed.iter_edges()), sorted(full.iter_edges()))
+
+    def test_resume_after_interrupted_save(self):
+        full = SocialGraphCrawler(["ana"], max_depth=5, max_workers=1).run()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "graph")
+            SocialGraphCrawler(
+                ["ana"], max_depth=5, max_workers=1, checkpoint=path, max_nodes=2
+            ).run()
+
+            # Crash after the names and edges were appended, before the
+            # state file is replaced.
+            crashed = SocialGraphCrawler(
+                ["ana"], max_depth=5, max_workers=1, checkpoint=path, max_nodes=4
+            )
+            with (
+                patch("letterboxdpy.social_graph.os.replace", side_effect=OSError),
+                self.assertRaises(OSError),
+            ):
+                crashed.run()
+
+            resumed = SocialGraphCrawler(
+                ["ana"], max_depth=5, max_workers=1, checkpoint=path
+            ).run()
+            self.assertEqual(len(resumed.done), len(full.done))
+            self.assertEqual(sorted(resumed.iter_edges()), sorted(full.iter_edges()))
+
+    def test_failed_member_retried_in_same_run(self):
+        failures = {"ben": 1}
+
+        def flaky_fetch(username, section, max_pages=None):
+            if failures.get(username):
+                failures[username] -= 1
+                raise ConnectionError("timeout")
+            return fake_fetch_usernames(username, section, max_pages)
+
+        with patch("letterboxdpy.social_graph.fetch_usernames", flaky_fetch):
+            crawler = SocialGraphCrawler(["ana"], max_depth=5, max_workers=1).run()
+        self.assertEqual(len(crawler.done), len(FOLLOWING))
+        self.assertEqual(crawler.failed, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
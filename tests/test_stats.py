@@ -0,0 +1,113 @@
+"""Tests for the vectorized film and diary statistics."""
+
+import importlib.util
+import unittest
+from datetime import date, timedelta
+
+from letterboxdpy.pages.user_diary import build_user_wrapped
+from letterboxdpy.pages.user_films import calculate_film_statistics
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+if HAS_NUMPY:
+    import numpy as np
+
+    from letterboxdpy import stats
+
+MOVIES = {
+    f"film-{n}": {
+        "id": str(n),
+        "rating": None if n % 4 == 0 else (n % 10 + 1) / 2,
+        "liked": n % 3 == 0,
+    }
+    for n in range(50)
+}
+
+
+def make_diary() -> dict:
+    """A diary entry every 3 days, newest first, from 2024 back into 2022."""
+    entries = {}
+    day = date(2024, 12, 31)
+    for n in range(300):
+        entries[str(n)] = {
+            "date": f"{day.isoformat()}T00:00:00.000000Z",
+            "runtime": None if n % 7 == 0 else 90 + n % 40,
+            "actions": {
+                "rewatched": n % 5 == 0,
+                "rating": None if n % 2 else 3.5,
+                "liked": n % 6 == 0,
+                "reviewed": n % 3 == 0,
+            },
+        }
+        day -= timedelta(days=3)
+    return entries
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class TestStats(unittest.TestCase):
+    def test_film_statistics(self):
+        arrays = stats.film_arrays(MOVIES, catalog={"1": {"rating": 3.25}})
+        self.assertEqual(
+            stats.film_statistics(arrays), calculate_film_statistics(MOVIES)
+        )
+        self.assertEqual(arrays["average"][1], np.float32(3.25))
+        self.assertTrue(np.isnan(arrays["average"][2]))
+        deviations = stats.rating_deviations(arrays["rating"], arrays["average"])
+        self.assertAlmostEqual(float(deviations[1]), 1.0 - 3.25)
+
+    def test_histograms(self):
+        ratings = stats.film_arrays(MOVIES)["rating"]
+        histogram = stats.rating_histogram(ratings)
+        expected = [
+            sum(m["rating"] == rating for m in MOVIES.values())
+            for rating in stats.RATINGS
+        ]
+        self.assertEqual(histogram.tolist(), expected)
+
+        rated = np.sort(ratings[~np.isnan(ratings)])
+        self.assertAlmostEqual(float(stats.histogram_mean(histogram)), rated.mean(), 5)
+        self.assertEqual(
+            stats.histogram_percentiles(histogram, [50, 100]).tolist(),
+            [rated[int(np.ceil(len(rated) / 2)) - 1], 5.0],
+        )
+
+    def test_many_members(self):
+        ratings = np.array([0.5, 5.0, np.nan, 2.5, 2.5], np.float32)
+        owners = np.array([0, 0, 1, 2, 2])
+        histograms = stats.rating_histogram(ratings, owners, n_owners=4)
+        self.assertEqual(histograms.shape, (4, 10))
+        self.assertEqual(histograms[2, 4], 2)
+        self.assertEqual(histograms[1].sum(), 0)
+
+        means = stats.histogram_mean(histograms)
+        self.assertEqual(means[0], 2.75)
+        self.assertTrue(np.isnan(means[3]))
+        self.assertEqual(
+            stats.histogram_percentiles(histograms, [50])[:, 0].tolist()[::2],
+            [0.5, 2.5],
+        )
+
+    def test_diary_matches_wrapped(self):
+        entries = make_diary()
+        arrays = stats.diary_arrays(entries)
+        for year in (2023, 2024):
+            wrapped = build_user_wrapped(entries, year)
+            summary = stats.diary_summary(arrays, year)
+            for key, value in summary.items():
+                self.assertEqual(value, wrapped[key], key)
+
+        periods, counts = stats.timeline(arrays["date"], "Y")
+        self.assertEqual(periods.astype(int).tolist(), [52, 53, 54])
+        self.assertEqual(counts.sum(), len(entries))
+
+    def test_rolling_mean(self):
+        values = np.array([1, np.nan, 3, np.nan, np.nan, 5])
+        self.assertEqual(
+            np.nan_to_num(stats.rolling_mean(values, 2), nan=-1).tolist(),
+            [1, 1, 3, 3, -1, 5],
+        )
+        with self.assertRaises(ValueError):
+            stats.rolling_mean(values, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
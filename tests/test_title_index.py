@@ -0,0 +1,108 @@
+"""Tests for TitleIndex and resolve_titles."""
+
+import unittest
+from unittest.mock import patch
+
+from letterboxdpy.core.exceptions import PageLoadError
+from letterboxdpy.search import Search, resolve_titles
+from letterboxdpy.utils.title_index import TitleIndex
+from letterboxdpy.utils.utils_string import normalize_title
+
+FILMS = [
+    {"slug": "the-matrix", "name": "The Matrix", "year": 1999},
+    {"slug": "amelie", "name": "Amélie", "year": 2001},
+    {"slug": "dune-2021", "name": "Dune", "year": 2021},
+    {"slug": "dune", "name": "Dune", "year": 1984},
+]
+
+
+class TestTitleIndex(unittest.TestCase):
+    """Offline tests for title normalization and matching."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.index = TitleIndex(FILMS)
+
+    def test_normalize_title(self):
+        self.assertEqual(normalize_title("The Matrix"), "matrix")
+        self.assertEqual(normalize_title("AMELIE!"), normalize_title("Amélie"))
+
+    def test_exact_match_uses_year(self):
+        self.assertEqual(self.index.match("Dune", 1984)["slug"], "dune")
+        self.assertEqual(self.index.match("Dune (2021)")["slug"], "dune-2021")
+        self.assertEqual(self.index.match("the matrix", 1999)["score"], 1.0)
+
+    def test_fuzzy_match(self):
+        match = self.index.match("The Matrx", 1999)
+        self.assertEqual(match["slug"], "the-matrix")
+        self.assertLess(match["score"], 1.0)
+        self.assertIsNone(self.index.match("The Matrix", 2021))
+        self.assertIsNone(self.index.match("Paddington", min_score=0.5))
+
+    def test_fuzzy_match_prefers_similar_title_over_long_ones(self):
+        films = [
+            {"slug": f"aliens-planet-{n}", "name": f"Aliens From Planet {n}"}
+            for n in range(60)
+        ]
+        index = TitleIndex([*films, {"slug": "alien", "name": "Alien"}])
+        self.assertEqual(index.match("Aliens")["slug"], "alien")
+
+
+def fake_get_results(self, num_results=Search.DEFAULT_NUM_RESULTS):
+    items = [
+        {"type": "film", "slug": "paddington", "title": "Paddington", "year": 2014}
+    ]
+    return self.build_results(items)
+
+
+class TestResolveTitles(unittest.TestCase):
+    """Offline tests for resolve_titles with a stubbed search."""
+
+    def test_index_first_then_search(self):
+        rows = [
+            "The Matrix (1999)",
+            ("Paddington", "2014"),
+            {"title": "Dune", "year": 1984},
+        ]
+        with patch.object(
+            Search, "get_results", autospec=True, side_effect=fake_get_results
+        ) as get_results:
+            resolved = resolve_titles(rows, TitleIndex(FILMS))
+
+        self.assertEqual(get_results.call_count, 1)
+        self.assertEqual(
+            [(row["slug"], row["source"]) for row in resolved],
+            [("the-matrix", "index"), ("paddington", "search"), ("dune", "index")],
+        )
+        self.assertEqual(resolved[1]["year"], 2014)
+
+    def test_search_results_need_min_score(self):
+        with patch.object(
+            Search, "get_results", autospec=True, side_effect=fake_get_results
+        ):
+            (row,) = resolve_titles(["Paddington Bear Adventures"])
+            (loose,) = resolve_titles(["Paddington Bear Adventures"], min_score=0.3)
+        self.assertIsNone(row["slug"])
+        self.assertEqual(loose["slug"], "paddington")
+
+    def test_failed_search_leaves_title_unresolved(self):
+        def get_results(search, num_results=Search.DEFAULT_NUM_RESULTS):
+            if search.query == "Broken":
+                raise PageLoadError(search.url, "Network error")
+            return fake_get_results(search, num_results)
+
+        rows = [("Broken", "n/a"), "Paddington (2014)"]
+        with patch.object(
+            Search, "get_results", autospec=True, side_effect=get_results
+        ):
+            broken, paddington = resolve_titles(rows)
+
+        self.assertEqual((broken["slug"], broken["year"]), (None, None))
+        self.assertIsNone(broken["source"])
+        self.assertIn("Network error", broken["error"])
+        self.assertEqual(paddington["slug"], "paddington")
+        self.assertIsNone(paddington["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Tests for User.prefetch collection planning."""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from letterboxdpy.constants.project import CURRENT_YEAR
+from letterboxdpy.pages.user_diary import UserDiary
+from letterboxdpy.pages.user_watchlist import UserWatchlist
+from letterboxdpy.user import User
+
+DIARY = {
+    "entries": {
+        "2": {
+            "runtime": 100,
+            "actions": {"reviewed": True},
+            "date": f"{CURRENT_YEAR}-03-02",
+        },
+        "1": {
+            "runtime": 90,
+            "actions": {"reviewed": False},
+            "date": f"{CURRENT_YEAR - 1}-12-31",
+        },
+    },
+    "count": 2,
+    "last_page": 1,
+}
+
+
+def offline_user(username: str) -> User:
+    """A User without the profile requests made by __init__."""
+    user = User.__new__(User)
+    user.username = username
+    user.pages = SimpleNamespace(diary=UserDiary(username))
+    return user
+
+
+class TestUserPrefetch(unittest.TestCase):
+    def test_wrapped_is_derived_from_the_diary(self):
+        user = offline_user("ana")
+        with (
+            patch(
+                "letterboxdpy.pages.user_diary.extract_user_diary", return_value=DIARY
+            ) as extract_diary,
+            patch("letterboxdpy.pages.user_diary.extract_user_wrapped") as wrapped,
+        ):
+            results = user.prefetch(["wrapped"])
+
+        self.assertEqual(set(results), {"diary", "wrapped"})
+        self.assertEqual(results["wrapped"]["logged"], 1)
+        extract_diary.assert_called_once()
+        wrapped.assert_not_called()
+
+    def test_watchlist_is_crawled_once(self):
+        user = offline_user("ana")
+        user.pages.watchlist = UserWatchlist("ana")
+        user.pages.watchlist.dom = None
+        watchlist = {"count": 1, "data": {"7": {"slug": "alien", "page": 1, "no": 1}}}
+        with patch(
+            "letterboxdpy.pages.user_watchlist.extract_watchlist",
+            return_value=watchlist,
+        ) as extract_watchlist:
+            results = user.prefetch(["watchlist", "watchlist_movies"])
+
+        extract_watchlist.assert_called_once()
+        self.assertEqual(results["watchlist"], watchlist)
+        self.assertEqual(results["watchlist_movies"], {"7": {"slug": "alien"}})
+
+    def test_unknown_collection(self):
+        with self.assertRaises(ValueError):
+            offline_user("ana").prefetch(["nope"])
+
+    def test_filtered_diary_is_not_cached(self):
+        diary = UserDiary("ana")
+        with patch(
+            "letterboxdpy.pages.user_diary.extract_user_diary", return_value=DIARY
+        ) as extract_diary:
+            diary.get_diary()
+            diary.get_diary()
+            diary.get_diary(year=2024)
+        self.assertEqual(extract_diary.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
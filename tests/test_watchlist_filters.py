@@ -0,0 +1,125 @@
+"""Tests for in-memory watchlist filtering against the server-filtered path."""
+
+import unittest
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from letterboxdpy.pages.user_watchlist import CachedWatchlist, extract_watchlist
+
+GENRES = ["action", "drama", "horror"]
+
+# 70 films, newest first, spread over years and genres.
+FILMS = [
+    {
+        "id": str(1000 + n),
+        "slug": f"film-{n}",
+        "year": 1975 + n % 40,
+        "genres": {GENRES[n % 3], GENRES[n % 2]},
+    }
+    for n in range(70)
+]
+CATALOG = {
+    film["id"]: {"facets": [f"genre:{genre}" for genre in film["genres"]]}
+    for film in FILMS
+}
+# The catalog above was swept completely for every genre.
+COMPLETE = {f"genre:{genre}" for genre in GENRES}
+
+
+def film_matches(film: dict, path: list[str]) -> bool:
+    for key, values in zip(path[::2], path[1::2], strict=True):
+        for value in values.split("+"):
+            wanted = not value.startswith("-")
+            value = value.lstrip("-")
+            if key == "genre":
+                present = value in film["genres"]
+            elif key == "decade":
+                present = film["year"] // 10 * 10 == int(value.removesuffix("s"))
+            else:
+                present = film["year"] == int(value)
+            if present != wanted:
+                return False
+    return True
+
+
+def fake_watchlist_page(url: str) -> BeautifulSoup:
+    """Serves filtered watchlist pages, 28 films each."""
+    path = url.split("/watchlist/")[1].strip("/").split("/")
+    page = int(path[-1])
+    films = [film for film in FILMS if film_matches(film, path[:-2])]
+    items = "".join(
+        f'<li class="griditem"><div class="react-component" data-film-id="{film["id"]}"'
+        f' data-item-slug="{film["slug"]}" data-item-name="Film ({film["year"]})">'
+        "</div></li>"
+        for film in films[(page - 1) * 28 : page * 28]
+    )
+    return BeautifulSoup(f"<ul>{items}</ul>", "lxml")
+
+
+class TestCachedWatchlist(unittest.TestCase):
+    """CachedWatchlist must match extract_watchlist for the same filters."""
+
+    FILTERS = (
+        None,
+        {"genre": "horror"},
+        {"genre": ["action", "-drama"]},
+        {"decade": "1990s", "genre": ["-horror"]},
+        {"year": "1999"},
+        {"genre": ["drama"], "decade": "1980s"},
+    )
+
+    def test_matches_server_filtered_results(self):
+        with patch("letterboxdpy.pages.user_watchlist.parse_url", fake_watchlist_page):
+            cached = CachedWatchlist("nmcassa", CATALOG, complete=COMPLETE)
+            for filters in self.FILTERS:
+                with self.subTest(filters=filters):
+                    expected = extract_watchlist("nmcassa", filters)
+                    self.assertEqual(cached.get_watchlist(filters), expected)
+        self.assertEqual(cached.uncatalogued, [])
+
+    def test_incomplete_facets_go_to_the_server(self):
+        # Film 0 (action only) is missing and the horror sweep was capped.
+        horror = [film["id"] for film in FILMS if "horror" in film["genres"]]
+        catalog = {
+            movie_id: {
+                "facets": [
+                    facet
+                    for facet in data["facets"]
+                    if facet != "genre:horror" or movie_id in horror[:10]
+                ]
+            }
+            for movie_id, data in CATALOG.items()
+            if movie_id != FILMS[0]["id"]
+        }
+        with patch(
+            "letterboxdpy.pages.user_watchlist.parse_url",
+            side_effect=fake_watchlist_page,
+        ) as parse_url:
+            cached = CachedWatchlist("nmcassa", catalog, complete={"genre:drama"})
+            self.assertEqual(cached.uncatalogued, [FILMS[0]["id"]])
+            for filters in ({"genre": "-drama"}, {"genre": "horror"}, {"year": 1999}):
+                with self.subTest(filters=filters):
+                    expected = extract_watchlist("nmcassa", filters)
+                    self.assertEqual(cached.get_watchlist(filters), expected)
+
+            # Trusting the capped horror facet would lose films.
+            trusting = CachedWatchlist(
+                "nmcassa", catalog, cached.watchlist, complete={"genre:horror"}
+            )
+            self.assertNotEqual(
+                trusting.get_watchlist({"genre": "horror"})["count"],
+                expected_horror := len(horror),
+            )
+            self.assertEqual(
+                cached.get_watchlist({"genre": "horror"})["count"], expected_horror
+            )
+
+        # The capped horror filter went to the server, -drama stayed in memory.
+        urls = [call.args[0] for call in parse_url.call_args_list]
+        self.assertEqual(len([url for url in urls if "/genre/-drama/" in url]), 1)
+        self.assertEqual(len([url for url in urls if "/genre/horror/" in url]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""Tests for the watchlist inverted index."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from letterboxdpy.watchlist_index import WatchlistIndex, iter_bits
+
+WATCHLISTS = {
+    f"user{n}": {f"film{f}" for f in range(30) if (f * (n + 1)) % 7 < 3 + n % 3}
+    for n in range(8)
+}
+
+
+def brute_force_popularity(among: list[str]) -> dict:
+    counts = {}
+    for username in among:
+        for film in WATCHLISTS[username]:
+            counts[film] = counts.get(film, 0) + 1
+    return counts
+
+
+class TestWatchlistIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = WatchlistIndex()
+        for username, films in WATCHLISTS.items():
+            self.index.set_watchlist(username, films)
+
+    def test_iter_bits(self):
+        self.assertEqual(list(iter_bits(0b100101)), [0, 2, 5])
+        self.assertEqual(list(iter_bits(0)), [])
+
+    def test_popularity(self):
+        cohort = ["user1", "user3", "user4"]
+        counts = brute_force_popularity(cohort)
+        for film, count in counts.items():
+            self.assertEqual(self.index.popularity(film, cohort), count)
+            self.assertEqual(
+                self.index.wanted_by(film, cohort),
+                [u for u in cohort if film in WATCHLISTS[u]],
+            )
+        top = self.index.popular(k=5, among=cohort)
+        self.assertEqual(
+            [count for _, count in top], sorted(counts.values(), reverse=True)[:5]
+        )
+        self.assertEqual(self.index.popularity("unknown"), 0)
+
+    def test_overlaps(self):
+        overlaps = self.index.overlaps("user0")
+        self.assertEqual(len(overlaps), 7)
+        for username, shared in overlaps.items():
+            self.assertEqual(shared, len(WATCHLISTS["user0"] & WATCHLISTS[username]))
+        pairs = self.index.pairwise_overlaps(["user2", "user5", "user6"])
+        for (a, b), shared in pairs.items():
+            self.assertEqual(shared, self.index.overlap(a, b))
+            self.assertEqual(len(self.index.shared_films(a, b)), shared)
+
+    def test_top_shared(self):
+        following = ["user1", "user2", "user3"]
+        top = self.index.top_shared("user0", among=following)
+        self.assertEqual(
+            {film: count for film, count, _ in top},
+            {
+                film: count
+                for film, count in brute_force_popularity(following).items()
+                if film in WATCHLISTS["user0"]
+            },
+        )
+        counts = [count for _, count, _ in top]
+        self.assertEqual(counts, sorted(counts, reverse=True))
+        self.assertEqual(self.index.top_shared("user0", k=2, among=following), top[:2])
+
+    def test_incremental_update(self):
+        films = set(WATCHLISTS["user2"])
+        removed, added = films.pop(), "film99"
+        self.assertEqual(
+            self.index.set_watchlist("user2", films | {added}),
+            {"added": 1, "removed": 1},
+        )
+        self.assertNotIn("user2", self.index.wanted_by(removed))
+        self.assertEqual(self.index.wanted_by(added), ["user2"])
+
+        self.index.remove_member("user2")
+        self.assertNotIn("user2", self.index)
+        self.assertEqual(self.index.popularity(added), 0)
+        self.assertEqual(len(self.index), 7)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "index")
+            self.index.save(path)
+            loaded = WatchlistIndex(path)
+        self.assertEqual(loaded.watchlist("user4"), WATCHLISTS["user4"])
+        self.assertEqual(loaded.overlaps("user0"), self.index.overlaps("user0"))
+        with self.assertRaises(ValueError):
+            WatchlistIndex().save()
+
+    def test_crawl(self):
+        def fetch(username):
+            if username == "private":
+                raise ValueError("private")
+            return list(WATCHLISTS[username])
+
+        index = WatchlistIndex()
+        with patch(
+            "letterboxdpy.watchlist_index.fetch_watchlist_ids", side_effect=fetch
+        ):
+            errors = index.crawl(["user0", "private", "user1"])
+        self.assertEqual(list(errors), ["private"])
+        self.assertEqual(len(index), 2)
+        self.assertEqual(
+            index.overlap("user0", "user1"), self.index.overlap("user0", "user1")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
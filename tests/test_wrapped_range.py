@@ -0,0 +1,142 @@
+"""Tests for building several years of wrapped stats from one diary crawl."""
+
+import unittest
+import warnings
+from dataclasses import replace
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from letterboxdpy.core.models import DiaryEntry
+from letterboxdpy.pages import user_diary
+from letterboxdpy.pages.user_diary import (
+    UserDiary,
+    extract_user_wrapped,
+    extract_user_wrapped_range,
+)
+
+DIARY_URL = "https://letterboxd.com/user/films/diary/"
+
+
+def make_entries() -> list[tuple[str, DiaryEntry]]:
+    """Fake diary entries, newest first: a film every 5 days from 2024 back to 2019."""
+    entries = []
+    day = date(2024, 12, 30)
+    no = 0
+    while day.year >= 2019:
+        no += 1
+        entry = DiaryEntry(
+            f"Film {no}",
+            f"film-{no}",
+            str(no),
+            day.year,
+            90 + no % 30,
+            False,
+            None,
+            False,
+            no % 3 == 0,
+            day.isoformat(),
+            "",
+            0,
+        )
+        entries.append((str(no), entry))
+        day -= timedelta(days=5)
+    return entries
+
+
+def paginate(entries: list, base_url: str, per_page: int = 50) -> list[dict]:
+    """Splits entries into pages, setting each entry's page like the crawler."""
+    pages = []
+    for start in range(0, len(entries), per_page):
+        page_no = len(pages) + 1
+        page_url = f"{base_url}page/{page_no}/"
+        page = {}
+        for log_id, entry in entries[start : start + per_page]:
+            page[log_id] = replace(entry, page_url=page_url, page_no=page_no)
+        pages.append(page)
+    return pages
+
+
+class TestWrappedRange(unittest.TestCase):
+    """Offline tests for extract_user_wrapped_range."""
+
+    def setUp(self):
+        self.entries = make_entries()
+        self.fetched = []
+
+        def fake_iter_user_diary(
+            username,
+            year=None,
+            month=None,
+            day=None,
+            page=None,
+            fetch_runtime=False,
+            max_workers=None,
+            as_dicts=True,
+        ):
+            if year:
+                entries = [(i, e) for i, e in self.entries if e.date[:4] == str(year)]
+                pages = paginate(entries, f"{DIARY_URL}for/{year}/")
+            else:
+                pages = paginate(self.entries, DIARY_URL)
+            for no, entries in enumerate(pages, start=1):
+                self.fetched.append(no)
+                if fetch_runtime:
+                    user_diary._fetch_missing_runtimes(entries, max_workers)
+                if as_dicts:
+                    entries = {i: entry.to_dict() for i, entry in entries.items()}
+                yield no, entries
+
+        patcher = patch.object(
+            user_diary, "iter_user_diary", side_effect=fake_iter_user_diary
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_matches_per_year_wrapped(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            wrapped = extract_user_wrapped_range("user", 2020, 2024)
+            for year in range(2020, 2025):
+                self.assertEqual(wrapped[year], extract_user_wrapped("user", year))
+
+        self.assertEqual(list(wrapped), [2020, 2021, 2022, 2023, 2024])
+        self.assertEqual(wrapped[2023]["logged"], 73)
+        self.assertEqual(set(wrapped[2023]["milestones"]), {50})
+        self.assertEqual(
+            wrapped[2023]["movies"]["124"]["page"],
+            {"url": f"{DIARY_URL}for/2023/page/2/", "no": 2},
+        )
+
+    def test_runtimes_fetched_in_range_only(self):
+        for _, entry in self.entries:
+            entry.runtime = None
+        with patch.object(user_diary, "_get_runtime", return_value=100) as runtime:
+            wrapped = extract_user_wrapped_range("user", 2022, 2023, True)
+        years = {entry.slug: entry.date[:4] for _, entry in self.entries}
+        looked_up = [call.args[0] for call in runtime.call_args_list]
+        self.assertEqual({years[slug] for slug in looked_up}, {"2022", "2023"})
+        self.assertEqual(len(looked_up), 146)
+        self.assertEqual(wrapped[2022]["total_runtime"], 7300)
+
+    def test_crawled_diary_matches_per_year_wrapped(self):
+        diary = UserDiary("user")
+        diary.get_diary()
+        self.assertEqual(
+            diary.get_wrapped_range(2022, 2024),
+            extract_user_wrapped_range("user", 2022, 2024),
+        )
+        self.assertEqual(diary.get_wrapped(2023), extract_user_wrapped("user", 2023))
+
+    def test_stops_before_start(self):
+        wrapped = extract_user_wrapped_range("user", 2023, 2024)
+        self.assertEqual(wrapped[2023]["logged"], 73)
+        # The third page reaches back into 2022, so the crawl stops there.
+        self.assertEqual(self.fetched, [1, 2, 3])
+
+    def test_invalid_range(self):
+        with self.assertRaises(ValueError):
+            extract_user_wrapped_range("user", 2024, 2020)
+
+
+if __name__ == "__main__":
+    unittest.main()